@@ -107,7 +107,7 @@ class WorkFeatureWorkbench(Workbench):
             import WF_centerFacePoint
             import WF_projectedPoint
             # import WF_pointFacePoint
-            # import WF_lineFacePoint
+            import WF_lineFacePoint
 
             import WF_twoPointsLine
             import WF_nPointsLine
@@ -130,6 +130,7 @@ class WorkFeatureWorkbench(Workbench):
                                       "ShowHideInteractive",
                                       "ShowHideNo",
                                       "Refresh",
+                                      "Profiler",
                                       ]
         self.appendCommandbar("General", self.General_commands_list)
         self.appendMenu(self.General_menu, self.General_commands_list)
@@ -145,7 +146,7 @@ class WorkFeatureWorkbench(Workbench):
                                     # "CenterCirclePoint",
                                     "CenterFacePoint",
                                     # "PointFacePoint",
-                                    # "LineFacePoint",
+                                    "LineFacePoint",
                                     "ProjectedPoint"
                                     ]
         self.appendCommandbar("Points", self.Point_commands_list)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Bulk creation of WF features.
+
+All the features built by a command are created into one transaction,
+computed once each (one execute, whatever the number of properties set)
+and the document is recomputed once at the end.
+
+    with bulkBuild(M_MACRO) as builder:
+        builder.build(makeCenterLinePointFeature, group,
+                      Edge=edge, IndexPart=1)
+
+When the command already computed the results of all its features at
+once, they are given to build and written without running compute.
+"""
+from contextlib import contextmanager
+import FreeCAD as App
+import WF
+from WF_print import print_msg
+import WF_Objects_base
+
+###############
+M_DEBUG = False
+###############
+
+
+class BulkBuilder():
+    """ Create features into the transaction opened by bulkBuild.
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.features = []
+        WF_Objects_base.resetExecuteCount()
+
+    def build(self, make_feature, group, result=None, **properties):
+        """ Create a feature and compute it once.
+
+        Return
+        -------
+        The new feature or None if not created.
+
+        Parameters
+        -------
+        *make_feature* : (Function, Mandatory)
+                         make_feature(group) creates the feature
+        *group* : (Group, Mandatory)
+        *result* : (Tuple, Optional, default=None)
+                   (shape, points) already computed by the command, as
+                   given by the compute of the feature. Written instead
+                   of running compute.
+        *properties* : values of the feature properties, set in the given
+                       order before the execute.
+        """
+        selfobj = make_feature(group)
+        if selfobj is None:
+            return None
+        m_proxy = selfobj.Proxy
+        with m_proxy.singleExecute(selfobj):
+            with m_proxy.bulkUpdate(selfobj):
+                for m_prop, m_value in properties.items():
+                    setattr(selfobj, m_prop, m_value)
+            if result is not None:
+                # The execute on exit finds the inputs memorized
+                m_proxy.applyResult(selfobj, result,
+                                    m_proxy.fingerprint(selfobj))
+        # Already up to date : nothing to do at the document recompute
+        selfobj.purgeTouched()
+        self.features.append(selfobj)
+        return selfobj
+
+    def executesPerFeature(self):
+        """ Return the number of execute run by feature since the start
+        of the bulk build.
+        """
+        if not self.features:
+            return 0.0
+        m_run, m_delayed = WF_Objects_base.getExecuteCount()
+        return float(m_run) / len(self.features)
+
+
+@contextmanager
+def bulkBuild(macro):
+    """ Context giving a BulkBuilder : one transaction named macro for all
+    the features built, then one recompute of the document.
+    """
+    m_doc = App.ActiveDocument
+    m_doc.openTransaction(macro)
+    m_builder = BulkBuilder(m_doc)
+    try:
+        yield m_builder
+    finally:
+        m_doc.commitTransaction()
+        m_doc.recompute()
+        if WF.verbose():
+            m_run, m_delayed = WF_Objects_base.getExecuteCount()
+            print_msg(str(len(m_builder.features)) + " feature(s) built, " +
+                      str(m_run) + " execute(s) run, " +
+                      str(m_delayed) + " delayed")
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+import FreeCAD as App
+import WF
+from WF_print import print_msg
+from WF_utils import shapeVersion, isSameVersion, subShape
+import WF_kernels as kernels
+
+###############
+M_DEBUG = False
+###############
+# The shape version is the Shape itself (see shapeVersion), so a cached
+# entry keeps its Shape alive and is checked with isSameVersion.
+# Entries are dropped when the object is recomputed or deleted and when
+# its document is closed (see CacheObserver).
+# Bounding boxes of source objects (or of their sub elements)
+# {(document name, object name): (shape version, {sub element name: box})}
+# box is a numpy array (xmin, ymin, zmin, xmax, ymax, zmax)
+M_BOUNDBOXES = {}
+# Topology arrays of parent objects, shared by all the features using them
+# {(document name, object name): (shape version, {type: sub shapes})}
+# type is "Vertex", "Edge" or "Face"
+M_TOPOLOGY = {}
+M_OBSERVER = None
+M_TOPOLOGY_ATTRIBUTES = {"Vertex": "Vertexes",
+                         "Edge": "Edges",
+                         "Face": "Faces",
+                         }
+###############
+
+
+class CacheObserver():
+    """ Document observer dropping the cached data of recomputed or
+    deleted objects and of closed documents.
+    """
+
+    def slotRecomputedObject(self, obj):
+        clearObject(obj)
+
+    def slotDeletedObject(self, obj):
+        clearObject(obj)
+
+    def slotDeletedDocument(self, doc):
+        for m_cache in (M_BOUNDBOXES, M_TOPOLOGY):
+            for m_key in [m_key for m_key in m_cache if m_key[0] == doc.Name]:
+                del m_cache[m_key]
+
+
+def installObserver():
+    """ Add (once) the document observer of the caches.
+    """
+    global M_OBSERVER
+    if M_OBSERVER is None:
+        M_OBSERVER = CacheObserver()
+        App.addDocumentObserver(M_OBSERVER)
+
+
+def clearObject(obj):
+    """ Clear the cached boxes and topology lists of obj.
+    """
+    try:
+        m_key = (obj.Document.Name, obj.Name)
+    except Exception:
+        # Object being deleted
+        return
+    M_BOUNDBOXES.pop(m_key, None)
+    M_TOPOLOGY.pop(m_key, None)
+
+
+def boxFromBoundBox(bound_box):
+    """ Return a box (xmin, ymin, zmin, xmax, ymax, zmax) as numpy array
+    from a FreeCAD BoundBox.
+    """
+    import numpy as np
+    return np.array((bound_box.XMin, bound_box.YMin, bound_box.ZMin,
+                     bound_box.XMax, bound_box.YMax, bound_box.ZMax),
+                    dtype=np.float64)
+
+
+def getBoundBox(obj, sub=""):
+    """ Return the box (xmin, ymin, zmin, xmax, ymax, zmax) as numpy array
+    of the Shape of obj or of one of its sub element.
+
+    The box is computed once and kept until the Shape of obj changes.
+
+    Return
+    -------
+    A numpy array of shape (6,) or None if obj has no Shape.
+
+    Parameters
+    -------
+    *obj* : (Object with a Shape, Mandatory)
+    *sub* : (String, Optional, default="")
+            sub element name like "Face1", "Edge3"...
+            if empty the box of the whole Shape is returned.
+    """
+    m_version = shapeVersion(obj)
+    if m_version is None:
+        return None
+
+    m_key = (obj.Document.Name, obj.Name)
+    m_cached = M_BOUNDBOXES.get(m_key)
+    if m_cached is None or not isSameVersion(m_cached[0], m_version):
+        installObserver()
+        m_cached = (m_version, {})
+        M_BOUNDBOXES[m_key] = m_cached
+    try:
+        return m_cached[1][str(sub)]
+    except KeyError:
+        pass
+
+    if M_DEBUG:
+        print_msg("WF_cache : new box for " + str(m_key) + " " + str(sub))
+    if sub:
+        m_shape = m_version.getElement(str(sub))
+    else:
+        m_shape = m_version
+    m_box = boxFromBoundBox(m_shape.BoundBox)
+    m_cached[1][str(sub)] = m_box
+    return m_box
+
+
+def getBoundBoxes(links):
+    """ Return the boxes of several [obj, sub] links at once.
+
+    Return
+    -------
+    A numpy array of shape (N, 6).
+    """
+    import numpy as np
+    m_boxes = [getBoundBox(m_link[0], m_link[1]) for m_link in links]
+    return np.array(m_boxes, dtype=np.float64).reshape(-1, 6)
+
+
+def clearBoundBoxes(obj=None):
+    """ Clear the cached boxes of obj or all cached boxes if obj is None.
+    """
+    if obj is None:
+        M_BOUNDBOXES.clear()
+        return
+    M_BOUNDBOXES.pop((obj.Document.Name, obj.Name), None)
+
+
+def getTopology(obj, sub_type):
+    """ Return the list of the sub elements of type sub_type
+    ("Vertex", "Edge" or "Face") of the Shape of obj.
+
+    The list is extracted once and kept until the Shape of obj changes,
+    so all the features referencing the same parent share it.
+
+    Return
+    -------
+    A list of shapes or None if obj has no Shape.
+    """
+    m_version = shapeVersion(obj)
+    if m_version is None:
+        return None
+
+    m_key = (obj.Document.Name, obj.Name)
+    m_cached = M_TOPOLOGY.get(m_key)
+    if m_cached is None or not isSameVersion(m_cached[0], m_version):
+        installObserver()
+        m_cached = (m_version, {})
+        M_TOPOLOGY[m_key] = m_cached
+    try:
+        return m_cached[1][sub_type]
+    except KeyError:
+        pass
+
+    if M_DEBUG:
+        print_msg("WF_cache : new " + str(sub_type) + " list for " + str(m_key))
+    m_shapes = getattr(m_cached[0], M_TOPOLOGY_ATTRIBUTES[sub_type])
+    m_cached[1][sub_type] = m_shapes
+    return m_shapes
+
+
+def getSubShape(obj, sub_type, index):
+    """ Return the sub element of type sub_type and index (from 1)
+    of the Shape of obj, using the shared topology lists.
+    The whole Shape if sub_type is "".
+    """
+    if sub_type in M_TOPOLOGY_ATTRIBUTES:
+        return getTopology(obj, sub_type)[index - 1]
+    return subShape(obj.Shape, sub_type, index)
+
+
+def clearTopology(obj=None):
+    """ Clear the topology lists of obj or all lists if obj is None.
+    """
+    if obj is None:
+        M_TOPOLOGY.clear()
+        return
+    M_TOPOLOGY.pop((obj.Document.Name, obj.Name), None)
+
+
+def overlapBoxes(boxes_a, boxes_b):
+    """ Return for each (box_a, box_b) couple if the 2 boxes overlap
+    (within WF tolerance).
+
+    Return
+    -------
+    A numpy boolean array of shape (N, M).
+
+    Parameters
+    -------
+    *boxes_a* : (Array like of shape (N, 6), Mandatory)
+    *boxes_b* : (Array like of shape (M, 6), Mandatory)
+    """
+    return kernels.overlapBoxes(boxes_a, boxes_b, WF.tolerance())
+
+
+def boxSize(box):
+    """ Return the largest dimension of the box.
+    """
+    return float(max(box[3] - box[0], box[4] - box[1], box[5] - box[2]))
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
+import re
 import FreeCAD as App
 import WF
 from WF_print import printError_msg, print_msg
+import WF_kernels as kernels
+from WF_cache import getSubShape
 if App.GuiUp:
     import FreeCADGui as Gui
 
@@ -21,77 +24,215 @@ def init_min_max():
     return min_val, max_val
 
 
-def isColinearVectors(vect_a, vect_b, vect_c):
-    """ Return true if the 3 points are aligned.
+def vectorsToArray(vectors):
+    """ Return a list of Vectors as numpy array of shape (N, 3).
     """
-    Vector_1 = vect_b - vect_a
-    Vector_2 = vect_c - vect_b
-    Vector_3 = Vector_1.cross(Vector_2)
-    m_tolerance = WF.tolerance()
+    import numpy as np
+    if isinstance(vectors, np.ndarray):
+        return kernels.asPoints(vectors)
+    return np.array([(m_vect[0], m_vect[1], m_vect[2]) for m_vect in vectors],
+                    dtype=np.float64).reshape(-1, 3)
 
-    if abs(Vector_3.x) <= m_tolerance and abs(
-            Vector_3.y) <= m_tolerance and abs(Vector_3.z) <= m_tolerance:
-        return True
 
-    return False
+def arrayToVector(point):
+    """ Return a numpy point of shape (3,) as Vector.
+    None if point is None or NaN.
+    """
+    if point is None:
+        return None
+    m_x, m_y, m_z = point
+    if m_x != m_x or m_y != m_y or m_z != m_z:
+        return None
+    return App.Vector(float(m_x), float(m_y), float(m_z))
+
+
+def arrayToVectors(points):
+    """ Return a numpy array of shape (N, 3) as list of Vectors.
+    NaN points are returned as None.
+    """
+    return [arrayToVector(m_point) for m_point in points]
 
 
-def isEqualVectors(vect_a, vect_b):
+def isColinearVectors(vect_a, vect_b, vect_c, tolerance=None):
+    """ Return true if the 3 points are aligned.
+    If tolerance is None the WF tolerance is used.
+    """
+    m_tolerance = WF.tolerance() if tolerance is None else tolerance
+    return bool(kernels.isColinearPoints([tuple(vect_a)],
+                                         [tuple(vect_b)],
+                                         [tuple(vect_c)],
+                                         m_tolerance)[0])
+
+
+def isEqualVectors(vect_a, vect_b, tolerance=None):
     """ Return true if the 2 points are equal.
+    If tolerance is None the WF tolerance is used.
+    """
+    m_tolerance = WF.tolerance() if tolerance is None else tolerance
+    return bool(kernels.isEqualPoints([tuple(vect_a)],
+                                      [tuple(vect_b)],
+                                      m_tolerance)[0])
+
+
+def areEqualVectors(vects_a, vects_b):
+    """ Return for each couple (vects_a[i], vects_b[i]) if the 2 points
+    are equal, with the WF tolerance.
+
+    RETURN:
+    -------
+    A numpy boolean array of shape (N,)
+    PARAMETERS:
+    -----------
+    vects_a : (List of Vector or Array like of shape (N, 3), Mandatory)
+    vects_b : (List of Vector or Array like of shape (N, 3), Mandatory)
+    """
+    return kernels.isEqualPoints(vectorsToArray(vects_a),
+                                 vectorsToArray(vects_b),
+                                 WF.tolerance())
+
+
+def areColinearVectors(vects_a, vects_b, vects_c):
+    """ Return for each triple (vects_a[i], vects_b[i], vects_c[i])
+    if the 3 points are aligned, with the WF tolerance.
+
+    RETURN:
+    -------
+    A numpy boolean array of shape (N,)
+    """
+    return kernels.isColinearPoints(vectorsToArray(vects_a),
+                                    vectorsToArray(vects_b),
+                                    vectorsToArray(vects_c),
+                                    WF.tolerance())
+
+
+def areDegeneratedTriples(vects_a, vects_b, vects_c):
+    """ Return for each triple (vects_a[i], vects_b[i], vects_c[i])
+    if 2 of the points are equal or if the 3 points are aligned,
+    with the WF tolerance.
+
+    RETURN:
+    -------
+    A numpy boolean array of shape (N,)
+    """
+    return kernels.isDegeneratedTriples(vectorsToArray(vects_a),
+                                        vectorsToArray(vects_b),
+                                        vectorsToArray(vects_c),
+                                        WF.tolerance())
+
+
+def filterEqualCouples(vertexes_list):
+    """ Return the couples of points links with different points.
+
+    PARAMETERS:
+    -----------
+    vertexes_list : (List, Mandatory)
+                    list of couples ([obj, "VertexN"], [obj, "VertexM"]).
+    """
+    m_points1 = []
+    m_points2 = []
+    for vertex1, vertex2 in vertexes_list:
+        m_n1 = re.sub('[^0-9]', '', vertex1[1])
+        m_n2 = re.sub('[^0-9]', '', vertex2[1])
+        m_points1.append(getSubShape(vertex1[0], "Vertex", int(m_n1)).Point)
+        m_points2.append(getSubShape(vertex2[0], "Vertex", int(m_n2)).Point)
+
+    m_equals = areEqualVectors(m_points1, m_points2)
+    return [m_couple for m_couple, m_equal in zip(vertexes_list, m_equals)
+            if not m_equal]
+
+
+def filterDegeneratedTriples(vertexes_list):
+    """ Return the triples of points links defining a Plane
+    (no equal points and not aligned).
+
+    PARAMETERS:
+    -----------
+    vertexes_list : (List, Mandatory)
+                    list of triples of [obj, "VertexN"].
     """
-    Vector = vect_b - vect_a
-    m_tolerance = WF.tolerance()
-    if abs(Vector.x) <= m_tolerance and abs(
-            Vector.y) <= m_tolerance and abs(Vector.z) <= m_tolerance:
-        return True
+    m_points = ([], [], [])
+    for m_triple in vertexes_list:
+        for m_vertex, m_list in zip(m_triple, m_points):
+            m_n = re.sub('[^0-9]', '', m_vertex[1])
+            m_list.append(getSubShape(m_vertex[0], "Vertex", int(m_n)).Point)
+
+    m_degenerated = areDegeneratedTriples(*m_points)
+    return [m_triple for m_triple, m_bad in zip(vertexes_list, m_degenerated)
+            if not m_bad]
+
 
-    return False
+def uniqueVectors(vects):
+    """ Return for each point if it is the first of its coincident points,
+    with the WF tolerance.
+
+    RETURN:
+    -------
+    A numpy boolean array of shape (N,)
+    PARAMETERS:
+    -----------
+    vects : (List of Vector or Array like of shape (N, 3), Mandatory)
+    """
+    return kernels.uniquePoints(vectorsToArray(vects), WF.tolerance())
 
 
 def centerLinePoint(edge):
     """ Return the center point of the Line.
+    None if the ends of the Line are equal.
     """
-    Vector_A = edge.Vertexes[0].Point
-    Vector_B = edge.Vertexes[-1].Point
-    Vector_AB = Vector_B + Vector_A
+    return alongTwoPointsPoint(edge.Vertexes[0].Point,
+                               edge.Vertexes[-1].Point, 1, 0)
 
-    return Vector_AB.multiply(0.5)
+
+def alongPoint(vect_a, vect_b, index, number, length):
+    """ Return the point at index * length / number from vect_a towards
+    vect_b (the middle of [vect_a, vect_b] if number = 0), computed by
+    WF_kernels.alongLinePoints.
+    None if vect_a and vect_b are equal.
+    """
+    m_line = [(tuple(vect_a), tuple(vect_b))]
+    if number == 0:
+        m_point = kernels.alongLinePoints(m_line, 0,
+                                          tolerance=WF.tolerance())[0, 0]
+    else:
+        # The point 1/1 of a Line scaled to the wanted distance, so that
+        # index may also be out of [0, number]
+        m_point = kernels.alongLinePoints(m_line, 1,
+                                          [index * length / number],
+                                          WF.tolerance())[0, 1]
+    return arrayToVector(m_point)
 
 
 def alongTwoPointsPoint(vect_a, vect_b, index, number):
     """ Return the point at index/number of the Line defined by vect_a and vect_b.
     1/2 means middle of the line.
     1/3 means one third of the line...
+    None if vect_a and vect_b are equal.
     """
-    Vector_A = vect_a
-    Vector_B = vect_b
-    distance = Vector_B.sub(Vector_A).Length / 2
-
-    if number != 0:
-        distance = index * (Vector_B.sub(Vector_A).Length / number)
-    Vector_A = Vector_A.add(Vector_B.sub(
-        Vector_A).normalize().multiply(distance))
-
-    return Vector_A
+    return alongPoint(vect_a, vect_b, index, number,
+                      vect_b.sub(vect_a).Length)
 
 
 def alongLinePoint(edge, index, number):
     """ Return the point at index/number of the Line.
     1/2 means middle of the line.
     1/3 means one third of the line...
+    None if the ends of the Line are equal.
     """
-    Vector_A = edge.Vertexes[0].Point
-    Vector_B = edge.Vertexes[-1].Point
-    if isEqualVectors(Vector_A, Vector_B):
-        return None
-    distance = Vector_B.sub(Vector_A).Length / 2
+    return alongPoint(edge.Vertexes[0].Point, edge.Vertexes[-1].Point,
+                      index, number, edge.Length)
 
-    if number != 0:
-        distance = index * (edge.Length / number)
-    Vector_A = Vector_A.add(Vector_B.sub(
-        Vector_A).normalize().multiply(distance))
 
-    return Vector_A
+def alongLinePoints(edge_points, number, lengths=None):
+    """ Return all the points at index/number of several Lines at once.
+
+    See WF_kernels.alongLinePoints, Lines shorter than WF tolerance
+    are returned as NaN points.
+    RETURN:
+    -------
+    A numpy array of shape (E, number + 1, 3)
+    """
+    return kernels.alongLinePoints(edge_points, number, lengths,
+                                   WF.tolerance())
 
 
 def coordVectorPoint(vertex):
@@ -112,58 +253,56 @@ def meanVectorsPoint(vertexes):
     """
     Vector_mean = App.Vector(0.0, 0.0, 0.0)
     m_vertx = vertexes
-    m_num = len(m_vertx)
-    if m_num == 0:
-        return None
 
     if vertexes is None:
         print_msg("ERROR : vertexes == None, leaving meanVectorsPoint()")
         return Vector_mean
-    if m_num < 1:
-        print_msg("ERROR : len(vertexes) < 1 , meanVectorsPoint()")
-        return Vector_mean
-    m_list = []
-    for m_vert in m_vertx:
-        m_list.append(m_vert.x)
-        m_list.append(m_vert.y)
-        m_list.append(m_vert.z)
+    m_num = len(m_vertx)
+    if m_num == 0:
+        return None
 
-    import numpy
-    m_vect = numpy.array(m_list)
-    m_vect_re = m_vect.reshape(m_num, 3)
-    vect_c = sum(m_vect_re, 0) / m_num
+    vect_c = kernels.meanPoints(vectorsToArray(m_vertx))
 
     Vector_mean = App.Vector(vect_c[0], vect_c[1], vect_c[2])
 
     return Vector_mean
 
 
+class Centroid(kernels.Centroid):
+    """ Running sum of a list of points to get their mean point as Vector.
+
+    EXAMPLE :
+    m_centroid = Centroid()
+    m_centroid.reset(keys, vectorsToArray(points))
+    m_centroid.update(2, App.Vector(1.0, 0.0, 0.0))
+    Vector_mean = m_centroid.mean()
+    """
+
+    def reset(self, keys, points):
+        kernels.Centroid.reset(self, keys, vectorsToArray(points))
+
+    def mean(self):
+        """ Return the mean point as a Vector or None if no point.
+        """
+        return arrayToVector(kernels.Centroid.mean(self))
+
+
 def minMaxVectorsLimits(vertexes):
     """ Return the min and max limits along the 3 Axis for all selected Vectors.
     """
     xmax = xmin = ymax = ymin = zmax = zmin = 0
-    m_vertx = vertexes
-    m_num = len(m_vertx)
 
     if vertexes is None:
         print_msg("ERROR : vertexes == None, leaving minMaxVectorsLimits()")
         return xmax, xmin, ymax, ymin, zmax, zmin
 
-    if m_num < 1:
+    if len(vertexes) < 1:
         print_msg("ERROR : len(vertexes) < 1 , leaving minMaxVectorsLimits()")
         return xmax, xmin, ymax, ymin, zmax, zmin
 
-    min_val, max_val = init_min_max()
-    xmin = ymin = zmin = max_val
-    xmax = ymax = zmax = min_val
-
-    for m_vert in m_vertx:
-        xmax = max(xmax, m_vert.x)
-        xmin = min(xmin, m_vert.x)
-        ymax = max(ymax, m_vert.y)
-        ymin = min(ymin, m_vert.y)
-        zmax = max(zmax, m_vert.z)
-        zmin = min(zmin, m_vert.z)
+    xmin, ymin, zmin, xmax, ymax, zmax = [float(m_val) for m_val in
+                                          kernels.boxFromPoints(
+                                              vectorsToArray(vertexes))]
 
     return xmax, xmin, ymax, ymin, zmax, zmin
 
@@ -171,82 +310,50 @@ def minMaxVectorsLimits(vertexes):
 def intersecLinePlane(vect_a, vect_b, Plane_Normal, Plane_Point):
     """ Return the intersection between the Line L defined by vect_a and vect_b
     and the Plane defined by Plane_Normal and Plane_Point.
+
+    Same computation and WF tolerance as intersecLinesPlanes :
+    if the Line lies in the Plane the first point is returned, if the Line
+    and the Plane are parallel None is returned.
     """
-    # Plane Equation is eq(0) P(x, y, z):
-    # a * x + b * y + c * z + d = 0
-    # where Normal to P is  N(a, b, c)
-    N = Plane_Normal
-
-    # if N == App.Vector(0.0, 0.0, 0.0):
-    #    return None
-    a, b, c = N.x, N.y, N.z
-    # print("a = " + str(a) + " b = " + str(b) + " c = " + str(c))
-
-    # p1(px,py,pz) belongs to the plane P, so
-    # a * px + b * py + c * pz + d = 0 and
-    # d = -(a * px + b * py + c * pz)
-    p1 = Plane_Point
-    d = -((a * p1.x) + (b * p1.y) + (c * p1.z))
-    # print("d = "+ str(d))
-
-    # L is the line defined by 2 points vect_a(ax, ay, az) and vect_b(bx, by, bz), and
-    # may be also defined as the line crossing vect_a(ax, ay, az) and along
-    # the direction AB = U(bx-ax, by-ay, bz-az)
-    # If U(ux, uy, uz) = U(bx-ax, by-ay, bz-az) the Line L is the set of
-    # points M as defined by eq(1):
-    # Vector(MA) = k * Vector(U)
-    # with k Real
     if isEqualVectors(vect_a, vect_b):
         print_msg("ERROR : The 2 given points are equals !")
         return None
-    ax, ay, az = vect_a.x, vect_a.y, vect_a.z
-    bx, by, bz = vect_b.x, vect_b.y, B.z
-    ux, uy, uz = bx - ax, by - ay, bz - az
-    U = App.Vector(ux, uy, uz)
-
-    # We consider Dot product between U and N
-    # 1> U.N = 0
-    # print("U.dot(N) =" + str(U.dot(N)))
-
-    if U.dot(N) == 0.0:
-        # if vect_a belongs to P : the full Line L is included in the Plane
-        if (a * ax) + (b * ay) + (c * az) + d == 0.0:
-            print_msg(
-                "WARNING : The full Line is included in the Plane, returning first Point !")
-            return vect_a
-        # if not the Plane and line are parallel without intersection
-        else:
-            print_msg(
-                "ERROR : The Plane and the line are parallel without intersection !")
-            return None
-    # 2> U.N != 0
-    else:
-        # We look for T(tx, ty, tz) on the Line L
-        # eq(1) in parametric form; k exists and follows eq(2):
-        # tx = ax + k * ux
-        # ty = ay + k * uy
-        # tz = az + k * uz
-        # and T(tx, ty, tz) on the plane too so eq(1) is
-        # a * tx + b * ty + c * tz + d = 0
-        # by pasting the tx, ty and tz expressions into eq(1) we have a first
-        # deg equation with one unknown 'k':
-        # a * (ax + k * ux) + b * (ay + k * uy) + c * (az + k * uz) + d = 0
-        # so
-        # a * ax + a * k * ux + b * ay + b * k * uy + c * az + c * k * uz + d = 0
-        # k * ( a * ux + b * uy  c *uz ) + a * ax + b * ay + c * az  + d = 0
-        # k = -1 * (a * ax + b * ay + c * az  + d) / ( a * ux + b * uy + c *uz )
-        if (a * ux + b * uy + c * uz) == 0.0:
-            print_msg("ERROR : a * ux + b * uy + c *uz == 0.0 !")
-            return None
-
-        k = -1 * (a * ax + b * ay + c * az + d) / (a * ux + b * uy + c * uz)
-        tx = ax + k * ux
-        ty = ay + k * uy
-        tz = az + k * uz
-        # print("tx =" + str(tx) + " ty=" + str(ty) + " tz=" + str(tz))
-        T = App.Vector(tx, ty, tz)
-
-        return T
+    _, m_points = intersecLinesPlanes([tuple(vect_a)], [tuple(vect_b)],
+                                      [tuple(Plane_Normal)],
+                                      [tuple(Plane_Point)])
+    if len(m_points) == 0:
+        print_msg(
+            "ERROR : The Plane and the line are parallel without intersection !")
+        return None
+    return arrayToVector(m_points[0])
+
+
+def linesHitBoxes(lines_a, lines_b, boxes):
+    """ Return for each (Line, Box) couple if the infinite Line
+    crosses the axis-aligned Box (enlarged by WF tolerance).
+
+    See WF_kernels.linesHitBoxes.
+    RETURN:
+    -------
+    A numpy boolean array of shape (N, M)
+    """
+    return kernels.linesHitBoxes(lines_a, lines_b, boxes, WF.tolerance())
+
+
+def intersecLinesPlanes(lines_a, lines_b, planes_normal, planes_point,
+                        planes_box=None):
+    """ Return the intersections between N Lines and M Planes at once.
+
+    Array version of intersecLinePlane, see WF_kernels.intersecLinesPlanes.
+    RETURN:
+    -------
+    indexes, points
+    indexes : numpy array of shape (K, 2) of (Line index, Plane index)
+    points  : numpy array of shape (K, 3) of the intersection points
+    """
+    return kernels.intersecLinesPlanes(lines_a, lines_b,
+                                       planes_normal, planes_point,
+                                       planes_box, WF.tolerance())
 
 
 def intersectPerpendicularLine(vect_a, vect_b, point_c,):
@@ -267,53 +374,26 @@ def intersectPerpendicularLine(vect_a, vect_b, point_c,):
     vect_a    : (Vector, Mandatory)
     vect_b    : (Vector, Mandatory)
     point_c    : (Vector, Mandatory)
->>>>>>> Build useful functions
     """
-    import math
-    # L is the line defined by 2 points vect_a(ax, ay, az) and vect_b(bx, by, bz), and
-    # may be also defined as the line crossing vect_a(ax, ay, az) and along the
-    # direction AB = U(bx-ax, by-ay, bz-az)
-    # If U(ux, uy, uz) = U(bx-ax, by-ay, bz-az) the Line L is the set of
-    # points M as defined by eq(1):
-    # Vector(MA) = k * Vector(U)
-    # with k Real
-    if vect_a == vect_b:
-        return None
-    ax, ay, az = vect_a.x, vect_a.y, vect_a.z
-    bx, by, bz = vect_b.x, vect_b.y, vect_b.z
-    cx, cy, cz = point_c.x, point_c.y, point_c.z
-    ux, uy, uz = bx - ax, by - ay, bz - az
-    # U = App.Vector(ux, uy, uz)
-    # We look for T(tx, ty, tz) on the Line L
-    # eq(1) in parametric form; k exists and follows eq(2):
-    # tx = ax + k * ux
-    # ty = ay + k * uy
-    # tz = az + k * uz
-
-    # and vector V(vx, vy, vz) defined by point C and point T
-    # vx, vy, vz = tx - cx, ty - cy, tz - cz
-    # V must be perpendicular to the Line L
-    # We consider Dot product between U and V and give us eq(3)
-    # U.V = 0
-    # so ux * vx + uy * vy + uz * vz = 0
-    # ux * (tx - cx) + uy * (ty - cy) + uz * (tz - cz) = 0
-    # ux * (ax + k * ux  - cx) + uy * (ay + k * uy - cy) + uz * (az + k * uz  - cz) = 0
-    # ux*ax + ux*(k*ux) - ux*cx + uy*ay + uy*(k*uy) - uy*cy +  uz*az +
-    # uz*(k*uz) - uz*cz = 0
-    if (ux * ux + uy * uy + uz * uz) == 0.0:
+    T, distance, Tprime = kernels.intersectPerpendicularLines(tuple(vect_a),
+                                                              tuple(vect_b),
+                                                              [tuple(point_c)])
+    if T[0][0] != T[0][0]:
         return None
-    k = (ux * cx + uy * cy + uz * cz - ux * ax - uy *
-         ay - uz * az) / (ux * ux + uy * uy + uz * uz)
-    tx = ax + k * ux
-    ty = ay + k * uy
-    tz = az + k * uz
-    T = App.Vector(tx, ty, tz)
-    vx, vy, vz = tx - cx, ty - cy, tz - cz
-    V = App.Vector(vx, vy, vz)
-    distance = math.sqrt(V.dot(V))
-    Tprime = T + V
+    return arrayToVector(T[0]), float(distance[0]), arrayToVector(Tprime[0])
 
-    return T, distance, Tprime
+
+def intersectPerpendicularLines(vect_a, vect_b, points_c):
+    """ Return the projections of several points onto one or several lines.
+
+    Array version of intersectPerpendicularLine,
+    see WF_kernels.intersectPerpendicularLines.
+    RETURN:
+    -------
+    T, distance, Tprime
+    as numpy arrays of shape (M, 3), (M,) and (M, 3)
+    """
+    return kernels.intersectPerpendicularLines(vect_a, vect_b, points_c)
 
 
 def printPoint(point, msg=""):
@@ -337,6 +417,8 @@ def propertiesPoint(Point_User_Name,
     PointSize
     Transparency
     """
+    if not App.GuiUp:
+        return
     try:
         if isinstance(color, tuple):
             Gui.ActiveDocument.getObject(Point_User_Name).PointColor = color
@@ -369,6 +451,8 @@ def propertiesLine(Line_User_Name,
     PointSize
     Transparency
     """
+    if not App.GuiUp:
+        return
     try:
         if isinstance(color, tuple):
             Gui.ActiveDocument.getObject(Line_User_Name).PointColor = color
@@ -413,6 +497,8 @@ def propertiesPlane(Plane_User_Name,
     ShapeColor
     Transparency
     """
+    if not App.GuiUp:
+        return
     try:
         if isinstance(color, tuple):
             Gui.ActiveDocument.getObject(Plane_User_Name).PointColor = color
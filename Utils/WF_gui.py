@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from contextlib import contextmanager
 from PySide import QtGui
 import FreeCAD as App
 if App.GuiUp:
@@ -26,3 +27,79 @@ def raiseComboView():
     # va.setChecked(True)        # True or False
     dw.raise_()
     dw.setVisible(True)        # True or False
+
+
+@contextmanager
+def deferredRedraw():
+    """ Context deferring the redraws while many view properties are
+    changed, then redrawing once.
+    What is deferred :
+    - the Qt painting of the main window (tree, property view...);
+    - the 3D view : the notifications of its scene graph are stopped, so
+    no redraw is scheduled for each changed object, and the animations
+    are suspended.
+    The view properties themselves are still changed at once.
+    Do nothing without Gui.
+    """
+    if not App.GuiUp:
+        yield
+        return
+    mw = Gui.getMainWindow()
+    m_enabled = mw.updatesEnabled()
+    m_view = Gui.ActiveDocument.ActiveView if Gui.ActiveDocument else None
+    m_root = None
+    m_notify = False
+    m_animation = None
+    if m_view is not None:
+        try:
+            # Coin node (needs pivy)
+            m_root = m_view.getSceneGraph()
+            m_notify = m_root.isNotifyEnabled()
+            m_root.enableNotify(False)
+        except Exception:
+            m_root = None
+        if hasattr(m_view, "isAnimationEnabled"):
+            m_animation = m_view.isAnimationEnabled()
+            m_view.setAnimationEnabled(False)
+    mw.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        mw.setUpdatesEnabled(m_enabled)
+        if m_animation is not None:
+            m_view.setAnimationEnabled(m_animation)
+        if m_root is not None:
+            m_root.enableNotify(m_notify)
+            if m_notify:
+                # One notification for all the changes
+                m_root.touch()
+        if m_enabled:
+            if m_view is not None and hasattr(m_view, "redraw"):
+                m_view.redraw()
+            Gui.updateGui()
+
+
+def setVisibility(objects, visible=None):
+    """ Show or hide many objects with a single redraw.
+
+    Return
+    -------
+    The number of objects changed.
+
+    Parameters
+    -------
+    *objects* : (List of document objects, Mandatory)
+    *visible* : (Boolean, Optional, default=None)
+                if None the visibility of each object is toggled.
+    """
+    m_count = 0
+    with deferredRedraw():
+        for m_obj in objects:
+            m_view_obj = m_obj.ViewObject
+            if m_view_obj is None:
+                continue
+            m_visible = not m_view_obj.Visibility if visible is None else bool(visible)
+            if m_view_obj.Visibility != m_visible:
+                m_view_obj.Visibility = m_visible
+                m_count += 1
+    return m_count
@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+""" Pure NumPy geometry kernels.
+
+All functions work on float64 arrays of points of shape (N, 3) and do not
+depend on FreeCAD, so they can run in worker processes and batch jobs.
+Use WF_geometry to call them with FreeCAD Vectors and WF tolerance.
+"""
+import math
+import numpy as np
+
+
+def asPoints(points):
+    """ Return points as a float64 numpy array of shape (N, 3).
+    """
+    return np.asarray(points, dtype=np.float64).reshape(-1, 3)
+
+
+def isEqualPoints(points_a, points_b, tolerance=0.0):
+    """ Return for each couple (points_a[i], points_b[i]) if the 2 points
+    are equal.
+
+    RETURN:
+    -------
+    A numpy boolean array of shape (N,)
+    PARAMETERS:
+    -----------
+    points_a  : (Array like of shape (N, 3), Mandatory)
+    points_b  : (Array like of shape (N, 3), Mandatory)
+    tolerance : (Float, Optional, default=0.0)
+    """
+    m_diff = asPoints(points_b) - asPoints(points_a)
+    return np.all(np.abs(m_diff) <= tolerance, axis=1)
+
+
+def isColinearPoints(points_a, points_b, points_c, tolerance=0.0):
+    """ Return for each triple (points_a[i], points_b[i], points_c[i])
+    if the 3 points are aligned.
+
+    RETURN:
+    -------
+    A numpy boolean array of shape (N,)
+    PARAMETERS:
+    -----------
+    points_a  : (Array like of shape (N, 3), Mandatory)
+    points_b  : (Array like of shape (N, 3), Mandatory)
+    points_c  : (Array like of shape (N, 3), Mandatory)
+    tolerance : (Float, Optional, default=0.0)
+    """
+    m_a = asPoints(points_a)
+    m_b = asPoints(points_b)
+    m_cross = np.cross(m_b - m_a, asPoints(points_c) - m_b)
+    return np.all(np.abs(m_cross) <= tolerance, axis=1)
+
+
+def isDegeneratedTriples(points_a, points_b, points_c, tolerance=0.0):
+    """ Return for each triple (points_a[i], points_b[i], points_c[i])
+    if 2 of the points are equal or if the 3 points are aligned
+    (ie: the triple does not define a Plane).
+
+    RETURN:
+    -------
+    A numpy boolean array of shape (N,)
+    """
+    return (isEqualPoints(points_a, points_b, tolerance) |
+            isEqualPoints(points_a, points_c, tolerance) |
+            isEqualPoints(points_b, points_c, tolerance) |
+            isColinearPoints(points_a, points_b, points_c, tolerance))
+
+
+class SpatialHash():
+    """ Uniform grid of points to find coincident points.
+
+    Points are hashed into cubic cells of size tolerance,
+    a new point is compared only with the points of the 27 cells around.
+    Two points are coincident when they are within tolerance on each
+    axis, as isEqualPoints (and WF_geometry.isEqualVectors) compare them.
+
+    EXAMPLE :
+    m_hash = SpatialHash(1e-6)
+    m_index = m_hash.insert((0.0, 0.0, 0.0))   # 0 : new point
+    m_index = m_hash.insert((0.0, 0.0, 1e-7))  # 0 : same as first point
+    """
+
+    def __init__(self, tolerance):
+        # Null tolerance means exact equality, any cell size is fine
+        self._size = float(tolerance) if tolerance > 0.0 else 1.0
+        self._tolerance = float(tolerance)
+        self._cells = {}
+        self._points = []
+
+    def __cell(self, point):
+        return (math.floor(point[0] / self._size),
+                math.floor(point[1] / self._size),
+                math.floor(point[2] / self._size))
+
+    def find(self, point):
+        """ Return the index of an inserted point coincident with point
+        or None.
+        """
+        m_x, m_y, m_z = point
+        m_i, m_j, m_k = self.__cell(point)
+        for m_di in (0, -1, 1):
+            for m_dj in (0, -1, 1):
+                for m_dk in (0, -1, 1):
+                    m_cell = self._cells.get((m_i + m_di,
+                                              m_j + m_dj,
+                                              m_k + m_dk))
+                    if m_cell is None:
+                        continue
+                    for m_index in m_cell:
+                        m_px, m_py, m_pz = self._points[m_index]
+                        if abs(m_px - m_x) <= self._tolerance and \
+                                abs(m_py - m_y) <= self._tolerance and \
+                                abs(m_pz - m_z) <= self._tolerance:
+                            return m_index
+        return None
+
+    def insert(self, point):
+        """ Insert point if not already in and return its index
+        (the index of the coincident point if any).
+        """
+        m_point = (float(point[0]), float(point[1]), float(point[2]))
+        m_index = self.find(m_point)
+        if m_index is not None:
+            return m_index
+        m_index = len(self._points)
+        self._points.append(m_point)
+        self._cells.setdefault(self.__cell(m_point), []).append(m_index)
+        return m_index
+
+    def __len__(self):
+        return len(self._points)
+
+
+def uniquePoints(points, tolerance=0.0):
+    """ Return for each point if it is the first of its coincident points.
+
+    NaN points are never unique.
+
+    RETURN:
+    -------
+    A numpy boolean array of shape (N,)
+    PARAMETERS:
+    -----------
+    points    : (Array like of shape (N, 3), Mandatory)
+    tolerance : (Float, Optional, default=0.0)
+                max difference on each axis between 2 coincident points.
+    """
+    m_points = asPoints(points)
+    m_unique = np.zeros(len(m_points), dtype=bool)
+    m_hash = SpatialHash(tolerance)
+    m_nan = np.isnan(m_points).any(axis=1)
+    for m_i, m_point in enumerate(m_points.tolist()):
+        if m_nan[m_i]:
+            continue
+        m_count = len(m_hash)
+        m_hash.insert(m_point)
+        m_unique[m_i] = len(m_hash) > m_count
+    return m_unique
+
+
+def meanPoints(points):
+    """ Return the mean point of the points as numpy array of shape (3,).
+
+    PARAMETERS:
+    -----------
+    points : (Array like of shape (N, 3), Mandatory)
+             must not be empty.
+    """
+    return np.mean(asPoints(points), axis=0)
+
+
+def boxFromPoints(points):
+    """ Return the box (xmin, ymin, zmin, xmax, ymax, zmax) as numpy array
+    of the points.
+
+    PARAMETERS:
+    -----------
+    points : (Array like of shape (N, 3), Mandatory)
+             must not be empty.
+    """
+    m_points = asPoints(points)
+    return np.concatenate((np.min(m_points, axis=0),
+                           np.max(m_points, axis=0)))
+
+
+def unionBoxes(boxes):
+    """ Return the box enclosing all the given boxes.
+
+    PARAMETERS:
+    -----------
+    boxes : (Array like of shape (N, 6), Mandatory)
+    """
+    m_boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 6)
+    return np.concatenate((np.min(m_boxes[:, :3], axis=0),
+                           np.max(m_boxes[:, 3:], axis=0)))
+
+
+def overlapBoxes(boxes_a, boxes_b, tolerance=0.0):
+    """ Return for each (box_a, box_b) couple if the 2 boxes overlap.
+
+    RETURN:
+    -------
+    A numpy boolean array of shape (N, M)
+    PARAMETERS:
+    -----------
+    boxes_a   : (Array like of shape (N, 6), Mandatory)
+    boxes_b   : (Array like of shape (M, 6), Mandatory)
+    tolerance : (Float, Optional, default=0.0)
+    """
+    m_a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 1, 6)
+    m_b = np.asarray(boxes_b, dtype=np.float64).reshape(1, -1, 6)
+    return np.all((m_a[..., :3] <= m_b[..., 3:] + tolerance) &
+                  (m_b[..., :3] <= m_a[..., 3:] + tolerance), axis=-1)
+
+
+def alongLinePoints(edge_points, number, lengths=None, tolerance=0.0):
+    """ Return all the points at index/number of several Lines at once.
+
+    For each Line defined by its 2 ends, return the (number + 1) points
+    at index/number with index in [0, number] (0/n is the start of the Line
+    and n/n the end of the Line).
+    With number = 0 only the middle of each Line is returned (as
+    alongLinePoint does for any index).
+    The Lines with equal ends are returned as NaN points.
+
+    RETURN:
+    -------
+    A numpy array of shape (E, number + 1, 3), (E, 1, 3) if number = 0
+    PARAMETERS:
+    -----------
+    edge_points : (Array like of shape (E, 2, 3), Mandatory)
+                  start and end points of each Line.
+    number      : (Positive Integer, Mandatory)
+                  number of parts to cut each Line in.
+    lengths     : (Array like of shape (E,), Optional, default=None)
+                  length along which the points are distributed (edge.Length),
+                  if None the distance between the 2 ends is used.
+    tolerance   : (Float, Optional, default=0.0)
+                  Lines shorter than tolerance have equal ends.
+    """
+    m_points = np.asarray(edge_points, dtype=np.float64).reshape(-1, 2, 3)
+    m_start = m_points[:, 0, :]
+    m_dir = m_points[:, 1, :] - m_start
+    m_chord = np.sqrt(np.einsum('ij,ij->i', m_dir, m_dir))
+    m_degenerated = m_chord <= tolerance
+
+    if number == 0:
+        m_result = m_start[:, np.newaxis, :] + 0.5 * m_dir[:, np.newaxis, :]
+        m_result[m_degenerated] = np.nan
+        return m_result
+
+    if lengths is not None:
+        m_scale = np.asarray(lengths, dtype=np.float64).reshape(-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            m_dir = m_dir * (m_scale / m_chord)[:, np.newaxis]
+
+    m_ratio = np.arange(number + 1, dtype=np.float64) / float(number)
+    m_result = m_start[:, np.newaxis, :] + \
+        m_ratio[np.newaxis, :, np.newaxis] * m_dir[:, np.newaxis, :]
+    m_result[m_degenerated] = np.nan
+
+    return m_result
+
+
+def linesHitBoxes(lines_a, lines_b, boxes, tolerance=0.0):
+    """ Return for each (Line, Box) couple if the infinite Line
+    crosses the axis-aligned Box.
+
+    RETURN:
+    -------
+    A numpy boolean array of shape (N, M)
+    PARAMETERS:
+    -----------
+    lines_a   : (Array like of shape (N, 3), Mandatory)
+    lines_b   : (Array like of shape (N, 3), Mandatory)
+                the 2 points defining each Line.
+    boxes     : (Array like of shape (M, 6), Mandatory)
+                (xmin, ymin, zmin, xmax, ymax, zmax) of each Box.
+    tolerance : (Float, Optional, default=0.0)
+                the Boxes are enlarged by tolerance.
+    """
+    m_a = np.asarray(lines_a, dtype=np.float64).reshape(-1, 1, 3)
+    m_u = np.asarray(lines_b, dtype=np.float64).reshape(-1, 1, 3) - m_a
+    m_boxes = np.asarray(boxes, dtype=np.float64).reshape(1, -1, 6)
+    m_min = m_boxes[..., :3] - tolerance
+    m_max = m_boxes[..., 3:] + tolerance
+
+    # Slab method : the Line A + t * U crosses the Box if the parameter
+    # intervals where it is inside each of the 3 slabs overlap.
+    m_parallel = np.abs(m_u) <= tolerance
+    m_inside = (m_a >= m_min) & (m_a <= m_max)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        m_t1 = (m_min - m_a) / m_u
+        m_t2 = (m_max - m_a) / m_u
+    m_near = np.where(m_parallel,
+                      np.where(m_inside, -np.inf, np.inf),
+                      np.minimum(m_t1, m_t2))
+    m_far = np.where(m_parallel,
+                     np.where(m_inside, np.inf, -np.inf),
+                     np.maximum(m_t1, m_t2))
+
+    return np.max(m_near, axis=-1) <= np.min(m_far, axis=-1)
+
+
+def intersecLinesPlanes(lines_a, lines_b, planes_normal, planes_point,
+                        planes_box=None, tolerance=0.0):
+    """ Return the intersections between N Lines and M Planes at once.
+
+    Each Line is defined by 2 points lines_a[i] and lines_b[i],
+    each Plane by planes_normal[j] and planes_point[j].
+    If planes_box is given, the (Line, Plane) couples where the Line does
+    not cross the bounding box of the Plane (Face) are rejected first,
+    then only the remaining couples are solved.
+    Couples with parallel Line and Plane (|N.U| <= tolerance) are rejected
+    too, unless the Line lies in the Plane (|N.(P - A)| <= tolerance) : the
+    first point of the Line is then returned (as intersecLinePlane does).
+
+    RETURN:
+    -------
+    indexes, points
+    indexes : numpy array of shape (K, 2) of (Line index, Plane index)
+    points  : numpy array of shape (K, 3) of the intersection points
+    PARAMETERS:
+    -----------
+    lines_a       : (Array like of shape (N, 3), Mandatory)
+    lines_b       : (Array like of shape (N, 3), Mandatory)
+    planes_normal : (Array like of shape (M, 3), Mandatory)
+    planes_point  : (Array like of shape (M, 3), Mandatory)
+    planes_box    : (Array like of shape (M, 6), Optional, default=None)
+                    (xmin, ymin, zmin, xmax, ymax, zmax) of each Plane.
+    tolerance     : (Float, Optional, default=0.0)
+    """
+    m_a = asPoints(lines_a)
+    m_u = asPoints(lines_b) - m_a
+    m_n = asPoints(planes_normal)
+    m_p = asPoints(planes_point)
+
+    # Broad phase
+    m_valid = np.ones((len(m_a), len(m_n)), dtype=bool)
+    m_valid &= np.sum(m_u * m_u, axis=1)[:, np.newaxis] > tolerance ** 2
+    if planes_box is not None:
+        m_valid &= linesHitBoxes(m_a, m_a + m_u, planes_box, tolerance)
+    m_lines, m_planes = np.nonzero(m_valid)
+
+    # Narrow phase on remaining couples
+    # k = -(N.A + d) / N.U with d = -N.P
+    m_den = np.sum(m_n[m_planes] * m_u[m_lines], axis=1)
+    m_num = np.sum(m_n[m_planes] * (m_p[m_planes] - m_a[m_lines]), axis=1)
+    m_parallel = np.abs(m_den) <= tolerance
+    m_keep = ~m_parallel | (np.abs(m_num) <= tolerance)
+    m_lines = m_lines[m_keep]
+    m_planes = m_planes[m_keep]
+    m_parallel = m_parallel[m_keep]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        m_k = np.where(m_parallel, 0.0, m_num[m_keep] / m_den[m_keep])
+
+    points = m_a[m_lines] + m_k[:, np.newaxis] * m_u[m_lines]
+    indexes = np.stack((m_lines, m_planes), axis=1)
+
+    return indexes, points
+
+
+def intersectPerpendicularLines(vect_a, vect_b, points_c):
+    """ Return the projections of several points onto one or several lines.
+
+    Project M points onto one Line [vect_a, vect_b] or
+    M points onto M Lines [vect_a[i], vect_b[i]].
+
+    Return also the distances between the points and their projections.
+    Return also the symmetric points of the points versus the Lines.
+    Projections onto Lines with equal ends are returned as NaN.
+
+    RETURN:
+    -------
+    T, distance, Tprime
+    as numpy arrays of shape (M, 3), (M,) and (M, 3)
+    PARAMETERS:
+    -----------
+    vect_a    : (Array like of shape (3,) or (M, 3), Mandatory)
+    vect_b    : (Array like of shape (3,) or (M, 3), Mandatory)
+    points_c  : (Array like of shape (M, 3), Mandatory)
+    """
+    m_a = np.asarray(vect_a, dtype=np.float64)
+    m_b = np.asarray(vect_b, dtype=np.float64)
+    m_c = asPoints(points_c)
+
+    # U = B - A is the direction of the Line(s)
+    # k = U.(C - A) / U.U and T = A + k * U
+    m_u = m_b - m_a
+    m_uu = np.sum(m_u * m_u, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        m_k = np.sum(m_u * (m_c - m_a), axis=-1) / m_uu
+    m_k = np.where(m_uu == 0.0, np.nan, m_k)
+
+    T = m_a + m_k[..., np.newaxis] * m_u
+    V = T - m_c
+    distance = np.sqrt(np.sum(V * V, axis=-1))
+    Tprime = T + V
+
+    return T, distance, Tprime
+
+
+class Centroid():
+    """ Running sum of a list of points to get their mean point.
+
+    The whole list is set at once by reset() (one vectorized pass),
+    then each point can be replaced by update() in constant time.
+    """
+
+    def __init__(self, keys=None, points=None):
+        self._keys = []
+        self._points = np.zeros((0, 3), dtype=np.float64)
+        self._sum = np.zeros(3, dtype=np.float64)
+        if keys is not None and points is not None:
+            self.reset(keys, points)
+
+    def reset(self, keys, points):
+        """ Set all points at once.
+
+        PARAMETERS:
+        -----------
+        keys   : (List, Mandatory)
+                 one hashable key per point (ie: link keys).
+        points : (Array like of shape (N, 3), Mandatory)
+        """
+        self._keys = list(keys)
+        self._points = np.array(asPoints(points))
+        self._sum = np.sum(self._points, axis=0)
+
+    def update(self, index, point):
+        """ Replace the point at index.
+        """
+        m_new = (point[0], point[1], point[2])
+        self._sum += m_new
+        self._sum -= self._points[index]
+        self._points[index] = m_new
+
+    def keys(self):
+        """ Return the list of keys.
+        """
+        return self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def mean(self):
+        """ Return the mean point as numpy array of shape (3,)
+        or None if no point.
+        """
+        if len(self._keys) == 0:
+            return None
+        return self._sum / len(self._keys)
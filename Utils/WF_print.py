@@ -86,6 +86,9 @@ def printInfo_msg(message, title=None):
     """
     m_msg = message
     App.Console.PrintMessage(m_msg + "\n")
+    # No dialog without Gui (ie: FreeCADCmd)
+    if not App.GuiUp:
+        return
     try:
         gui_infoDialog(m_msg, title)
     except Exception as err:
@@ -99,6 +102,9 @@ def printError_msg(message, title=None):
     """
     m_msg = str(inspect.stack()[1][3]) + " : " + str(message)
     App.Console.PrintError(m_msg + "\n")
+    # No dialog without Gui (ie: FreeCADCmd)
+    if not App.GuiUp:
+        return
     try:
         gui_errorDialog(m_msg, title)
     except Exception as err:
@@ -114,7 +120,7 @@ def printError_msgWithTimer(message, title=None):
     App.Console.PrintError(m_msg + "\n")
     # recover timeout value from preferences
     timeout = WF.timeout()
-    if timeout == 0:
+    if timeout == 0 or not App.GuiUp:
         return
     try:
         gui_errorDialogWithTimer(m_msg, title, timeout)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Recompute profiler of the WF features.
+
+When switched on (setProfiling), WF_Object records for each execute and
+onChanged call the wall time and the number of linked sub elements
+(input size), aggregated by feature class and by object.
+"""
+import json
+import time
+from contextlib import contextmanager
+
+###############
+M_DEBUG = False
+###############
+M_PROFILING = False
+# Recorded data
+# {"class": {class name: {method: stats}},
+#  "object": {"document.object": {method: stats}}}
+# stats is {"calls": int, "time": float (s), "max": float (s), "size": int}
+M_PROFILE = {"class": {}, "object": {}}
+M_CLOCK = getattr(time, 'perf_counter', time.time)
+###############
+
+
+def setProfiling(flag=True):
+    """ Switch on/off the profiler.
+    """
+    global M_PROFILING
+    M_PROFILING = bool(flag)
+
+
+def isProfiling():
+    """ Return True if the profiler is on.
+    """
+    return M_PROFILING
+
+
+def clearProfile():
+    """ Forget all recorded data.
+    """
+    M_PROFILE["class"].clear()
+    M_PROFILE["object"].clear()
+
+
+def record(selfobj, method, duration, size=None):
+    """ Add one call of method ("execute", "onChanged") of the feature
+    selfobj that took duration (s) with size linked sub elements.
+    """
+    m_class = selfobj.Proxy.__class__.__name__
+    m_object = selfobj.Document.Name + "." + selfobj.Name
+    for m_kind, m_name in (("class", m_class), ("object", m_object)):
+        m_methods = M_PROFILE[m_kind].setdefault(m_name, {})
+        m_stats = m_methods.setdefault(method, {"calls": 0,
+                                                "time": 0.0,
+                                                "max": 0.0,
+                                                "size": 0})
+        m_stats["calls"] += 1
+        m_stats["time"] += duration
+        m_stats["max"] = max(m_stats["max"], duration)
+        if size is not None:
+            m_stats["size"] = size
+
+
+@contextmanager
+def profiled(selfobj, method, size=None):
+    """ Context recording the time spent into method of selfobj.
+    size is a function size(selfobj) giving the input size, called only
+    when the profiler is on.
+    """
+    if not M_PROFILING:
+        yield
+        return
+    m_start = M_CLOCK()
+    try:
+        yield
+    finally:
+        m_duration = M_CLOCK() - m_start
+        try:
+            m_size = size(selfobj) if size is not None else None
+            record(selfobj, method, m_duration, m_size)
+        except Exception:
+            # The object may have been deleted meanwhile
+            pass
+
+
+def slowest(kind="object", count=10):
+    """ Return the count slowest entries of kind ("class" or "object")
+    as a list of (name, total time, {method: stats}) sorted by total time.
+    """
+    m_list = []
+    for m_name, m_methods in M_PROFILE[kind].items():
+        m_time = sum(m_stats["time"] for m_stats in m_methods.values())
+        m_list.append((m_name, m_time, m_methods))
+    m_list.sort(key=lambda m_item: m_item[1], reverse=True)
+    return m_list[:count]
+
+
+def report(count=10):
+    """ Return a text report of the slowest feature classes and objects.
+    """
+    m_lines = []
+    for m_kind in ("class", "object"):
+        m_lines.append("Slowest WF features by " + m_kind + " :")
+        for m_name, m_time, m_methods in slowest(m_kind, count):
+            m_line = "  {0:s} : {1:.6f} s".format(m_name, m_time)
+            for m_method in sorted(m_methods):
+                m_stats = m_methods[m_method]
+                m_line += " | {0:s} {1:d} calls {2:.6f} s (max {3:.6f} s, size {4:d})".format(
+                    m_method, m_stats["calls"], m_stats["time"],
+                    m_stats["max"], m_stats["size"])
+            m_lines.append(m_line)
+    return "\n".join(m_lines)
+
+
+def exportJson(file_name):
+    """ Write all recorded data into file_name as JSON.
+    """
+    with open(file_name, "w") as m_file:
+        json.dump(M_PROFILE, m_file, indent=2, sort_keys=True)
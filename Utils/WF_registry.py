@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Registry of the WF features of each document.
+
+The features are indexed by class and by Parametric mode so the General
+commands (refresh, show/hide...) only visit the WF objects they act on
+instead of scanning all the objects of the document.
+WF_Object keeps the registry up to date on creation, document restore
+and Parametric change; a document observer removes deleted objects and
+registers again the objects restored by undo/redo.
+"""
+import FreeCAD as App
+
+###############
+M_DEBUG = False
+###############
+# {document name: {"object": {object name: (class name, mode)},
+#                  "class": {class name: {object name: None}},
+#                  "mode": {mode: {object name: None}}}}
+# the inner dicts are used as ordered sets (creation order)
+M_REGISTRY = {}
+M_OBSERVER = None
+###############
+
+
+class RegistryObserver():
+    """ Document observer removing the deleted WF objects from the
+    registry and adding back the ones restored by undo/redo.
+    """
+
+    def slotDeletedObject(self, obj):
+        try:
+            unregister(obj)
+        except Exception:
+            pass
+
+    def slotDeletedDocument(self, doc):
+        M_REGISTRY.pop(doc.Name, None)
+
+    def slotUndoDocument(self, doc):
+        rebuild(doc)
+
+    def slotRedoDocument(self, doc):
+        rebuild(doc)
+
+
+def installObserver():
+    """ Add (once) the document observer of the registry.
+    """
+    global M_OBSERVER
+    if M_OBSERVER is None:
+        M_OBSERVER = RegistryObserver()
+        App.addDocumentObserver(M_OBSERVER)
+
+
+def register(selfobj, class_name, mode):
+    """ Add or update the WF feature selfobj into the registry.
+
+    Parameters
+    -------
+    *selfobj* : (WF Object, Mandatory)
+    *class_name* : (String, Mandatory) class name of the Proxy
+    *mode* : (String, Mandatory) Parametric mode
+    """
+    installObserver()
+    m_doc = M_REGISTRY.setdefault(selfobj.Document.Name,
+                                  {"object": {}, "class": {}, "mode": {}})
+    m_name = selfobj.Name
+    m_old = m_doc["object"].get(m_name)
+    if m_old == (class_name, mode):
+        return
+    if m_old is not None:
+        m_doc["class"][m_old[0]].pop(m_name, None)
+        m_doc["mode"][m_old[1]].pop(m_name, None)
+    m_doc["object"][m_name] = (class_name, mode)
+    m_doc["class"].setdefault(class_name, {})[m_name] = None
+    m_doc["mode"].setdefault(mode, {})[m_name] = None
+    if M_DEBUG:
+        print("Registered " + m_name + " : " + str((class_name, mode)))
+
+
+def unregister(selfobj):
+    """ Remove the WF feature selfobj from the registry.
+    """
+    unregister_name(selfobj.Document.Name, selfobj.Name)
+
+
+def rebuild(doc):
+    """ Register again all the WF features of the document doc.
+    Used after undo/redo as the objects they restore are created
+    without going through the WF feature creation.
+    """
+    M_REGISTRY.pop(doc.Name, None)
+    for m_obj in doc.Objects:
+        m_proxy = getattr(m_obj, "Proxy", None)
+        # 'parametric' : features of the 2018 version
+        m_wf = hasattr(m_obj, "Parametric") or hasattr(m_obj, "parametric")
+        if m_wf and hasattr(m_proxy, "register"):
+            try:
+                m_proxy.register(m_obj)
+            except Exception:
+                pass
+
+
+def getFeatures(doc, mode=None, class_name=None):
+    """ Return the WF features of the document doc.
+
+    Return
+    -------
+    A list of document objects.
+
+    Parameters
+    -------
+    *doc* : (Document, Mandatory)
+    *mode* : (String, Optional, default=None)
+             only the features with this Parametric mode
+    *class_name* : (String, Optional, default=None)
+                   only the features with this Proxy class
+    """
+    m_doc = M_REGISTRY.get(doc.Name)
+    if m_doc is None:
+        return []
+    if mode is not None:
+        m_names = m_doc["mode"].get(mode, {})
+        if class_name is not None:
+            m_names = [m_name for m_name in m_names
+                       if m_doc["object"][m_name][0] == class_name]
+    elif class_name is not None:
+        m_names = m_doc["class"].get(class_name, {})
+    else:
+        m_names = m_doc["object"]
+    m_objects = []
+    for m_name in list(m_names):
+        m_obj = doc.getObject(m_name)
+        if m_obj is None:
+            # Deleted without notification (undo...)
+            unregister_name(doc.Name, m_name)
+        else:
+            m_objects.append(m_obj)
+    return m_objects
+
+
+def unregister_name(doc_name, name):
+    """ Remove the object called name of document doc_name from the
+    registry.
+    """
+    m_doc = M_REGISTRY.get(doc_name)
+    if m_doc is None:
+        return
+    m_old = m_doc["object"].pop(name, None)
+    if m_old is not None:
+        m_doc["class"][m_old[0]].pop(name, None)
+        m_doc["mode"][m_old[1]].pop(name, None)
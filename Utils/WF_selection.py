@@ -5,6 +5,8 @@ import Part
 import WF
 from WF_print import print_msg
 import WF_geometry as geom
+from WF_cache import getSubShape
+from WF_kernels import SpatialHash
 if App.GuiUp:
     import FreeCADGui as Gui
 
@@ -108,6 +110,56 @@ def selection_debug(m_parent, m_name, m_i, m_type):
         print_msg("   m_i = " + str(m_i))
 
 
+def edgeKey(edge, points):
+    """ Return a hashable key of an edge, the same for all edges with
+    the same geometry whatever their orientation :
+    (curve type, sorted end point indexes, middle point index).
+
+    The points are indexed by the SpatialHash points, so points within
+    tolerance get the same index even across grid cells.
+    The middle point is used to separate closed edges (circles...) or
+    edges with same ends but different shapes (arcs...).
+    """
+    m_ends = sorted((points.insert(tuple(edge.Vertexes[0].Point)),
+                     points.insert(tuple(edge.Vertexes[-1].Point))))
+    m_middle = edge.valueAt(edge.FirstParameter +
+                            (edge.LastParameter - edge.FirstParameter) / 2.0)
+    m_type = type(edge.Curve).__name__ if hasattr(edge, 'Curve') else ""
+    return (m_type, tuple(m_ends), points.insert(tuple(m_middle)))
+
+
+def uniqueEdges(edge_list):
+    """ Return the list of [obj, "EdgeN"] without the edges with the same
+    geometry than a previous one (ie: edges shared by adjacent faces),
+    keeping the original order.
+    """
+    m_points = SpatialHash(WF.tolerance())
+    m_index = {}
+    m_result = []
+    for m_item in edge_list:
+        m_n = re.sub('[^0-9]', '', m_item[1])
+        try:
+            m_edge = getSubShape(m_item[0], "Edge", int(m_n))
+            m_key = edgeKey(m_edge, m_points)
+        except Exception:
+            # Not able to get the geometry, keep it as is
+            m_result.append(m_item)
+            continue
+        if m_key in m_index:
+            if M_DEBUG:
+                print("Duplicate edge : " + str(m_item) +
+                      " of " + str(m_index[m_key]))
+            continue
+        m_index[m_key] = m_item
+        m_result.append(m_item)
+
+    if WF.verbose() and len(m_result) != len(edge_list):
+        m_msg = str(len(edge_list) - len(m_result))
+        m_msg += " duplicate edge(s) removed"
+        print_msg(m_msg)
+    return m_result
+
+
 class Selection():
 
     def __init__(self, Gui_Selection):
@@ -478,7 +530,8 @@ class Selection():
         return (0, None)
 
     def get_segmentsWithNames(self,
-                              get_from=["Segments"]
+                              get_from=["Segments"],
+                              keep_duplicates=False
                               ):
         """ Return all Segments found in Selection object.
 
@@ -497,6 +550,9 @@ class Selection():
                     "Segments", "Curves",
                     "Planes",  "Shells",
                     "Objects", "Sets"
+        *keep_duplicates* : (Boolean, Optional, default=False)
+                    if False the Segments shared by several selected
+                    entities (ie: adjacent Faces) are returned only once.
 
         Examples
         -------
@@ -521,7 +577,7 @@ class Selection():
             for m_f, m_l in zip(self.__selectedWires,
                                 self.__selectedWiresNames):
                 if hasattr(m_f.Shape, 'Edges'):
-                    for index, m_e in enumerate(m_f.Shape.Edges, 0):
+                    for index, m_e in enumerate(m_f.Shape.Edges, 1):
                         m_sel_items.append([m_f, "Edge" + str(index)])
 
         # Managing Faces
@@ -529,7 +585,7 @@ class Selection():
             for m_f, m_l in zip(self.__selectedFaces,
                                 self.__selectedFacesNames):
                 if hasattr(m_f.Shape, 'Edges'):
-                    for index, m_e in enumerate(m_f.Shape.Edges, 0):
+                    for index, m_e in enumerate(m_f.Shape.Edges, 1):
                         m_sel_items.append([m_f, "Edge" + str(index)])
 #                 if not m_f.HasSubObjects:
 #                     if hasattr(m_f.Shape, 'Edges'):
@@ -548,11 +604,14 @@ class Selection():
                                 self.__selectedShellsNames):
                 print(m_f)
                 if hasattr(m_f.Shape, 'Edges'):
-                    for index, m_e in enumerate(m_f.Shape.Edges, 0):
+                    for index, m_e in enumerate(m_f.Shape.Edges, 1):
                         m_sel_items.append([m_f, "Edge" + str(index)])
         # Managing Solids
         # Managing Compounds
 
+        if not keep_duplicates:
+            m_sel_items = uniqueEdges(m_sel_items)
+
         if WF.verbose():
             print_msg("number_of_edges = " + str(len(m_sel_items)))
             print_msg("edge_list = " + str(m_sel_items))
@@ -565,8 +624,64 @@ class Selection():
     def get_curvesWithNames(self):
         pass
 
-    def get_planesWithNames(self):
-        pass
+    def get_planesWithNames(self,
+                            get_from=["Planes"]
+                            ):
+        """ Return all Planes found in Selection object.
+
+        Return
+        ----------
+        A tuple : (Number, Selected_Planes)
+        Selected_Planes as a list of [obj.Object, Name]
+
+        (0, None) if no Plane detected
+
+        Parameters
+        -------
+        *get_from* : (List of string, Optional, default=["Planes"]
+                    A list of object to look into.
+                    can be :
+                    "Planes",  "Shells",
+                    "Objects", "Sets"
+
+        Examples
+        -------
+        """
+        if M_DEBUG:
+            print("\nrunning Selection.get_planesWithNames !")
+            print("get_from=" + str(get_from))
+        if self.numberOfEntities == 0:
+            return (0, None)
+
+        m_sel_items = []
+
+        # Managing Vertexes : Not valid
+        # Managing Edges : Not valid
+        # Managing Wires : Not valid
+        # Managing Faces
+        if self.__numberOfFaces != 0 and "Planes" in get_from:
+            for m_f, m_l in zip(self.__selectedFaces,
+                                self.__selectedFacesNames):
+                m_sel_items.append([m_f, m_l])
+
+        # Managing Shells
+        if self.__numberOfShells != 0 and "Shells" in get_from:
+            for m_f, m_l in zip(self.__selectedShells,
+                                self.__selectedShellsNames):
+                if hasattr(m_f.Shape, 'Faces'):
+                    for index, m_e in enumerate(m_f.Shape.Faces, 1):
+                        m_sel_items.append([m_f, "Face" + str(index)])
+        # Managing Solids
+        # Managing Compounds
+
+        if WF.verbose():
+            print_msg("number_of_planes = " + str(len(m_sel_items)))
+            print_msg("plane_list = " + str(m_sel_items))
+
+        if len(m_sel_items) != 0:
+            return (len(m_sel_items), m_sel_items)
+
+        return (0, None)
 
     def get_shellsWithNames(self):
         pass
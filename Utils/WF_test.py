@@ -8,8 +8,12 @@
 Set of functions to use for tests
 """
 import os
+import json
+import time
+import zipfile
 import FreeCAD as App
 import FreeCADGui as Gui
+import WF
 
 
 def saveImage(m_image):
@@ -61,3 +65,99 @@ def imagesCmp(img1, img2):
             # The images are completely Equal
             return True
     return False
+
+
+def isOpenFile(m_file):
+    """ Return True if the FCStd file m_file is open in a document.
+    """
+    m_path = os.path.abspath(m_file)
+    for m_doc in App.listDocuments().values():
+        if m_doc.FileName and os.path.abspath(m_doc.FileName) == m_path:
+            return True
+    return False
+
+
+def measureDocument(m_file, compact):
+    """ Return a dictionary with the size of the file, the size of its
+    Document.xml and the time (in s) to open it.
+    The file must not be open already (the open would not read it).
+
+    Parameters
+    -------
+    *m_file* : (String, Mandatory) path of the FCStd file
+    *compact* : (Boolean, Mandatory) the file stores compact results.
+                The compact results preference is set to this value
+                while opening, so the features are not converted on
+                restore and the open time is the one of the file format.
+    """
+    if isOpenFile(m_file):
+        raise Exception("{0:s} is already open !".format(m_file))
+    m_measure = {"file": os.path.getsize(m_file)}
+    with zipfile.ZipFile(m_file) as m_zip:
+        m_measure["Document.xml"] = m_zip.getinfo("Document.xml").file_size
+    m_preference = WF.compactResults()
+    WF.set_compactResults(compact)
+    try:
+        m_start = time.time()
+        m_doc = App.openDocument(m_file)
+        m_measure["open"] = time.time() - m_start
+        App.closeDocument(m_doc.Name)
+    finally:
+        WF.set_compactResults(m_preference)
+    return m_measure
+
+
+def compareResultsStorage(doc_name, m_dir):
+    """ Compare file size and open time of a document with X, Y, Z float
+    results and with compact results (one vector property).
+    The document doc_name is left untouched : a copy is saved into m_dir,
+    opened and its features converted to compact results (see
+    WF_Object.migrateResults) then saved as a second file. Each file is
+    measured by a fresh open.
+    The measures are printed and stored into m_dir as JSON
+    (doc_name + "_storage.json").
+
+    Return a tuple (measure with floats, measure compact) as given by
+    measureDocument.
+    """
+    m_doc = App.getDocument(doc_name)
+    m_float_file = os.path.join(m_dir, doc_name + "_float.FCStd")
+    m_compact_file = os.path.join(m_dir, doc_name + "_compact.FCStd")
+    m_report_file = os.path.join(m_dir, doc_name + "_storage.json")
+
+    m_doc.saveCopy(m_float_file)
+
+    # Convert a copy : no conversion on restore, done below
+    m_preference = WF.compactResults()
+    WF.set_compactResults(False)
+    try:
+        m_copy = App.openDocument(m_float_file)
+    finally:
+        WF.set_compactResults(m_preference)
+    try:
+        m_count = 0
+        for m_obj in m_copy.Objects:
+            m_proxy = getattr(m_obj, "Proxy", None)
+            if not hasattr(m_proxy, "migrateResults"):
+                continue
+            if m_proxy.isCompact(m_obj):
+                raise Exception("{0:s} has already compact results !".format(
+                    m_obj.Label))
+            if m_proxy.migrateResults(m_obj):
+                m_count += 1
+        m_copy.saveAs(m_compact_file)
+    finally:
+        App.closeDocument(m_copy.Name)
+
+    m_float = measureDocument(m_float_file, False)
+    m_compact = measureDocument(m_compact_file, True)
+    for m_key in ("file", "Document.xml", "open"):
+        print("{0:s} : float {1} / compact {2}".format(m_key,
+                                                       m_float[m_key],
+                                                       m_compact[m_key]))
+    with open(m_report_file, "w") as m_report:
+        json.dump({"document": doc_name,
+                   "features": m_count,
+                   "float": m_float,
+                   "compact": m_compact}, m_report, indent=2)
+    return (m_float, m_compact)
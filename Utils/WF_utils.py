@@ -43,3 +43,129 @@ def linkSubList_convertToOldStyle(references):
             # old style references, no conversion required
             result.append(tup)
     return result
+
+
+def shapeVersion(obj):
+    """ Return the version of the Shape of obj : the Shape itself.
+    Keeping it holds its TShape alive, so the version can not be
+    confused with a later Shape built at the same address (as
+    Shape.hashCode() could). Compare versions with isSameVersion.
+    None if obj has no Shape.
+    """
+    if not hasattr(obj, 'Shape'):
+        return None
+    return obj.Shape
+
+
+def isSameVersion(version_a, version_b):
+    """ Return True if the 2 versions (see shapeVersion) are the same
+    Shape (same TShape, Location and Orientation).
+    """
+    if version_a is None or version_b is None:
+        return version_a is version_b
+    return version_a.isEqual(version_b)
+
+
+def linkSub_parse(sub):
+    """ Return the type and the index of a sub element name.
+
+    input: 'Edge12'
+    output: ('Edge', 12)
+    ('', 0) for the whole shape.
+    """
+    m_type = sub.rstrip('0123456789')
+    m_digits = sub[len(m_type):]
+    return (m_type, int(m_digits) if m_digits else 0)
+
+
+def subShape(shape, sub_type, index):
+    """ Return the sub element of shape of type sub_type
+    ('Vertex', 'Edge', 'Face'...) and index (from 1).
+    The whole shape if sub_type is ''.
+    """
+    if sub_type == 'Vertex':
+        return shape.Vertexes[index - 1]
+    if sub_type == 'Edge':
+        return shape.Edges[index - 1]
+    if sub_type == 'Face':
+        return shape.Faces[index - 1]
+    if sub_type == '':
+        return shape
+    return shape.getElement(sub_type + str(index))
+
+
+def linkedObjects(obj):
+    """ Return the list of the objects obj links to through its link
+    properties (Link, LinkSub, LinkSubList...).
+    """
+    m_objects = []
+    for m_prop in obj.PropertiesList:
+        m_type = obj.getTypeIdOfProperty(m_prop)
+        if "Link" not in m_type:
+            continue
+        m_value = getattr(obj, m_prop)
+        if m_value is None:
+            continue
+        if "LinkSubList" in m_type or "LinkList" in m_type:
+            m_links = [m_link[0] if isinstance(m_link, (list, tuple)) else m_link
+                       for m_link in m_value]
+        elif isinstance(m_value, (list, tuple)):
+            m_links = [m_value[0]]
+        else:
+            m_links = [m_value]
+        for m_link in m_links:
+            if m_link is not None and m_link not in m_objects:
+                m_objects.append(m_link)
+    return m_objects
+
+
+def dependencyClosure(objs):
+    """ Return the objects of objs followed by all the objects they depend
+    on, directly or not (through their OutList).
+    """
+    m_closure = list(objs)
+    m_seen = set(m_obj.Name for m_obj in m_closure)
+    m_index = 0
+    while m_index < len(m_closure):
+        for m_parent in m_closure[m_index].OutList:
+            if m_parent.Name not in m_seen:
+                m_seen.add(m_parent.Name)
+                m_closure.append(m_parent)
+        m_index += 1
+    return m_closure
+
+
+def sortByDependencies(objs, parents=linkedObjects):
+    """ Return the objects of objs sorted so that each object comes after
+    the objects of objs it links to (topological order).
+    Objects in a dependency cycle are given at the end in their original
+    order.
+
+    Parameters
+    -------
+    *objs* : (list of document objects, Mandatory)
+    *parents* : (function, Optional, default=linkedObjects)
+                return the objects an object depends on
+    """
+    m_names = [m_obj.Name for m_obj in objs]
+    m_by_name = dict(zip(m_names, objs))
+    m_parents = {}
+    m_children = {m_name: [] for m_name in m_names}
+    for m_obj in objs:
+        m_parents[m_obj.Name] = set(m_link.Name for m_link in parents(m_obj)
+                                    if m_link.Name in m_by_name and m_link.Name != m_obj.Name)
+        for m_parent in m_parents[m_obj.Name]:
+            m_children[m_parent].append(m_obj.Name)
+
+    m_ready = [m_name for m_name in m_names if not m_parents[m_name]]
+    m_sorted = []
+    while m_ready:
+        m_name = m_ready.pop(0)
+        m_sorted.append(m_name)
+        for m_child in m_children[m_name]:
+            m_parents[m_child].discard(m_name)
+            if not m_parents[m_child]:
+                m_ready.append(m_child)
+    m_done = set(m_sorted)
+    m_sorted += [m_name for m_name in m_names if m_name not in m_done]
+    return [m_by_name[m_name] for m_name in m_sorted]
@@ -57,9 +57,98 @@ if not sys.path.__contains__(str(PATH_WF_UTILS)):
     sys.path.append(str(PATH_WF_UI))
 
 
+M_PARAM_PATH = "User parameter:BaseApp/Preferences/Mod/WF"
+# Values of the WF parameters as returned by the accessors
+# (verbose(), tolerance()...), loaded once and kept up to date by
+# ParamObserver
+# {parameter name: value}
+M_PARAMS = {}
+# How to get each cached value
+# {parameter name: (default, conversion)}
+M_PARAM_READERS = {"verbose": (False, None),
+                   "timeout": ("15", int),
+                   "release": (None, None),
+                   "parametric": (None, None),
+                   "pointSize": ("5.0", float),
+                   "lineThickness": ("5.0", float),
+                   "linePointSize": ("5.0", float),
+                   "closePolyline": (False, None),
+                   "tolerance": ("1e-12", float),
+                   "compactResults": (False, None),
+                   }
+
+
+class ParamObserver():
+    """ Forget the cached value of a WF parameter when it changes
+    (ie: from the Preferences dialog).
+    """
+
+    def OnChange(self, grp, param):
+        M_PARAMS.pop(param, None)
+
+
+M_PARAM_OBSERVER = None
+# The parameter group the observer is attached to : kept alive as the
+# observers are detached when the group is destroyed
+M_PARAM_GRP = None
+
+
+def attachParamObserver():
+    """ Attach the parameter observer to the WF parameters.
+    Without observer the parameters are not cached.
+    """
+    global M_PARAM_OBSERVER
+    global M_PARAM_GRP
+    if M_PARAM_OBSERVER is not None:
+        return True
+    try:
+        m_observer = ParamObserver()
+        M_PARAM_GRP = FreeCAD.ParamGet(M_PARAM_PATH)
+        M_PARAM_GRP.Attach(m_observer)
+        M_PARAM_OBSERVER = m_observer
+    except Exception:
+        M_PARAM_OBSERVER = None
+        M_PARAM_GRP = None
+    M_PARAMS.clear()
+    return M_PARAM_OBSERVER is not None
+
+
+def detachParamObserver():
+    """ Detach the parameter observer and clear the cached parameters.
+    """
+    global M_PARAM_OBSERVER
+    global M_PARAM_GRP
+    if M_PARAM_OBSERVER is not None:
+        try:
+            M_PARAM_GRP.Detach(M_PARAM_OBSERVER)
+        except Exception:
+            pass
+    M_PARAM_OBSERVER = None
+    M_PARAM_GRP = None
+    M_PARAMS.clear()
+
+
+def cachedParam(param):
+    """ Returns the value of a WF parameter from the cache
+    (read and converted only once).
+    """
+    try:
+        return M_PARAMS[param]
+    except KeyError:
+        pass
+    m_default, m_conversion = M_PARAM_READERS[param]
+    m_value = getParam(param, m_default)
+    if m_conversion is not None:
+        m_value = m_conversion(m_value)
+    if M_PARAM_OBSERVER is not None:
+        M_PARAMS[param] = m_value
+    return m_value
+
+
 def getParamType(param):
     if param in ["verbose",
-                 "closePolyline", ]:
+                 "closePolyline",
+                 "compactResults", ]:
         return "bool"
     elif param in ["release", ]:
         return "string"
@@ -79,7 +168,7 @@ def getParamType(param):
 def getParam(param, default=None):
     """ Returns a WorkFeature parameter value from the current WF_config.
     """
-    p = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/WF")
+    p = FreeCAD.ParamGet(M_PARAM_PATH)
     t = getParamType(param)
     # print("getting param ",param, " of type ",t, " default: ",str(default))
     if t == "int":
@@ -109,7 +198,8 @@ def getParam(param, default=None):
 def setParam(param, value):
     """ Sets a WorkFeature parameter value with the given value.
     """
-    p = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/WF")
+    p = FreeCAD.ParamGet(M_PARAM_PATH)
+    M_PARAMS.pop(param, None)
     t = getParamType(param)
     if t == "int":
         p.SetInt(param, value)
@@ -126,13 +216,13 @@ def setParam(param, value):
 def verbose():
     """ Returns the verbose value from WF user settings
     """
-    return getParam("verbose", False)
+    return cachedParam("verbose")
 
 
 def timeout():
     """ Returns the timeout from WF user settings
     """
-    return int(getParam("timeout", "15"))
+    return cachedParam("timeout")
 
 
 def set_timeout(value):
@@ -144,7 +234,7 @@ def set_timeout(value):
 def release():
     """ Returns the release value from WF user settings
     """
-    return getParam("release", None)
+    return cachedParam("release")
 
 
 def set_release(value):
@@ -158,7 +248,7 @@ def parametric():
 
     m_parametric = ['Not','Interactive','Dynamic']
     """
-    return getParam("parametric", None)
+    return cachedParam("parametric")
 
 
 def set_parametric(value):
@@ -170,7 +260,7 @@ def set_parametric(value):
 def pointSize():
     """ Returns the point size from WF user settings
     """
-    return float(getParam("pointSize", "5.0"))
+    return cachedParam("pointSize")
 
 
 def set_pointSize(value):
@@ -182,7 +272,7 @@ def set_pointSize(value):
 def lineThickness():
     """ Returns the line thickness from WF user settings
     """
-    return float(getParam("lineThickness", "5.0"))
+    return cachedParam("lineThickness")
 
 
 def set_lineThickness(value):
@@ -194,7 +284,7 @@ def set_lineThickness(value):
 def linePointSize():
     """ Returns the line point size from WF user settings
     """
-    return float(getParam("linePointSize", "5.0"))
+    return cachedParam("linePointSize")
 
 
 def set_linelinePointSize(value):
@@ -206,13 +296,13 @@ def set_linelinePointSize(value):
 def closePolyline():
     """ Returns the close polyline value from WF user settings
     """
-    return getParam("closePolyline", False)
+    return cachedParam("closePolyline")
 
 
 def tolerance():
     """ Returns the tolerance from WF user settings
     """
-    return float(getParam("tolerance", "1e-12"))
+    return cachedParam("tolerance")
 
 
 def set_tolerance(value):
@@ -221,6 +311,19 @@ def set_tolerance(value):
     setParam("tolerance", value)
 
 
+def compactResults():
+    """ Returns True if the results of future features (X, Y, Z...)
+    are stored as one vector property (see WF_Objects_base)
+    """
+    return cachedParam("compactResults")
+
+
+def set_compactResults(value):
+    """ Sets the compact results storage to WF user settings
+    """
+    setParam("compactResults", value)
+
+
 def typecheck(args_and_types, name="?"):
     """ Checks arguments types.
 
@@ -243,3 +346,16 @@ def touch(selfobj):
         selfobj.Parametric = 'Dynamic'
         selfobj.touch()
         selfobj.Parametric = 'Not'
+
+
+attachParamObserver()
+
+
+def __getattr__(name):
+    """ Load the headless scripting API on first use : WF.api
+    (see WF_api).
+    """
+    if name == "api":
+        import WF_api
+        return WF_api
+    raise AttributeError("module 'WF' has no attribute '" + str(name) + "'")
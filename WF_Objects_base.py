@@ -31,8 +31,18 @@
 """
 import os
 import sys
+import time
+from contextlib import contextmanager
 import FreeCAD as App
 import WF
+from WF_print import printError_msg
+from WF_utils import linkSubList_convertToOldStyle
+from WF_utils import shapeVersion, isSameVersion
+from WF_utils import linkSub_parse
+from WF_cache import getSubShape
+from WF_geometry import propertiesPoint, propertiesLine, propertiesPlane
+from WF_profiler import profiled
+import WF_registry
 
 __title__ = "Object WF_Objects_Base"
 __author__ = "Rentlau_64"
@@ -49,10 +59,112 @@ WF_PLIST = WF_ParametricList
 WF_ColorList = [(0.45, 0.30, 0.00), (0.70, 0.47, 0.00), (1.00, 0.67, 0.00)]
 WF_CLIST = WF_ColorList
 
+# Number of onChanged calls handled / deferred by a bulk update
+M_ONCHANGED_CALLS = 0
+M_ONCHANGED_DEFERRED = 0
+
+
+def getOnChangedCount():
+    """ Return a tuple (handled, deferred) with the number of onChanged
+    calls of WF features handled or deferred by a bulk update since last
+    reset.
+    """
+    return (M_ONCHANGED_CALLS, M_ONCHANGED_DEFERRED)
+
+
+def resetOnChangedCount():
+    """ Reset the onChanged counters (see getOnChangedCount).
+    """
+    global M_ONCHANGED_CALLS
+    global M_ONCHANGED_DEFERRED
+    M_ONCHANGED_CALLS = 0
+    M_ONCHANGED_DEFERRED = 0
+
+
+# Number of execute calls run / delayed by a single execute
+M_EXECUTE_CALLS = 0
+M_EXECUTE_DELAYED = 0
+
+
+def getExecuteCount():
+    """ Return a tuple (run, delayed) with the number of execute calls of
+    WF features run or delayed by a single execute since last reset.
+    """
+    return (M_EXECUTE_CALLS, M_EXECUTE_DELAYED)
+
+
+def resetExecuteCount():
+    """ Reset the execute counters (see getExecuteCount).
+    """
+    global M_EXECUTE_CALLS
+    global M_EXECUTE_DELAYED
+    M_EXECUTE_CALLS = 0
+    M_EXECUTE_DELAYED = 0
+
+
+# Functions called at the end of each stage of the execute of the features
+# hook(selfobj, stage, duration)
+# stage is "resolve", "compute", "shape" or "style"
+M_STAGE_HOOKS = []
+# Running stages [stage, start time, time spent in nested stages]
+M_STAGES = []
+M_CLOCK = getattr(time, 'perf_counter', time.time)
+
+
+def addStageHook(hook):
+    """ Add a function hook(selfobj, stage, duration) called at the end
+    of each stage of the execute of the features.
+    duration (in s) does not include the nested stages (ie: the link
+    resolutions done during "compute" are given to "resolve").
+    """
+    if hook not in M_STAGE_HOOKS:
+        M_STAGE_HOOKS.append(hook)
+
+
+def removeStageHook(hook):
+    """ Remove a function added by addStageHook.
+    """
+    if hook in M_STAGE_HOOKS:
+        M_STAGE_HOOKS.remove(hook)
+
+
+@contextmanager
+def executionStage(selfobj, stage):
+    """ Context timing one stage of the execute of selfobj.
+    Nothing is measured if there is no stage hook.
+    """
+    if not M_STAGE_HOOKS:
+        yield
+        return
+    m_stage = [stage, M_CLOCK(), 0.0]
+    M_STAGES.append(m_stage)
+    try:
+        yield
+    finally:
+        M_STAGES.pop()
+        m_duration = M_CLOCK() - m_stage[1]
+        if M_STAGES:
+            M_STAGES[-1][2] += m_duration
+        for m_hook in list(M_STAGE_HOOKS):
+            m_hook(selfobj, stage, m_duration - m_stage[2])
+
 
 class WF_Object():
     """ Abstract class of Work Feature Object.
     """
+    # Properties written by execute (results, not inputs)
+    outputs = []
+    # Vector property replacing the outputs when results are compact
+    # (see WF.compactResults)
+    compact_output = "Coordinates"
+    # Properties needed before any execute
+    properties_list = []
+    # Input properties of the feature (links and parameters) : the execute
+    # is skipped if they did not change (see fingerprint)
+    inputs = []
+    # Title of the error messages
+    macro = "Work Feature"
+
     def __init__(self, selfobj):
         # if M_DEBUG:
         #     print("running WF_Object.__init__ !")
@@ -98,40 +210,488 @@ regarding parent changes.
         # 2 -- hidden
         selfobj.setEditorMode("Parametric", 0)
         self.color = WF_CLIST[WF_PLIST.index(selfobj.Parametric)]
+        self.register(selfobj)
+
+    def register(self, selfobj):
+        """ Add or update the feature into the WF registry
+        (see WF_registry).
+        Features of the 2018 version (no Parametric property) are
+        registered as Dynamic.
+        """
+        m_mode = 'Dynamic'
+        # To be compatible with previous version 2018
+        if 'Parametric' in selfobj.PropertiesList:
+            m_mode = str(selfobj.Parametric)
+        WF_registry.register(selfobj, self.__class__.__name__, m_mode)
+
+    def __getstate__(self):
+        """ Return the data to save into the document.
+        Attributes starting with '_' are run time caches and not saved.
+        """
+        return {m_key: m_value for m_key, m_value in self.__dict__.items()
+                if not m_key.startswith('_')}
+
+    def __setstate__(self, state):
+        if state:
+            self.__dict__.update(state)
+
+    def fingerprint(self, selfobj):
+        """ Return the inputs of the feature (see inputs) : the values of
+        the parameters (IndexPart, NumberLinePart, Extension...) and, for
+        the links, the linked sub element names and the Shape versions of
+        the linked objects (see shapeVersion).
+        Compare it with the last execute with isMemorized.
+        Return None if the feature has no inputs or if they can not be
+        resolved.
+        """
+        if not self.inputs:
+            return None
+        m_values = []
+        m_versions = {}
+        try:
+            for m_prop in self.inputs:
+                m_type = selfobj.getTypeIdOfProperty(m_prop)
+                if "LinkSubList" in m_type or "LinkList" in m_type:
+                    m_references = self.resolveLinks(selfobj, m_prop)
+                elif "Link" in m_type:
+                    m_reference = self.resolveLink(selfobj, m_prop)
+                    m_references = [] if m_reference is None else [m_reference]
+                else:
+                    m_values.append((m_prop, repr(getattr(selfobj, m_prop))))
+                    continue
+                m_names = []
+                for m_obj, m_sub_type, m_index in m_references:
+                    m_key = (m_obj.Document.Name, m_obj.Name)
+                    if m_key not in m_versions:
+                        m_versions[m_key] = shapeVersion(m_obj)
+                    m_names.append((m_key, m_sub_type, m_index))
+                m_values.append((m_prop, tuple(m_names)))
+            return (tuple(m_values), m_versions)
+        except Exception:
+            return None
+
+    def inputSize(self, selfobj):
+        """ Return the number of sub elements linked by the feature.
+        """
+        m_size = 0
+        for m_prop in selfobj.PropertiesList:
+            m_type = selfobj.getTypeIdOfProperty(m_prop)
+            if "Link" not in m_type:
+                continue
+            m_value = getattr(selfobj, m_prop)
+            if m_value is None:
+                continue
+            if "LinkSubList" in m_type or "LinkList" in m_type:
+                m_size += len(linkSubList_convertToOldStyle(m_value))
+            else:
+                m_size += 1
+        return m_size
+
+    def isMemorized(self, fingerprint):
+        """ Return True if fingerprint (see fingerprint) matches the last
+        successful execute, meaning the Shape and outputs are already up
+        to date.
+        """
+        if fingerprint is None:
+            return False
+        m_memorized = getattr(self, '_fingerprint', None)
+        if m_memorized is None or m_memorized[0] != fingerprint[0]:
+            return False
+        m_versions = m_memorized[1]
+        if m_versions.keys() != fingerprint[1].keys():
+            return False
+        for m_key, m_version in fingerprint[1].items():
+            if not isSameVersion(m_versions[m_key], m_version):
+                return False
+        return True
+
+    def isStale(self, selfobj):
+        """ Return True if the input properties of the feature (see inputs)
+        changed since its last successful execute. The parametric behavior
+        is not an input.
+        """
+        return not self.isMemorized(self.fingerprint(selfobj))
+
+    def memorize(self, fingerprint):
+        """ Store the fingerprint of a successful execute.
+        """
+        self._fingerprint = fingerprint
+
+    def deferChange(self, prop):
+        """ Return True if the change of prop must not be handled now
+        because a bulk update is running (see bulkUpdate).
+        Called first in onChanged.
+        """
+        global M_ONCHANGED_CALLS
+        global M_ONCHANGED_DEFERRED
+        m_pending = getattr(self, '_pending', None)
+        if m_pending is not None:
+            if prop not in m_pending:
+                m_pending.append(prop)
+            M_ONCHANGED_DEFERRED += 1
+            return True
+        M_ONCHANGED_CALLS += 1
+        return False
+
+    @contextmanager
+    def bulkUpdate(self, selfobj):
+        """ Context in which property changes are not handled by onChanged.
+        On exit, onChanged is called once for each changed property
+        except the Shape and the outputs.
+        """
+        if getattr(self, '_pending', None) is not None:
+            # Already in a bulk update
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+        finally:
+            m_props = self._pending
+            self._pending = None
+        for m_prop in m_props:
+            if m_prop == "Shape" or self.isOutput(m_prop):
+                continue
+            selfobj.Proxy.onChanged(selfobj, m_prop)
+
+    @contextmanager
+    def singleExecute(self, selfobj):
+        """ Context in which the execute calls are not run.
+        On exit, execute is run once.
+        """
+        if getattr(self, '_delayed', None) is not None:
+            # Already in a single execute
+            yield
+            return
+        self._delayed = 0
+        try:
+            yield
+        finally:
+            self._delayed = None
+        self.execute(selfobj)
+
+    def writeResults(self, selfobj, shape, *points):
+        """ Write the Shape and the outputs of the feature in one bulk
+        update.
+
+        Parameters
+        ----------
+        shape : the new Shape of the feature.
+        points : the Vectors giving the outputs (X, Y, Z of each point
+            in the order of outputs).
+        """
+        with self.bulkUpdate(selfobj):
+            selfobj.Shape = shape
+            if self.isCompact(selfobj):
+                if len(self.outputs) == 3:
+                    setattr(selfobj, self.compact_output, points[0])
+                else:
+                    setattr(selfobj, self.compact_output, list(points))
+                return
+            for m_i, m_point in enumerate(points):
+                m_x, m_y, m_z = self.outputs[3 * m_i:3 * m_i + 3]
+                setattr(selfobj, m_x, float(m_point.x))
+                setattr(selfobj, m_y, float(m_point.y))
+                setattr(selfobj, m_z, float(m_point.z))
+
+    def resolveLink(self, selfobj, prop):
+        """ Return (object, type, index) of the sub element the LinkSub
+        property prop points to, ie: (Box, 'Edge', 3).
+        None if the link is empty.
+        The sub element name is parsed once and kept until the property
+        changes (see onChanged).
+        """
+        m_links = self.__dict__.setdefault('_links', {})
+        try:
+            return m_links[prop]
+        except KeyError:
+            pass
+        m_link = getattr(selfobj, prop)
+        m_reference = None
+        if m_link is not None:
+            m_sub = m_link[1]
+            if isinstance(m_sub, (list, tuple)):
+                m_sub = m_sub[0] if len(m_sub) != 0 else ''
+            m_type, m_index = linkSub_parse(str(m_sub))
+            m_reference = (m_link[0], m_type, m_index)
+        m_links[prop] = m_reference
+        return m_reference
+
+    def resolveLinks(self, selfobj, prop):
+        """ Return the list of (object, type, index) of the sub elements
+        the LinkSubList property prop points to (see resolveLink).
+        """
+        m_links = self.__dict__.setdefault('_links', {})
+        try:
+            return m_links[prop]
+        except KeyError:
+            pass
+        m_references = []
+        for m_obj, m_sub in linkSubList_convertToOldStyle(getattr(selfobj, prop)):
+            m_type, m_index = linkSub_parse(str(m_sub))
+            m_references.append((m_obj, m_type, m_index))
+        m_links[prop] = m_references
+        return m_references
+
+    def linkedShape(self, selfobj, prop):
+        """ Return the sub shape (Vertex, Edge, Face...) the LinkSub
+        property prop points to. None if the link is empty.
+        """
+        with executionStage(selfobj, "resolve"):
+            m_reference = self.resolveLink(selfobj, prop)
+            if m_reference is None:
+                return None
+            m_obj, m_type, m_index = m_reference
+            return getSubShape(m_obj, m_type, m_index)
+
+    def linkedShapes(self, selfobj, prop):
+        """ Return the list of sub shapes the LinkSubList property prop
+        points to.
+        """
+        with executionStage(selfobj, "resolve"):
+            return [getSubShape(m_obj, m_type, m_index)
+                    for m_obj, m_type, m_index in self.resolveLinks(selfobj, prop)]
+
+    def isOutput(self, prop):
+        """ Return True if prop is a result of the feature.
+        """
+        return prop in self.outputs or prop == self.compact_output
+
+    def isCompact(self, selfobj):
+        """ Return True if the results of selfobj are stored as one
+        vector property.
+        """
+        return self.compact_output in selfobj.PropertiesList
+
+    def addCompactOutputs(self, selfobj, name):
+        """ Add one vector (point) or vector list (line, plane) property
+        in place of the X, Y, Z float outputs.
+        """
+        if len(self.outputs) == 3:
+            m_type = "App::PropertyVector"
+            m_tooltip = "Coordinates of the point"
+        else:
+            m_type = "App::PropertyVectorList"
+            m_tooltip = "Coordinates of the points"
+        selfobj.addProperty(m_type,
+                            self.compact_output,
+                            name,
+                            m_tooltip)
+        selfobj.setEditorMode(self.compact_output, 1)
+
+    def getResults(self, selfobj):
+        """ Return the list of result points of the feature
+        whatever the storage (compact or not).
+        """
+        if self.isCompact(selfobj):
+            m_value = getattr(selfobj, self.compact_output)
+            if len(self.outputs) == 3:
+                return [m_value]
+            return list(m_value)
+        m_points = []
+        for m_i in range(len(self.outputs) // 3):
+            m_x, m_y, m_z = self.outputs[3 * m_i:3 * m_i + 3]
+            m_points.append(App.Vector(getattr(selfobj, m_x),
+                                       getattr(selfobj, m_y),
+                                       getattr(selfobj, m_z)))
+        return m_points
+
+    def migrateResults(self, selfobj):
+        """ Convert the X, Y, Z float outputs of a feature (created by
+        a previous version or without compact results) into one vector
+        property.
+        Return True if the feature was converted.
+        """
+        if self.isCompact(selfobj) or not self.outputs:
+            return False
+        if self.outputs[0] not in selfobj.PropertiesList:
+            return False
+        m_points = self.getResults(selfobj)
+        m_group = selfobj.getGroupOfProperty(self.outputs[0])
+        with self.bulkUpdate(selfobj):
+            for m_prop in self.outputs:
+                selfobj.removeProperty(m_prop)
+            self.addCompactOutputs(selfobj, m_group)
+            if len(self.outputs) == 3:
+                setattr(selfobj, self.compact_output, m_points[0])
+            else:
+                setattr(selfobj, self.compact_output, m_points)
+        return True
+
+    def onDocumentRestored(self, selfobj):
+        """ Convert the outputs of the feature if compact results are
+        asked for.
+        Add the feature into the WF registry.
+        """
+        self.register(selfobj)
+        if not WF.compactResults():
+            return
+        try:
+            if self.migrateResults(selfobj) and WF.verbose():
+                m_msg = "Compact results for : " + str(selfobj.Label) + "\n"
+                App.Console.PrintMessage(m_msg)
+        except Exception as err:
+            App.Console.PrintError(str(err) + "\n")
 
     # this method is mandatory
-    def execute(self, selfobj):
-        # if M_DEBUG:
-        #     print("running WF_Object.execute !")
+    def execute(self, selfobj, force=False):
+        """ Doing a recomputation (see recompute).
+        Profiled when the profiler is on (see WF_profiler).
+        Nothing is done during a single execute (see singleExecute).
+        """
+        global M_EXECUTE_CALLS
+        global M_EXECUTE_DELAYED
+        if getattr(self, '_delayed', None) is not None:
+            self._delayed += 1
+            M_EXECUTE_DELAYED += 1
+            return
+        M_EXECUTE_CALLS += 1
+        with profiled(selfobj, "execute", self.inputSize):
+            self.recompute(selfobj, force)
+
+    def refresh(self, selfobj):
+        """ Update an Interactive or Not feature now, without changing its
+        parametric behavior. Nothing is done if its inputs did not change.
+        """
+        self.execute(selfobj, force=True)
+
+    def recompute(self, selfobj, force=False):
+        """ Same pipeline for all features :
+        - check the needed properties (properties_list) and the
+        parametric behavior (unless force);
+        - resolve the links (fingerprint), nothing to do if the inputs
+        did not change since last run;
+        - compute the Shape and the result points (compute);
+        - write the Shape and the outputs (writeResults);
+        - style the view (style).
+        Each stage is timed for the stage hooks (see addStageHook).
+        """
+        for m_property in self.properties_list:
+            if m_property not in selfobj.PropertiesList:
+                return
+
+        # To be compatible with previous version > 2019
+        if 'Parametric' in selfobj.PropertiesList:
+            # Create the object the first time regardless
+            # the parametric behavior
+            if selfobj.Parametric == 'Not' and self.created and not force:
+                return
+            if selfobj.Parametric == 'Interactive' and self.created and not force:
+                return
+        # To be compatible with previous version 2018
+        if 'parametric' in selfobj.PropertiesList:
+            if hasattr(self, 'execute_2018'):
+                self.execute_2018(selfobj)
+
+        # Nothing to do if inputs did not change since last run
+        with executionStage(selfobj, "resolve"):
+            m_fingerprint = self.fingerprint(selfobj)
+        if self.isMemorized(m_fingerprint):
+            return
+
+        try:
+            with executionStage(selfobj, "compute"):
+                m_result = self.compute(selfobj)
+            if m_result is None:
+                return
+            self.applyResult(selfobj, m_result, m_fingerprint)
+        except AttributeError as err:
+            print("AttributeError" + str(err))
+        except Exception as err:
+            printError_msg(err.args[0], title=self.macro)
+
+    def applyResult(self, selfobj, result, fingerprint):
+        """ Write the result of compute (Shape and outputs), style the
+        view and memorize the inputs the result was computed with.
+        Also used by the commands writing the results they computed at
+        once for several features (see WF_builder).
+
+        Parameters
+        -------
+        *result* : (Tuple, Mandatory) (shape, points) as given by compute
+        *fingerprint* : the inputs (see fingerprint)
+        """
+        m_shape, m_points = result
+        with executionStage(selfobj, "shape"):
+            self.writeResults(selfobj, m_shape, *m_points)
+        with executionStage(selfobj, "style"):
+            self.style(selfobj)
+        self.onComputed(selfobj, m_points)
+        # To be compatible with previous version 2018
+        if 'Parametric' in selfobj.PropertiesList:
+            self.created = True
+        self.memorize(fingerprint)
+
+    def compute(self, selfobj):
+        """ Return a tuple (shape, points) with the new Shape of the
+        feature and the list of the result points (Vectors) in the order
+        of outputs.
+        Return None if there is nothing to build.
+        To be implemented by the features.
+        """
+        return None
+
+    def style(self, selfobj):
+        """ Set the view properties (color, size...) of the feature.
+        """
+        pass
+
+    def onComputed(self, selfobj, points):
+        """ Do something once the feature is computed and styled.
+        """
         pass
 
     def onChanged(self, selfobj, prop):
+        """ Run when a property changes : handle the common properties
+        then the ones of the feature (see changed).
+        Nothing is done during a bulk update (see bulkUpdate).
+        Profiled when the profiler is on (see WF_profiler).
+        """
         # if M_DEBUG:
         #     print("running WF_Object.onChanged !")
+        if self.deferChange(prop):
+            return
 
-        # To be compatible with previous version 2018
-        if 'parametric' in selfobj.PropertiesList:
-            selfobj.setEditorMode("parametric", 1)
-
-        # App.Console.PrintMessage(str(sys._getframe().f_code.co_name))
-        if prop == "Parametric":
-            self.color = WF_CLIST[WF_PLIST.index(selfobj.Parametric)]
-            selfobj.Proxy.execute(selfobj)
-            if WF.verbose() != 0:
-                m_msg = "New parametric : " + str(selfobj.Parametric) + "\n"
-                App.Console.PrintMessage(m_msg)
-                m_msg = "New color : " + str(self.color) + "\n"
-                App.Console.PrintMessage(m_msg)
+        with profiled(selfobj, "onChanged"):
+            # Parsed references are no more valid
+            self.__dict__.get('_links', {}).pop(prop, None)
+
+            # To be compatible with previous version 2018
+            if 'parametric' in selfobj.PropertiesList:
+                selfobj.setEditorMode("parametric", 1)
+
+            # App.Console.PrintMessage(str(sys._getframe().f_code.co_name))
+            if prop == "Parametric":
+                self.color = WF_CLIST[WF_PLIST.index(selfobj.Parametric)]
+                self.register(selfobj)
+                selfobj.Proxy.execute(selfobj)
+                if WF.verbose() != 0:
+                    m_msg = "New parametric : " + str(selfobj.Parametric) + "\n"
+                    App.Console.PrintMessage(m_msg)
+                    m_msg = "New color : " + str(self.color) + "\n"
+                    App.Console.PrintMessage(m_msg)
+
+            self.changed(selfobj, prop)
+
+    def changed(self, selfobj, prop):
+        """ Do something when a property of the feature has changed.
+        To be implemented by the features.
+        """
+        pass
 
 
 class WF_Point(WF_Object):
     """ The Point WF object. """
+    outputs = ["X", "Y", "Z"]
 
     def __init__(self, selfobj, name):
         """ Add some custom properties to our Point WF object."""
         # if M_DEBUG:
         #     print("running WF_Point.__init__ !")
         WF_Object.__init__(self, selfobj)
+        if WF.compactResults():
+            self.addCompactOutputs(selfobj, name)
+            return
 
         selfobj.addProperty("App::PropertyFloat",
                             "X",
@@ -153,11 +713,9 @@ class WF_Point(WF_Object):
         selfobj.setEditorMode("Y", 1)
         selfobj.setEditorMode("Z", 1)
 
-    def execute(self, selfobj):
-        """ Do something when doing a recomputation, this method is mandatory!"""
-        # if M_DEBUG:
-        #     print("running WF_Point.execute !")
-        pass
+    def style(self, selfobj):
+        """ Set the view properties of the point."""
+        propertiesPoint(selfobj.Label, self.color)
 
     def onChanged(self, selfobj, prop):
         """ Do something when a property has changed!"""
@@ -166,13 +724,37 @@ class WF_Point(WF_Object):
         WF_Object.onChanged(self, selfobj, prop)
 
 
+class WF_PointArray(WF_Object):
+    """ The Point array WF object : many points into one object.
+    The Shape is a compound of the points and the result is one vector
+    list property.
+    """
+    outputs = []
+    compact_output = "Points"
+
+    def __init__(self, selfobj, name):
+        """ Add some custom properties to our Point array WF object."""
+        WF_Object.__init__(self, selfobj)
+        self.addCompactOutputs(selfobj, name)
+
+    def style(self, selfobj):
+        """ Set the view properties of the points."""
+        propertiesPoint(selfobj.Label, self.color)
+
+
 class WF_Line(WF_Object):
     """ The Line WF object. """
+    outputs = ["Point1_X", "Point1_Y", "Point1_Z",
+               "Point2_X", "Point2_Y", "Point2_Z"]
+
     # this method is mandatory
     def __init__(self, selfobj, name):
         # if M_DEBUG:
         #     print("running WF_Line.__init__ !")
         WF_Object.__init__(self, selfobj)
+        if WF.compactResults():
+            self.addCompactOutputs(selfobj, name)
+            return
         # Add some custom properties to our Line WF object.
         selfobj.addProperty("App::PropertyFloat",
                             "Point1_X",
@@ -209,11 +791,9 @@ class WF_Line(WF_Object):
         selfobj.setEditorMode("Point2_Y", 1)
         selfobj.setEditorMode("Point2_Z", 1)
 
-    # this method is mandatory
-    def execute(self, selfobj):
-        # if M_DEBUG:
-        #     print("running WF_Line.execute !")
-        pass
+    def style(self, selfobj):
+        """ Set the view properties of the line."""
+        propertiesLine(selfobj.Label, self.color)
 
     def onChanged(self, selfobj, prop):
         # if M_DEBUG:
@@ -221,13 +801,38 @@ class WF_Line(WF_Object):
         WF_Object.onChanged(self, selfobj, prop)
 
 
+class WF_LineArray(WF_Object):
+    """ The Line array WF object : many lines (polyline or separated
+    segments) into one object.
+    The result is one vector list property with the ends of the lines.
+    """
+    outputs = []
+    compact_output = "Points"
+
+    def __init__(self, selfobj, name):
+        """ Add some custom properties to our Line array WF object."""
+        WF_Object.__init__(self, selfobj)
+        self.addCompactOutputs(selfobj, name)
+
+    def style(self, selfobj):
+        """ Set the view properties of the lines."""
+        propertiesLine(selfobj.Label, self.color)
+
+
 class WF_Plane(WF_Object):
     """ The Plane WF object. """
+    outputs = ["Point1_X", "Point1_Y", "Point1_Z",
+               "Point2_X", "Point2_Y", "Point2_Z",
+               "Point3_X", "Point3_Y", "Point3_Z"]
+
     # this method is mandatory
     def __init__(self, selfobj, name):
         # if M_DEBUG:
         #     print("running WF_Plane.__init__ !")
         WF_Object.__init__(self, selfobj)
+        if WF.compactResults():
+            self.addCompactOutputs(selfobj, name)
+            return
         # Add some custom properties to our Line WF object.
         selfobj.addProperty("App::PropertyFloat",
                             "Point1_X",
@@ -278,11 +883,9 @@ class WF_Plane(WF_Object):
         selfobj.setEditorMode("Point3_Y", 1)
         selfobj.setEditorMode("Point3_Z", 1)
 
-    # this method is mandatory
-    def execute(self, selfobj):
-        # if M_DEBUG:
-        #     print("running WF_Plane.execute !")
-        pass
+    def style(self, selfobj):
+        """ Set the view properties of the plane."""
+        propertiesPlane(selfobj.Label, self.color)
 
     def onChanged(self, selfobj, prop):
         # if M_DEBUG:
@@ -61,9 +61,11 @@ try:
     from WF_selection import getSel
     from WF_print import printError_msg, print_msg, printError_msgWithTimer
     from WF_directory import createFolders, addObjectToGrp, createSubGroup
-    from WF_geometry import isEqualVectors, intersectPerpendicularLine, propertiesPoint
+    from WF_geometry import isEqualVectors, areEqualVectors, intersectPerpendicularLine, intersectPerpendicularLines, arrayToVector, propertiesPoint
     from WF_utils import *
+    from WF_cache import getSubShape
     from WF_command import Command
+    from WF_builder import bulkBuild
 except ImportError:
     print("ERROR: cannot load WF modules !")
     sys.exit(1)
@@ -147,6 +149,61 @@ def getDistanceLinePoint():
     return M_DISTANCELINEPOINT
 
 
+def computeFromEdgeAndPoints(edges_and_points, distance):
+    """ Compute at once the points at distance along the edges from the
+    projections of the points onto their edges.
+
+    Parameters
+    -------
+    *edges_and_points* : (List, Mandatory)
+            list of couples ([obj, "EdgeN"], [obj, "VertexN"]).
+    *distance* : (Float, Mandatory)
+            distance along the edge from the projection.
+
+    Return
+    -------
+    The list of tuples (edge, point, result) for the edges of not null
+    length; result is (shape, [vector]) as given by AlongLinePoint.compute.
+    """
+    m_ends_a = []
+    m_ends_b = []
+    m_points = []
+    for m_edge, m_vertex in edges_and_points:
+        m_n1 = re.sub('[^0-9]', '', m_edge[1])
+        m_n3 = re.sub('[^0-9]', '', m_vertex[1])
+        m_alongedge = getSubShape(m_edge[0], "Edge", int(m_n1))
+        m_ends_a.append(tuple(m_alongedge.valueAt(0.0)))
+        m_ends_b.append(tuple(m_alongedge.valueAt(m_alongedge.Length)))
+        m_points.append(tuple(getSubShape(m_vertex[0], "Vertex", int(m_n3)).Point))
+
+    if not m_points:
+        return []
+
+    m_equals = areEqualVectors(m_ends_a, m_ends_b)
+    m_projections, _, _ = intersectPerpendicularLines(m_ends_a,
+                                                      m_ends_b,
+                                                      m_points)
+    m_results = []
+    for m_couple, m_a, m_b, m_projection, m_equal in zip(edges_and_points,
+                                                         m_ends_a,
+                                                         m_ends_b,
+                                                         m_projections,
+                                                         m_equals):
+        if m_equal:
+            continue
+        vector_point = arrayToVector(m_projection)
+        if vector_point is None:
+            continue
+        if distance != 0.0:
+            vector_translate = App.Vector(*m_b) - App.Vector(*m_a)
+            vector_point = vector_point + vector_translate.normalize() * distance
+        m_edge, m_vertex = m_couple
+        m_results.append((m_edge, m_vertex,
+                          (Part.Point(vector_point).toShape(), [vector_point])))
+
+    return m_results
+
+
 class AlongLinePointPanel:
     """ The AlongLinePointPanel (GUI).
     """
@@ -214,6 +271,14 @@ def makeAlongLinePointFeature(group):
 class AlongLinePoint(WF_Point):
     """ The AlongLinePoint feature object.
     """
+    properties_list = ['AlongEdge',
+                       'Edge',
+                       'Point']
+    inputs = ['AlongEdge',
+              'Edge',
+              'Point',
+              'Distance']
+    macro = M_MACRO
 
     def __init__(self, selfobj):
         if M_DEBUG:
@@ -251,130 +316,76 @@ onto the first selected Line."""
 
         selfobj.Proxy = self
 
-    # this method is mandatory
-    def execute(self, selfobj):
-        """ Doing a recomputation.
+    def compute(self, selfobj):
+        """ Return the Shape and the result point(s) of the feature.
         """
-        m_properties_list = ["Distance",
-                             'AlongEdge',
-                             'Edge',
-                             'Point'
-                             ]
-        for m_property in m_properties_list:
-            if m_property not in selfobj.PropertiesList:
-                return
-
         if M_DEBUG:
-            print("running AlongLinePoint.execute !")
-
-        # To be compatible with previous version > 2019
-        if 'Parametric' in selfobj.PropertiesList:
-            # Create the object the first time regardless
-            # the parametric behavior
-            if selfobj.Parametric == 'Not' and self.created:
-                return
-            if selfobj.Parametric == 'Interactive' and self.created:
-                return
+            print("running AlongLinePoint.compute !")
 
         if selfobj.AlongEdge is None:
-            return
-
+            return None
         if selfobj.Edge is None and selfobj.Point is None:
-            return
+            return None
 
-        try:
-            vector_point = None
-            m_distance = selfobj.Distance
+        vector_point = None
+        m_distance = selfobj.Distance
 
-            # m_n1 = eval(selfobj.AlongEdge[1][0].lstrip('Edge'))
-            m_n1 = re.sub('[^0-9]', '', selfobj.AlongEdge[1][0])
-            m_n1 = int(m_n1)
+        m_alongedge = self.linkedShape(selfobj, 'AlongEdge')
+        if selfobj.Edge is not None:
+            m_edge = self.linkedShape(selfobj, 'Edge')
+        else:
+            m_obj, _, m_n3 = self.resolveLink(selfobj, 'Point')
+            m_point = getSubShape(m_obj, "Vertex", m_n3).Point
 
-            if selfobj.Edge is not None:
-                # m_n2 = eval(selfobj.Edge[1][0].lstrip('Edge'))
-                m_n2 = re.sub('[^0-9]', '', selfobj.Edge[1][0])
-                m_n2 = int(m_n2)
-            else:
-                if selfobj.Point != selfobj.AlongEdge:
-                    # m_n3 = eval(selfobj.Point[1][0].lstrip('Vertex'))
-                    m_n3 = re.sub('[^0-9]', '', selfobj.Point[1][0])
-                else:
-                    # m_n3 = eval(selfobj.Point[1][0].lstrip('Edge'))
-                    m_n3 = re.sub('[^0-9]', '', selfobj.Point[1][0])
-                m_n3 = int(m_n3)
-
-            if M_DEBUG:
-                print_msg("m_n1 = " + str(m_n1))
-                if selfobj.Edge is not None:
-                    print_msg("m_n2 = " + str(m_n2))
-                else:
-                    print_msg("m_n3 = " + str(m_n3))
-                print_msg("m_distance = " + str(m_distance))
+        if M_DEBUG:
+            print_msg("m_distance = " + str(m_distance))
 
-            m_alongedge = selfobj.AlongEdge[0].Shape.Edges[m_n1 - 1]
-            if selfobj.Edge is not None:
-                m_edge = selfobj.Edge[0].Shape.Edges[m_n2 - 1]
-            else:
-                m_point = selfobj.Point[0].Shape.Vertexes[m_n3 - 1].Point
+        vector_a = m_alongedge.valueAt(0.0)
+        vector_b = m_alongedge.valueAt(m_alongedge.Length)
 
-            vector_a = m_alongedge.valueAt(0.0)
-            vector_b = m_alongedge.valueAt(m_alongedge.Length)
+        if isEqualVectors(vector_a, vector_b):
+            return None
 
-            if isEqualVectors(vector_a, vector_b):
-                return
+        if selfobj.Edge is not None:
+            m_dist = m_alongedge.distToShape(m_edge)
+            vector_c = m_dist[1][0][0]
+        else:
+            vector_c = m_point
 
+        # Calculate intersection Point
+        vector_t, _, _ = intersectPerpendicularLine(vector_a,
+                                                    vector_b,
+                                                    vector_c,)
+        if M_DEBUG:
+            print_msg("m_alongedge = " + str(m_alongedge))
             if selfobj.Edge is not None:
-                m_dist = m_alongedge.distToShape(m_edge)
-                vector_c = m_dist[1][0][0]
+                print_msg("m_edge = " + str(m_edge))
             else:
-                vector_c = m_point
-
-            # Calculate intersection Point
-            vector_t, _, _ = intersectPerpendicularLine(vector_a,
-                                                        vector_b,
-                                                        vector_c,)
-            if M_DEBUG:
-                print_msg("m_alongedge = " + str(m_alongedge))
-                if selfobj.Edge is not None:
-                    print_msg("m_edge = " + str(m_edge))
-                else:
-                    print_msg("m_point = " + str(m_point))
-                print_msg("vector_a = " + str(vector_a))
-                print_msg("vector_b = " + str(vector_b))
-                print_msg("vector_c = " + str(vector_c))
-                print_msg("vector_t = " + str(vector_t))
-
-            vector_translate = (vector_b - vector_a)
-            if m_distance != 0.0:
-                vector_translate = vector_translate.normalize() * m_distance
-                vector_point = vector_t + vector_translate
-            else:
-                vector_point = vector_t
-
-            if vector_point is not None:
-                point = Part.Point(vector_point)
-                selfobj.Shape = point.toShape()
-                propertiesPoint(selfobj.Label, self.color)
-                selfobj.X = float(vector_point.x)
-                selfobj.Y = float(vector_point.y)
-                selfobj.Z = float(vector_point.z)
-                # To be compatible with previous version 2018
-                if 'Parametric' in selfobj.PropertiesList:
-                    self.created = True
-        except AttributeError as err:
-            print("AttributeError" + str(err))
-        except Exception as err:
-            printError_msg(err.args[0], title=M_MACRO)
+                print_msg("m_point = " + str(m_point))
+            print_msg("vector_a = " + str(vector_a))
+            print_msg("vector_b = " + str(vector_b))
+            print_msg("vector_c = " + str(vector_c))
+            print_msg("vector_t = " + str(vector_t))
 
-    def onChanged(self, selfobj, prop):
+        vector_translate = (vector_b - vector_a)
+        if m_distance != 0.0:
+            vector_translate = vector_translate.normalize() * m_distance
+            vector_point = vector_t + vector_translate
+        else:
+            vector_point = vector_t
+
+        if vector_point is None:
+            return None
+        point = Part.Point(vector_point)
+        return (point.toShape(), [vector_point])
+
+    def changed(self, selfobj, prop):
         """ Run when a proterty change.
         """
         if M_DEBUG:
-            print("running CenterLinePoint.onChanged !")
+            print("running CenterLinePoint.changed !")
             print("Change property : " + str(prop))
 
-        WF_Point.onChanged(self, selfobj, prop)
-
         if prop == "Parametric":
             if 'Parametric' in selfobj.PropertiesList:
                 if selfobj.Parametric == 'Not':
@@ -461,24 +472,22 @@ def buildFromTwoPoints(vertex1, vertex2, index, object1, group):
         printError_msg(err.args[0], title="Macro AlongLinePoint")
 
 
-def buildFromEdgeAndPoint(macro, group, edge, point, distance):
+def buildFromEdgeAndPoint(builder, group, edge, point, distance,
+                          result=None):
     """ Build a AlongLinePoint feature object using an edge.
     and a point.
+    result is the Shape and point if already computed (see
+    computeFromEdgeAndPoints).
     """
     if WF.verbose():
         print_msg("edge = " + str(edge))
         print_msg("point = " + str(point))
 
-    App.ActiveDocument.openTransaction(macro)
-    selfobj = makeAlongLinePointFeature(group)
-    selfobj.AlongEdge = edge
-    selfobj.Point = point
-    selfobj.Edge = None
-    selfobj.Distance = distance
-    selfobj.Proxy.execute(selfobj)
+    builder.build(makeAlongLinePointFeature, group, result=result,
+                  AlongEdge=edge, Point=point, Edge=None, Distance=distance)
 
 
-def buildFromEdges(macro, group, edge, other_edge, distance):
+def buildFromEdges(builder, group, edge, other_edge, distance):
     """ Build a AlongLinePoint feature object using an edge.
     and an other edge if any.
     """
@@ -486,15 +495,9 @@ def buildFromEdges(macro, group, edge, other_edge, distance):
         print_msg("edge = " + str(edge))
         print_msg("other_edge = " + str(other_edge))
 
-    App.ActiveDocument.openTransaction(macro)
-    selfobj = makeAlongLinePointFeature(group)
-    selfobj.AlongEdge = edge
-    selfobj.Point = None
-    selfobj.Edge = other_edge
-    selfobj.Distance = distance
-    selfobj.Proxy.execute(selfobj)
-
-    WF.touch(selfobj)
+    builder.build(makeAlongLinePointFeature, group,
+                  AlongEdge=edge, Point=None, Edge=other_edge,
+                  Distance=distance)
 
 
 def along_line_point_command():
@@ -506,12 +509,13 @@ def along_line_point_command():
     edges_from = ["Segments", "Curves"]
     points_from = ["Points"]
     try:
+        # Keep duplicates as Edges and Points may be processed by pairs
         if m_sel.numberOfEntities == 1:
             number_of_edges, edge_list = m_sel.get_segmentsWithNames(
-                get_from=edges_from)
+                get_from=edges_from, keep_duplicates=True)
         else:
             number_of_edges, edge_list = m_sel.get_segmentsWithNames(
-                get_from=edges_from)
+                get_from=edges_from, keep_duplicates=True)
 
         number_of_vertexes, vertex_list = m_sel.get_pointsWithNames(
             get_from=points_from)
@@ -522,69 +526,68 @@ def along_line_point_command():
             if number_of_edges == 1 and number_of_vertexes == 0:
                 raise Exception(M_EXCEPTION_MSG)
 
-        m_main_dir = "WorkPoints_P"
-        m_sub_dir = "Set000"
-        m_group = createFolders(str(m_main_dir))
-
-        m_distance = getDistanceLinePoint()
-
-        # Selection of : One Edge and One or several Point(s)
-        if number_of_edges == 1 and number_of_vertexes > 0:
-            try:
-                # Create a sub group if needed
-                if number_of_vertexes > 1:
-                    m_group = createSubGroup(m_act_doc, m_main_dir, m_sub_dir)
-
-                edge = edge_list[0]
-                for j in range(number_of_vertexes):
-                    point = vertex_list[j]
-                    buildFromEdgeAndPoint(M_MACRO,
-                                          m_group,
-                                          edge, point, m_distance)
-
-            except Exception as err:
-                printError_msg(err.args[0], title=M_MACRO)
-
-        # Selection of : One Edge and One or several Edge(s)
-        elif number_of_edges > 1 and number_of_vertexes == 0:
-            try:
-                # Create a sub group if needed
-                if number_of_edges > 2:
+        try:
+            with bulkBuild(M_MACRO) as m_builder:
+                m_main_dir = "WorkPoints_P"
+                m_sub_dir = "Set000"
+                m_group = createFolders(str(m_main_dir))
+
+                m_distance = getDistanceLinePoint()
+
+                # Selection of : One Edge and One or several Point(s)
+                if number_of_edges == 1 and number_of_vertexes > 0:
+                    # Create a sub group if needed
+                    if number_of_vertexes > 1:
+                        m_group = createSubGroup(m_act_doc, m_main_dir, m_sub_dir)
+
+                    edge = edge_list[0]
+                    # Compute all points at once
+                    m_results = computeFromEdgeAndPoints([(edge, point)
+                                                          for point in vertex_list],
+                                                         m_distance)
+                    for edge, point, m_result in m_results:
+                        buildFromEdgeAndPoint(m_builder,
+                                              m_group,
+                                              edge, point, m_distance,
+                                              m_result)
+
+                # Selection of : One Edge and One or several Edge(s)
+                elif number_of_edges > 1 and number_of_vertexes == 0:
+                    # Create a sub group if needed
+                    if number_of_edges > 2:
+                        m_group = createSubGroup(m_act_doc, m_main_dir, m_sub_dir)
+
+                    edge = edge_list[0]
+                    for other_edge in edge_list[1:]:
+                        buildFromEdges(m_builder,
+                                       m_group,
+                                       edge, other_edge, m_distance)
+
+                # Selection of : several Edges and Points with
+                # same number of Edges and Points
+                elif number_of_edges > 1 and number_of_vertexes == number_of_edges:
+                    # Create a sub group if needed
                     m_group = createSubGroup(m_act_doc, m_main_dir, m_sub_dir)
 
-                edge = edge_list[0]
-                for other_edge in edge_list[1:]:
-                    buildFromEdges(M_MACRO,
-                                   m_group,
-                                   edge, other_edge, m_distance)
-
-            except Exception as err:
-                printError_msg(err.args[0], title=M_MACRO)
-
-        # Selection of : several Edges and Points with
-        # same number of Edges and Points
-        elif number_of_edges > 1 and number_of_vertexes == number_of_edges:
-            try:
-                # Create a sub group if needed
-                m_group = createSubGroup(m_act_doc, m_main_dir, m_sub_dir)
+                    # Compute all points at once
+                    m_results = computeFromEdgeAndPoints(list(zip(edge_list,
+                                                                  vertex_list)),
+                                                         m_distance)
+                    for edge, point, m_result in m_results:
+                        buildFromEdgeAndPoint(m_builder,
+                                              m_group,
+                                              edge, point, m_distance,
+                                              m_result)
 
-                for edge, point in zip(edge_list, vertex_list):
-                    buildFromEdgeAndPoint(M_MACRO,
-                                          m_group,
-                                          edge, point, m_distance)
-
-            except Exception as err:
-                printError_msg(err.args[0], title=M_MACRO)
+                else:
+                    printError_msg("Bad selection !", title=M_MACRO)
 
-        else:
-            printError_msg("Bad selection !", title=M_MACRO)
+        except Exception as err:
+            printError_msg(err.args[0], title=M_MACRO)
 
     except Exception as err:
         printError_msgWithTimer(err.args[0], title=M_MACRO)
 
-    App.ActiveDocument.commitTransaction()
-    App.activeDocument().recompute()
-
 
 if App.GuiUp:
     Gui.addCommand("AlongLinePoint", Command(M_ICON_NAME_FILE,
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Headless scripting API of Work Feature.
+
+These functions create WF features from explicit references instead of
+the Gui selection, so they also run without Gui (ie: FreeCADCmd) :
+
+    import WF
+    doc = App.openDocument("part.FCStd")
+    points = WF.api.center_line_points(doc, [(doc.Box, "Edge1")], parts=4)
+
+All features of one call are created into one transaction and computed
+once (see WF_builder). View styling is skipped when no Gui is up.
+References are (object, sub element name) tuples like (Box, "Edge3").
+Each function returns the list of created objects.
+"""
+import sys
+import FreeCAD as App
+from WF_config import PATH_WF_UTILS, PATH_WF_UI
+
+if not sys.path.__contains__(str(PATH_WF_UTILS)):
+    sys.path.append(str(PATH_WF_UTILS))
+    sys.path.append(str(PATH_WF_UI))
+
+from WF_directory import createFolders
+from WF_builder import bulkBuild
+import WF_centerLinePoint
+import WF_twoPointsLine
+import WF_nPointsLine
+
+###############
+M_DEBUG = False
+###############
+
+
+def activate(doc):
+    """ Make doc the active document : the features are created into
+    the active document.
+    """
+    if App.ActiveDocument is None or App.ActiveDocument.Name != doc.Name:
+        App.setActiveDocument(doc.Name)
+
+
+def center_line_points(doc, edge_refs, parts=2, index=1, as_array=False):
+    """ Create CenterLinePoint features on edges.
+
+    Return
+    -------
+    The list of created objects.
+
+    Parameters
+    -------
+    *doc* : (Document, Mandatory)
+    *edge_refs* : (List of (object, "EdgeN"), Mandatory)
+    *parts* : (Integer, Optional, default=2)
+              number of parts each edge is cut in.
+    *index* : (Integer, Optional, default=1)
+              index of the point along the parts.
+    *as_array* : (Boolean, Optional, default=False)
+                 if True all the part's end points of all the edges are
+                 created into one single CenterLinePointArray object
+                 (index is ignored).
+    """
+    activate(doc)
+    m_group = createFolders("WorkPoints_P")
+    with bulkBuild(WF_centerLinePoint.M_MACRO) as m_builder:
+        if as_array:
+            WF_centerLinePoint.buildArrayFromEdges(m_builder, m_group,
+                                                   list(edge_refs), parts)
+        else:
+            for m_edge in edge_refs:
+                WF_centerLinePoint.buildFromEdge(m_builder, m_group,
+                                                 m_edge, parts, index)
+    return m_builder.features
+
+
+def two_points_lines(doc, point_refs, extension=0.0, by_pair=False,
+                     closed=False, as_array=False):
+    """ Create TwoPointsLine features between consecutive points.
+
+    Return
+    -------
+    The list of created objects.
+
+    Parameters
+    -------
+    *doc* : (Document, Mandatory)
+    *point_refs* : (List of (object, "VertexN"), Mandatory)
+                   ordered list of at least 2 points.
+    *extension* : (Float, Optional, default=0.0)
+                  extension of each Line.
+    *by_pair* : (Boolean, Optional, default=False)
+                if True the points are processed as separated pairs.
+    *closed* : (Boolean, Optional, default=False)
+               if True a last Line joins the last point to the first one.
+    *as_array* : (Boolean, Optional, default=False)
+                 if True all the Lines are created into one single
+                 TwoPointsLineArray object (WorkWires_P).
+    """
+    activate(doc)
+    m_refs = list(point_refs)
+    if as_array:
+        m_group = createFolders("WorkWires_P")
+        with bulkBuild(WF_twoPointsLine.M_MACRO) as m_builder:
+            WF_twoPointsLine.buildArrayFromPoints(m_builder, m_group,
+                                                  m_refs, by_pair, closed,
+                                                  extension)
+        return m_builder.features
+
+    m_number = len(m_refs)
+    if by_pair:
+        m_couples = [(m_refs[i], m_refs[i + 1])
+                     for i in range(0, m_number - 1, 2)]
+        closed = closed and m_number % 2 == 1
+    else:
+        m_couples = [(m_refs[i], m_refs[i + 1])
+                     for i in range(m_number - 1)]
+    if closed and m_number > 2:
+        m_couples.append((m_refs[-1], m_refs[0]))
+
+    m_group = createFolders("WorkAxis_P")
+    with bulkBuild(WF_twoPointsLine.M_MACRO) as m_builder:
+        for m_point1, m_point2 in m_couples:
+            m_builder.build(WF_twoPointsLine.makeTwoPointsLineFeature,
+                            m_group,
+                            Point1=m_point1,
+                            Point2=m_point2,
+                            Extension=float(extension))
+    return m_builder.features
+
+
+def makeBestFitLine(group):
+    """ Return a new NPointsLine object (see makeNPointsLineFeature).
+    """
+    m_result = WF_nPointsLine.makeNPointsLineFeature(group)
+    if m_result is None:
+        return None
+    return m_result[0]
+
+
+def best_fit_line(doc, point_refs, vector_indexes=('1',)):
+    """ Create NPointsLine features : the best fit Line(s) of points
+    (Singular Value Decomposition).
+
+    Return
+    -------
+    The list of created objects.
+
+    Parameters
+    -------
+    *doc* : (Document, Mandatory)
+    *point_refs* : (List of (object, "VertexN"), Mandatory)
+                   at least 2 points.
+    *vector_indexes* : (List of '1', '2' or '3', Optional, default=('1',))
+                       one Line is created for each SVD vector index.
+    """
+    activate(doc)
+    m_group = createFolders("WorkAxis_P")
+    with bulkBuild(WF_nPointsLine.M_MACRO) as m_builder:
+        for m_index in vector_indexes:
+            m_builder.build(makeBestFitLine, m_group,
+                            Points=[tuple(m_ref) for m_ref in point_refs],
+                            VectorIndex=str(m_index))
+    return m_builder.features
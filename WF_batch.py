@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+"""
+Batch recipe runner : apply the same WF operations to many FCStd files.
+
+Run under FreeCADCmd (or a Python with the FreeCAD library) :
+
+    FreeCADCmd WF_batch.py recipe.json [--workers N]
+
+The recipe is a JSON file :
+
+    {
+        "files": ["parts/*.FCStd", "other/plate.FCStd"],
+        "workers": 4,
+        "output_dir": "results",
+        "report": "timings.json",
+        "operations": [
+            {"op": "center_line_points", "object": "Body",
+             "elements": "Edge", "parts": 2, "index": 1},
+            {"op": "best_fit_line", "object": "Holes",
+             "elements": ["Vertex1", "Vertex2", "Vertex3"]}
+        ]
+    }
+
+- files : FCStd files or glob patterns, relative to the recipe file.
+- workers : number of processes (1 : no pool), default the CPU count.
+  Parallel runs need the "fork" start method (Linux, and macOS where
+  Python still provides it) : under FreeCADCmd sys.executable is not a
+  Python interpreter, so "spawn" (Windows) can not start the workers.
+  Without "fork" the files are processed one after the other.
+- output_dir : (optional) save copies there, else the files are saved
+  in place.
+- report : (optional) JSON file receiving the per-file timings.
+- operations : applied in order to each document. "op" is a function of
+  WF_api, "object" the Name or Label of the parent object, "elements"
+  either a sub element type ("Vertex", "Edge", "Face" : all of them) or a
+  list of sub element names. Other keys are given to the WF_api function.
+"""
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import multiprocessing
+
+# Work Feature modules must be found when run as a script
+if os.path.dirname(os.path.abspath(__file__)) not in sys.path:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import FreeCAD as App
+import WF_api
+
+###############
+M_DEBUG = False
+###############
+# Operations : {name in recipe: default sub element type}
+M_OPERATIONS = {"center_line_points": "Edge",
+                "two_points_lines": "Vertex",
+                "best_fit_line": "Vertex",
+                }
+M_ATTRIBUTES = {"Vertex": "Vertexes",
+                "Edge": "Edges",
+                "Face": "Faces",
+                }
+M_CLOCK = getattr(time, 'perf_counter', time.time)
+###############
+
+
+def loadRecipe(file_name):
+    """ Read and check a JSON recipe.
+
+    Return
+    -------
+    The recipe as a dict with "files" expanded as absolute paths.
+
+    Parameters
+    -------
+    *file_name* : (String, Mandatory) path of the JSON recipe.
+    """
+    with open(file_name, "r") as m_file:
+        m_recipe = json.load(m_file)
+
+    m_dir = os.path.dirname(os.path.abspath(file_name))
+    m_files = []
+    for m_pattern in m_recipe.get("files", []):
+        m_pattern = os.path.join(m_dir, m_pattern)
+        for m_path in sorted(glob.glob(m_pattern)):
+            if m_path not in m_files:
+                m_files.append(m_path)
+    m_recipe["files"] = m_files
+
+    for m_operation in m_recipe.get("operations", []):
+        if m_operation.get("op") not in M_OPERATIONS:
+            raise Exception("Not valid operation : " + str(m_operation.get("op")) +
+                            " (must be one of " + str(sorted(M_OPERATIONS)) + ")")
+        if "object" not in m_operation:
+            raise Exception("Missing 'object' in operation : " + str(m_operation))
+
+    if m_recipe.get("output_dir"):
+        m_recipe["output_dir"] = os.path.join(m_dir, m_recipe["output_dir"])
+    if m_recipe.get("report"):
+        m_recipe["report"] = os.path.join(m_dir, m_recipe["report"])
+    return m_recipe
+
+
+def findObject(doc, name):
+    """ Return the object of doc with this Name or Label.
+    """
+    m_obj = doc.getObject(name)
+    if m_obj is None:
+        m_objs = doc.getObjectsByLabel(name)
+        if m_objs:
+            m_obj = m_objs[0]
+    if m_obj is None:
+        raise Exception("No object '" + str(name) + "' in " + str(doc.Name))
+    return m_obj
+
+
+def resolveReferences(doc, operation):
+    """ Return the list of (object, sub element name) references of an
+    operation of the recipe.
+    """
+    m_obj = findObject(doc, operation["object"])
+    m_elements = operation.get("elements", M_OPERATIONS[operation["op"]])
+    if isinstance(m_elements, list):
+        return [(m_obj, str(m_sub)) for m_sub in m_elements]
+    m_shapes = getattr(m_obj.Shape, M_ATTRIBUTES[m_elements])
+    return [(m_obj, m_elements + str(m_i + 1)) for m_i in range(len(m_shapes))]
+
+
+def applyOperation(doc, operation):
+    """ Apply one operation of the recipe to doc.
+
+    Return
+    -------
+    The list of created objects.
+    """
+    m_refs = resolveReferences(doc, operation)
+    m_options = {m_key: m_value for m_key, m_value in operation.items()
+                 if m_key not in ("op", "object", "elements")}
+    m_function = getattr(WF_api, operation["op"])
+    return m_function(doc, m_refs, **m_options)
+
+
+def processFile(file_name, recipe):
+    """ Open file_name, apply all the operations of the recipe and save.
+
+    Return
+    -------
+    A dict with the timings (s) of the file :
+    {"file", "status", "error", "created", "open", "operations", "save",
+     "total"}
+    """
+    m_result = {"file": file_name,
+                "status": "ok",
+                "error": "",
+                "created": 0,
+                "open": 0.0,
+                "operations": 0.0,
+                "save": 0.0,
+                "total": 0.0}
+    m_start = M_CLOCK()
+    m_doc = None
+    try:
+        m_doc = App.openDocument(file_name)
+        m_time = M_CLOCK()
+        m_result["open"] = m_time - m_start
+
+        for m_operation in recipe.get("operations", []):
+            m_result["created"] += len(applyOperation(m_doc, m_operation))
+        m_doc.recompute()
+        m_result["operations"] = M_CLOCK() - m_time
+        m_time = M_CLOCK()
+
+        m_output_dir = recipe.get("output_dir")
+        if m_output_dir:
+            if not os.path.isdir(m_output_dir):
+                os.makedirs(m_output_dir)
+            m_doc.saveAs(os.path.join(m_output_dir, os.path.basename(file_name)))
+        else:
+            m_doc.save()
+        m_result["save"] = M_CLOCK() - m_time
+    except Exception as err:
+        m_result["status"] = "error"
+        m_result["error"] = str(err)
+    finally:
+        if m_doc is not None:
+            App.closeDocument(m_doc.Name)
+    m_result["total"] = M_CLOCK() - m_start
+    return m_result
+
+
+def processFileArgs(args):
+    """ processFile for a process pool : args is (file_name, recipe).
+    """
+    return processFile(*args)
+
+
+def forkContext():
+    """ Return the multiprocessing context of the "fork" start method, or
+    None if the platform does not provide it.
+    "spawn" would start sys.executable, that is FreeCADCmd and not a Python
+    interpreter, so it can not be used.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context("fork")
+
+
+def run(recipe, workers=None):
+    """ Process all the files of the recipe.
+
+    Return
+    -------
+    The list of results of processFile, in the order of the files.
+
+    Parameters
+    -------
+    *recipe* : (Dict, Mandatory) as returned by loadRecipe.
+    *workers* : (Integer, Optional, default=None)
+                number of processes, if None the "workers" of the recipe
+                or the CPU count. 1 (or no "fork" start method)
+                means no process pool.
+    """
+    if workers is None:
+        workers = recipe.get("workers") or multiprocessing.cpu_count()
+    m_files = recipe["files"]
+    workers = max(1, min(int(workers), len(m_files)))
+    m_args = [(m_file, recipe) for m_file in m_files]
+    m_context = forkContext()
+    if workers > 1 and m_context is None:
+        print("No 'fork' start method on this platform, "
+              "files processed one after the other !")
+        workers = 1
+    if workers == 1:
+        return [processFileArgs(m_arg) for m_arg in m_args]
+    m_pool = m_context.Pool(workers)
+    try:
+        return m_pool.map(processFileArgs, m_args, chunksize=1)
+    finally:
+        m_pool.close()
+        m_pool.join()
+
+
+def report(results, duration=None):
+    """ Return a text report of the per-file timings.
+    """
+    m_lines = ["{0:>8s} {1:>8s} {2:>8s} {3:>8s} {4:>7s} {5:s}".format(
+        "total", "open", "ops", "save", "created", "file")]
+    for m_result in results:
+        m_line = "{0:8.3f} {1:8.3f} {2:8.3f} {3:8.3f} {4:7d} {5:s}".format(
+            m_result["total"], m_result["open"], m_result["operations"],
+            m_result["save"], m_result["created"], m_result["file"])
+        if m_result["status"] != "ok":
+            m_line += " : ERROR " + m_result["error"]
+        m_lines.append(m_line)
+    m_errors = sum(1 for m_result in results if m_result["status"] != "ok")
+    m_summary = str(len(results)) + " file(s), " + str(m_errors) + " error(s)"
+    if duration is not None:
+        m_summary += ", {0:.3f} s".format(duration)
+    m_lines.append(m_summary)
+    return "\n".join(m_lines)
+
+
+def main(argv=None):
+    """ Command line entry point.
+    Return the number of files in error.
+    """
+    if argv is None:
+        argv = sys.argv
+        # Under FreeCADCmd the arguments before the script are FreeCAD's
+        m_script = os.path.basename(__file__)
+        for m_i, m_arg in enumerate(argv):
+            if os.path.basename(m_arg) == m_script:
+                argv = argv[m_i + 1:]
+                break
+        else:
+            argv = argv[1:]
+
+    m_parser = argparse.ArgumentParser(
+        prog="WF_batch",
+        description="Apply a Work Feature recipe to many FCStd files.")
+    m_parser.add_argument("recipe", help="JSON recipe file")
+    m_parser.add_argument("-j", "--workers", type=int, default=None,
+                          help="number of processes (default: recipe or CPU count)")
+    m_args = m_parser.parse_args(argv)
+
+    m_recipe = loadRecipe(m_args.recipe)
+    m_start = M_CLOCK()
+    m_results = run(m_recipe, m_args.workers)
+    App.Console.PrintMessage(report(m_results, M_CLOCK() - m_start) + "\n")
+    if m_recipe.get("report"):
+        with open(m_recipe["report"], "w") as m_file:
+            json.dump(m_results, m_file, indent=2)
+    return sum(1 for m_result in m_results if m_result["status"] != "ok")
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
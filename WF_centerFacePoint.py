@@ -144,6 +144,11 @@ def makeCenterFacePointFeature(group):
 
 class CenterFacePoint(WF_Point):
     """ The CenterFacePoint feature object. """
+    properties_list = ['Face',
+                       ]
+    inputs = ['Face']
+    macro = M_MACRO
+
     # this method is mandatory
     def __init__(self, selfobj):
         if M_DEBUG:
@@ -161,67 +166,39 @@ class CenterFacePoint(WF_Point):
         selfobj.Proxy = self
 
     # this method is mandatory
-    def execute(self, selfobj):
-        """ Doing a recomputation.
+    def compute(self, selfobj):
+        """ Return the Shape and the result point(s) of the feature.
         """
         if M_DEBUG:
-            print("running CenterFacePoint.execute !")
-
-        # To be compatible with previous version > 2019
-        if 'Parametric' in selfobj.PropertiesList:
-            # Create the object the first time regardless
-            # the parametric behavior
-            if selfobj.Parametric == 'Not' and self.created:
-                return
-            if selfobj.Parametric == 'Interactive' and self.created:
-                return
+            print("running CenterFacePoint.compute !")
 
         if WF.verbose():
             m_msg = "Recompute Python CenterFacePoint feature\n"
             App.Console.PrintMessage(m_msg)
 
-        m_properties_list = ['Face',
-                            ]
-        for m_property in m_properties_list:
-            if m_property not in selfobj.PropertiesList:
-                return
+        Vector_point = None
+        if selfobj.Face is not None:
+            if M_DEBUG:
+                print_msg(str(selfobj.Face))
 
-        try:
-            Vector_point = None
-            if selfobj.Face is not None:
-                n = eval(selfobj.Face[1][0].lstrip('Face'))
-                if M_DEBUG:
-                    print_msg(str(selfobj.Face))
-                    print_msg("n = " + str(n))
-
-                m_face = selfobj.Face[0].Shape.Faces[n - 1]
-
-                if M_DEBUG:
-                    print_msg("m_face = " + str(m_face))
-
-                Vector_point = m_face.CenterOfMass
-
-            if Vector_point is not None:
-                point = Part.Point(Vector_point)
-                selfobj.Shape = point.toShape()
-                propertiesPoint(selfobj.Label, self.color)
-                selfobj.X = float(Vector_point.x)
-                selfobj.Y = float(Vector_point.y)
-                selfobj.Z = float(Vector_point.z)
-                # To be compatible with previous version 2018
-                if 'Parametric' in selfobj.PropertiesList:
-                    self.created = True
-        except Exception as err:
-            printError_msg(err.args[0], title=M_MACRO)
+            m_face = self.linkedShape(selfobj, 'Face')
 
-    def onChanged(self, selfobj, prop):
+            if M_DEBUG:
+                print_msg("m_face = " + str(m_face))
+
+            Vector_point = m_face.CenterOfMass
+
+        if Vector_point is None:
+            return None
+        point = Part.Point(Vector_point)
+        return (point.toShape(), [Vector_point])
+
+    def changed(self, selfobj, prop):
         if WF.verbose():
             App.Console.PrintMessage("Change property : " + str(prop) + "\n")
 
         if M_DEBUG:
-            print("running CenterFacePoint.onChanged !")
-
-        WF_Point.onChanged(self, selfobj, prop)
+            print("running CenterFacePoint.changed !")
 
         if prop == "Parametric":
             if 'Parametric' in selfobj.PropertiesList:
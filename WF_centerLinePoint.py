@@ -46,7 +46,7 @@ import Part
 from PySide import QtCore
 from WF_config import PATH_WF_ICONS, PATH_WF_UTILS, PATH_WF_UI
 import WF
-from WF_Objects_base import WF_Point
+from WF_Objects_base import WF_Point, WF_PointArray
 
 if App.GuiUp:
     import FreeCADGui as Gui
@@ -68,8 +68,10 @@ try:
     from WF_selection import getSel
     from WF_print import printError_msg, print_msg, printError_msgWithTimer
     from WF_directory import createFolders, addObjectToGrp, createSubGroup
-    from WF_geometry import isEqualVectors, alongTwoPointsPoint, alongLinePoint, propertiesPoint
+    from WF_geometry import areEqualVectors, filterEqualCouples, uniqueVectors, alongTwoPointsPoint, alongLinePoint, alongLinePoints, arrayToVector, arrayToVectors, propertiesPoint
+    from WF_cache import getSubShape
     from WF_command import Command
+    from WF_builder import bulkBuild
 except ImportError:
     print("ERROR: Cannot load WF modules !")
     sys.exit(1)
@@ -112,6 +114,7 @@ M_LOCATION = "Single"
 M_LOCATIONS = ["Single", "All"]
 M_NUMBERLINEPART = 2
 M_INDEXPART = 1
+M_AS_ARRAY = False
 ###############
 
 
@@ -144,6 +147,29 @@ def getLocation():
     return M_LOCATION
 
 
+def setAsArray(as_array):
+    """ Set if all the points ("All" location) are created into one
+    single Point array object.
+
+    Parameters
+    -------
+    *as_array* : (Boolean, Mandatory)
+    """
+    global M_AS_ARRAY
+    M_AS_ARRAY = bool(as_array)
+
+
+def getAsArray():
+    """ Get if all the points ("All" location) are created into one
+    single Point array object.
+
+    Return
+    -------
+    A Boolean.
+    """
+    return M_AS_ARRAY
+
+
 def setNumberLinePart(number_line_part):
     """ Set number of parts to consider.
 
@@ -192,6 +218,89 @@ def getIndexPart():
     return M_INDEXPART
 
 
+def batchResult(points, index_part):
+    """ Return the result of a CenterLinePoint feature from the division
+    points of its Line computed at once (see computeBatchFromEdges).
+
+    Return
+    -------
+    (shape, [vector]) as given by CenterLinePoint.compute or None for a
+    Line with equal ends.
+    """
+    # None for NaN for Line with equal ends
+    vector_point = arrayToVector(points[index_part])
+    if vector_point is None:
+        return None
+    return (Part.Point(vector_point).toShape(), [vector_point])
+
+
+def computeBatchFromEdges(edge_list, number_line_part):
+    """ Compute at once all division points of the given edges.
+
+    Return
+    -------
+    The points as numpy array of shape (E, number_line_part + 1, 3).
+    """
+    m_ends = []
+    m_lengths = []
+    for m_edge in edge_list:
+        m_n = re.sub('[^0-9]', '', m_edge[1])
+        m_n = int(m_n)
+        m_shape = getSubShape(m_edge[0], "Edge", m_n)
+        m_ends.append((tuple(m_shape.Vertexes[0].Point),
+                       tuple(m_shape.Vertexes[-1].Point)))
+        m_lengths.append(m_shape.Length)
+
+    return alongLinePoints(m_ends, number_line_part, m_lengths)
+
+
+def computeBatchFromPoints(vertexes_list, number_line_part):
+    """ Compute at once all division points between the given
+    couples of points.
+
+    Return
+    -------
+    The points as numpy array of shape (E, number_line_part + 1, 3).
+    """
+    m_ends = []
+    for vertex1, vertex2 in vertexes_list:
+        m_n1 = re.sub('[^0-9]', '', vertex1[1])
+        m_n2 = re.sub('[^0-9]', '', vertex2[1])
+        point1 = getSubShape(vertex1[0], "Vertex", int(m_n1)).Point
+        point2 = getSubShape(vertex2[0], "Vertex", int(m_n2)).Point
+        m_ends.append((tuple(point1), tuple(point2)))
+
+    return alongLinePoints(m_ends, number_line_part)
+
+
+def uniqueBatchPoints(points):
+    """ Return for each computed division point if it is the first of its
+    coincident points (ie: shared ends of consecutive Lines).
+
+    Return
+    -------
+    A numpy boolean array of shape (E, number_line_part + 1).
+    """
+    return uniqueVectors(points.reshape(-1, 3)).reshape(points.shape[:2])
+
+
+def filterDegeneratedEdges(edge_list):
+    """ Return the edges with different first and last points.
+    """
+    m_starts = []
+    m_ends = []
+    for m_edge in edge_list:
+        m_n = re.sub('[^0-9]', '', m_edge[1])
+        m_n = int(m_n)
+        m_shape = getSubShape(m_edge[0], "Edge", m_n)
+        m_starts.append(m_shape.Vertexes[0].Point)
+        m_ends.append(m_shape.Vertexes[-1].Point)
+
+    m_equals = areEqualVectors(m_starts, m_ends)
+    return [m_edge for m_edge, m_equal in zip(edge_list, m_equals)
+            if not m_equal]
+
+
 class CenterLinePointPanel:
     """ The CenterLinePointPanel (GUI).
     """
@@ -208,6 +317,11 @@ class CenterLinePointPanel:
         if M_LOCATION == "All":
             self.form.UI_CenterLinePoint_checkBox.setCheckState(
                 QtCore.Qt.Checked)
+        self.form.UI_CenterLinePoint_asArray_checkBox.setCheckState(
+            QtCore.Qt.Unchecked)
+        if M_AS_ARRAY:
+            self.form.UI_CenterLinePoint_asArray_checkBox.setCheckState(
+                QtCore.Qt.Checked)
 
     def accept(self):
         """ Run when click on OK button.
@@ -215,6 +329,7 @@ class CenterLinePointPanel:
         global M_LOCATION
         global M_NUMBERLINEPART
         global M_INDEXPART
+        global M_AS_ARRAY
 
         m_select = self.form.UI_CenterLinePoint_checkBox.isChecked()
         if m_select:
@@ -223,11 +338,13 @@ class CenterLinePointPanel:
             M_LOCATION = "Single"
         M_NUMBERLINEPART = self.form.UI_CenterLinePoint_spin_numberLinePart.value()
         M_INDEXPART = self.form.UI_CenterLinePoint_spin_indexPart.value()
+        M_AS_ARRAY = self.form.UI_CenterLinePoint_asArray_checkBox.isChecked()
 
         if WF.verbose():
             print_msg("M_NUMBERLINEPART = " + str(M_NUMBERLINEPART))
             print_msg("M_INDEXPART = " + str(M_INDEXPART))
             print_msg("M_LOCATION = " + str(M_LOCATION))
+            print_msg("M_AS_ARRAY = " + str(M_AS_ARRAY))
 
         Gui.Control.closeDialog()
         m_act_doc = App.activeDocument()
@@ -264,7 +381,33 @@ def makeCenterLinePointFeature(group):
         if group is not None:
             addObjectToGrp(m_obj, group, info=1)
         CenterLinePoint(m_obj)
-        ViewProviderCenterLinePoint(m_obj.ViewObject)
+        if App.GuiUp:
+            ViewProviderCenterLinePoint(m_obj.ViewObject)
+    except Exception as err:
+        printError_msg("Not able to add an object to Model!")
+        printError_msg(err.args[0], title=M_MACRO)
+        return None
+
+    return m_obj
+
+
+def makeCenterLinePointArrayFeature(group):
+    """ Makes a CenterLinePointArray parametric feature object.
+    into the given Group
+    Returns the new object.
+    """
+    m_name = "CenterLinePointArray_P"
+    m_part = "Part::FeaturePython"
+
+    if group is None:
+        return None
+    try:
+        m_obj = App.ActiveDocument.addObject(str(m_part), str(m_name))
+        if group is not None:
+            addObjectToGrp(m_obj, group, info=1)
+        CenterLinePointArray(m_obj)
+        if App.GuiUp:
+            ViewProviderCenterLinePoint(m_obj.ViewObject)
     except Exception as err:
         printError_msg("Not able to add an object to Model!")
         printError_msg(err.args[0], title=M_MACRO)
@@ -276,6 +419,17 @@ def makeCenterLinePointFeature(group):
 class CenterLinePoint(WF_Point):
     """ The CenterLinePoint feature object.
     """
+    properties_list = ['Edge',
+                       'Point1',
+                       'Point2',
+                       'IndexPart',
+                       'NumberLinePart']
+    inputs = ['Edge',
+              'Point1',
+              'Point2',
+              'NumberLinePart',
+              'IndexPart']
+    macro = M_MACRO
 
     def __init__(self, selfobj):
         if M_DEBUG:
@@ -352,103 +506,52 @@ Limits : [-1000:1000]
                                           selfobj.NumberLinePart)
 
             point = Part.Point(vector_point)
-            selfobj.Shape = point.toShape()
+            self.writeResults(selfobj, point.toShape(), vector_point)
             propertiesPoint(selfobj.Label)
-            selfobj.X = float(vector_point.x)
-            selfobj.Y = float(vector_point.y)
-            selfobj.Z = float(vector_point.z)
         except Exception as err:
             printError_msg(err.args[0], title=M_MACRO)
 
-    # this method is mandatory
-
-    def execute(self, selfobj):
-        """ Doing a recomputation.
+    def compute(self, selfobj):
+        """ Return the Shape and the result point(s) of the feature.
         """
-        m_properties_list = ['Edge',
-                             'Point1',
-                             'Point2',
-                             'IndexPart',
-                             'NumberLinePart'
-                             ]
-        for m_property in m_properties_list:
-            if m_property not in selfobj.PropertiesList:
-                return
-
         if M_DEBUG:
-            print("running CenterLinePoint.execute !")
-
-        # To be compatible with previous version > 2019
-        if 'Parametric' in selfobj.PropertiesList:
-            # Create the object the first time regardless
-            # the parametric behavior
-            if selfobj.Parametric == 'Not' and self.created:
-                return
-            if selfobj.Parametric == 'Interactive' and self.created:
-                return
-        # To be compatible with previous version 2018
-        if 'parametric' in selfobj.PropertiesList:
-            self.execute_2018(selfobj)
+            print("running CenterLinePoint.compute !")
 
-        try:
-            vector_point = None
-            if selfobj.Point1 is not None and selfobj.Point2 is not None:
-                # n1 = eval(selfobj.Point1[1][0].lstrip('Vertex'))
-                # n2 = eval(selfobj.Point2[1][0].lstrip('Vertex'))
-                m_n1 = re.sub('[^0-9]', '', selfobj.Point1[1][0])
-                m_n2 = re.sub('[^0-9]', '', selfobj.Point2[1][0])
-                m_n1 = int(m_n1)
-                m_n2 = int(m_n2)
-                if M_DEBUG:
-                    print_msg(str(selfobj.Point1))
-                    print_msg(str(selfobj.Point2))
-                    print_msg("m_n1 = " + str(m_n1))
-                    print_msg("m_n2 = " + str(m_n2))
-
-                point1 = selfobj.Point1[0].Shape.Vertexes[m_n1 - 1].Point
-                point2 = selfobj.Point2[0].Shape.Vertexes[m_n2 - 1].Point
-
-                vector_point = alongTwoPointsPoint(point1,
-                                                   point2,
-                                                   selfobj.IndexPart,
-                                                   selfobj.NumberLinePart)
-            elif selfobj.Edge is not None:
-                m_n = re.sub('[^0-9]', '', selfobj.Edge[1][0])
-                m_n = int(m_n)
-                if M_DEBUG:
-                    print_msg(str(selfobj.Edge))
-                    print_msg("m_n = " + str(m_n))
-
-                if not selfobj.Edge[0].Shape.Edges:
-                    return
-
-                vector_point = alongLinePoint(selfobj.Edge[0].Shape.Edges[m_n - 1],
-                                              selfobj.IndexPart,
-                                              selfobj.NumberLinePart)
-            if vector_point is not None:
-                point = Part.Point(vector_point)
-                selfobj.Shape = point.toShape()
-                propertiesPoint(selfobj.Label, self.color)
-                selfobj.X = float(vector_point.x)
-                selfobj.Y = float(vector_point.y)
-                selfobj.Z = float(vector_point.z)
-                # To be compatible with previous version 2018
-                if 'Parametric' in selfobj.PropertiesList:
-                    self.created = True
-        except AttributeError as err:
-            print("AttributeError" + str(err))
-        except Exception as err:
-            printError_msg(err.args[0], title=M_MACRO)
+        vector_point = None
+        if selfobj.Point1 is not None and selfobj.Point2 is not None:
+            if M_DEBUG:
+                print_msg(str(selfobj.Point1))
+                print_msg(str(selfobj.Point2))
+
+            point1 = self.linkedShape(selfobj, 'Point1').Point
+            point2 = self.linkedShape(selfobj, 'Point2').Point
+
+            vector_point = alongTwoPointsPoint(point1,
+                                               point2,
+                                               selfobj.IndexPart,
+                                               selfobj.NumberLinePart)
+        elif selfobj.Edge is not None:
+            if M_DEBUG:
+                print_msg(str(selfobj.Edge))
 
-    def onChanged(self, selfobj, prop):
+            if not selfobj.Edge[0].Shape.Edges:
+                return None
+
+            vector_point = alongLinePoint(self.linkedShape(selfobj, 'Edge'),
+                                          selfobj.IndexPart,
+                                          selfobj.NumberLinePart)
+        if vector_point is None:
+            return None
+        point = Part.Point(vector_point)
+        return (point.toShape(), [vector_point])
+
+    def changed(self, selfobj, prop):
         """ Run when a proterty change.
         """
         if M_DEBUG:
-            print("running CenterLinePoint.onChanged !")
+            print("running CenterLinePoint.changed !")
             print("Change property : " + str(prop))
 
-        WF_Point.onChanged(self, selfobj, prop)
-
         if prop == "Parametric":
             if 'Parametric' in selfobj.PropertiesList:
                 if selfobj.Parametric == 'Not':
@@ -470,6 +573,102 @@ Limits : [-1000:1000]
             selfobj.Proxy.execute(selfobj)
 
 
+class CenterLinePointArray(WF_PointArray):
+    """ The CenterLinePointArray feature object : all the points at
+    part's ends of several Lines into one object.
+    """
+    properties_list = ['Edges',
+                       'Vertexes',
+                       'NumberLinePart']
+    inputs = ['Edges',
+              'Vertexes',
+              'NumberLinePart']
+    macro = M_MACRO
+
+    def __init__(self, selfobj):
+        if M_DEBUG:
+            print("running CenterLinePointArray.__init__ !")
+
+        self.name = "CenterLinePointArray"
+        WF_PointArray.__init__(self, selfobj, self.name)
+        # Add some custom properties to our feature object.
+        selfobj.addProperty("App::PropertyLinkSubListGlobal",
+                            "Edges",
+                            self.name,
+                            "Input edges")
+        selfobj.addProperty("App::PropertyLinkSubListGlobal",
+                            "Vertexes",
+                            self.name,
+                            "Input points (taken by couples)")
+
+        m_tooltip = """The number indicates in how many Parts
+each selected parent Lines(s) will be cut in.
+Limits : (Min: 2, Max: 100).
+"""
+        selfobj.addProperty("App::PropertyInteger",
+                            "NumberLinePart",
+                            self.name,
+                            m_tooltip).NumberLinePart = 2
+
+        selfobj.setEditorMode("Edges", 1)
+        selfobj.setEditorMode("Vertexes", 1)
+        selfobj.Proxy = self
+
+    def compute(self, selfobj):
+        """ Return the Shape (compound of points) and the result points
+        of the feature.
+        Coincident points (ie: shared ends of consecutive Lines) are
+        kept once.
+        """
+        if M_DEBUG:
+            print("running CenterLinePointArray.compute !")
+
+        m_ends = []
+        m_lengths = []
+        for m_shape in self.linkedShapes(selfobj, 'Edges'):
+            m_ends.append((tuple(m_shape.Vertexes[0].Point),
+                           tuple(m_shape.Vertexes[-1].Point)))
+            m_lengths.append(m_shape.Length)
+        m_vertexes = self.linkedShapes(selfobj, 'Vertexes')
+        for m_vertex1, m_vertex2 in zip(m_vertexes[0::2], m_vertexes[1::2]):
+            m_ends.append((tuple(m_vertex1.Point), tuple(m_vertex2.Point)))
+            m_lengths.append(m_vertex1.Point.distanceToPoint(m_vertex2.Point))
+        if not m_ends:
+            return None
+
+        m_points = alongLinePoints(m_ends, selfobj.NumberLinePart, m_lengths)
+        m_uniques = uniqueBatchPoints(m_points)
+        m_vectors = [m_vector for m_vector in arrayToVectors(m_points[m_uniques])
+                     if m_vector is not None]
+        if not m_vectors:
+            return None
+        m_shape = Part.makeCompound([Part.Vertex(m_vector)
+                                     for m_vector in m_vectors])
+        return (m_shape, m_vectors)
+
+    def changed(self, selfobj, prop):
+        """ Run when a proterty change.
+        """
+        if M_DEBUG:
+            print("running CenterLinePointArray.changed !")
+            print("Change property : " + str(prop))
+
+        if prop == "Parametric":
+            if 'Parametric' in selfobj.PropertiesList:
+                if selfobj.Parametric == 'Not':
+                    selfobj.setEditorMode("NumberLinePart", 1)
+                else:
+                    selfobj.setEditorMode("NumberLinePart", 0)
+            propertiesPoint(selfobj.Label, self.color)
+
+        if prop == 'NumberLinePart':
+            if selfobj.NumberLinePart <= 1:
+                selfobj.NumberLinePart = 2
+            elif selfobj.NumberLinePart > 100:
+                selfobj.NumberLinePart = 100
+            selfobj.Proxy.execute(selfobj)
+
+
 class ViewProviderCenterLinePoint:
     icon = M_ICON_NAME
 
@@ -507,40 +706,65 @@ class ViewProviderCenterLinePoint:
         ViewProviderCenterLinePoint.icon = icon
 
 
-def buildFromEdge(macro, group, edge, number_line_part, index_part):
+def buildFromEdge(builder, group, edge, number_line_part, index_part,
+                  result=None):
     """ Build a CenterLinePoint feature object using an edge.
+    result is the Shape and point if already computed (see batchResult).
     """
     if WF.verbose():
         print_msg("edge = " + str(edge))
-    App.ActiveDocument.openTransaction(macro)
-    selfobj = makeCenterLinePointFeature(group)
-    selfobj.Edge = edge
-    selfobj.Point1 = None
-    selfobj.Point2 = None
-    selfobj.NumberLinePart = number_line_part
-    selfobj.IndexPart = index_part
-    selfobj.Proxy.execute(selfobj)
+    builder.build(makeCenterLinePointFeature, group, result=result,
+                  Edge=edge,
+                  Point1=None,
+                  Point2=None,
+                  NumberLinePart=number_line_part,
+                  IndexPart=index_part)
 
-    WF.touch(selfobj)
 
-
-def buildFromPoints(macro, group, vertexes, number_line_part, index_part):
+def buildFromPoints(builder, group, vertexes, number_line_part, index_part,
+                    result=None):
     """ Build a CenterLinePoint feature object using two points.
+    result is the Shape and point if already computed (see batchResult).
     """
     vertex1 = vertexes[0]
     vertex2 = vertexes[1]
     if WF.verbose():
         print_msg("vertex1 = " + str(vertex1))
         print_msg("vertex2 = " + str(vertex2))
-    App.ActiveDocument.openTransaction(macro)
-    selfobj = makeCenterLinePointFeature(group)
-    selfobj.Edge = None
-    selfobj.Point1 = vertex1
-    selfobj.Point2 = vertex2
-    selfobj.NumberLinePart = number_line_part
-    selfobj.IndexPart = index_part
-    selfobj.Proxy.execute(selfobj)
-    WF.touch(selfobj)
+    builder.build(makeCenterLinePointFeature, group, result=result,
+                  Edge=None,
+                  Point1=vertex1,
+                  Point2=vertex2,
+                  NumberLinePart=number_line_part,
+                  IndexPart=index_part)
+
+
+def buildArrayFromEdges(builder, group, edges, number_line_part):
+    """ Build one CenterLinePointArray feature object with all the points
+    at part's ends of the edges.
+    """
+    if WF.verbose():
+        print_msg("edges = " + str(edges))
+    builder.build(makeCenterLinePointArrayFeature, group,
+                  Edges=edges,
+                  Vertexes=[],
+                  NumberLinePart=number_line_part)
+
+
+def buildArrayFromPoints(builder, group, vertexes_list, number_line_part):
+    """ Build one CenterLinePointArray feature object with all the points
+    at part's ends between the couples of points.
+    """
+    m_vertexes = []
+    for vertex1, vertex2 in vertexes_list:
+        m_vertexes.append(vertex1)
+        m_vertexes.append(vertex2)
+    if WF.verbose():
+        print_msg("vertexes = " + str(m_vertexes))
+    builder.build(makeCenterLinePointArrayFeature, group,
+                  Edges=[],
+                  Vertexes=m_vertexes,
+                  NumberLinePart=number_line_part)
 
 
 def center_line_point_command():
@@ -565,109 +789,112 @@ def center_line_point_command():
             raise Exception(M_EXCEPTION_MSG)
 
         try:
-            if WF.verbose():
-                print_msg("Location = " + str(M_LOCATION))
+            with bulkBuild(M_MACRO) as m_builder:
+                if WF.verbose():
+                    print_msg("Location = " + str(M_LOCATION))
 
-            m_main_dir = "WorkPoints_P"
-            m_sub_dir = "Set000"
-            m_group = createFolders(str(m_main_dir))
+                m_main_dir = "WorkPoints_P"
+                m_sub_dir = "Set000"
+                m_group = createFolders(str(m_main_dir))
 
-            # From Edges
-            if number_of_edges != 0:
-                # Create a sub group if needed
-                if number_of_edges > 1 or M_LOCATION != "Single":
-                    m_group = createSubGroup(m_act_doc, m_main_dir, m_sub_dir)
+                # From Edges
+                if number_of_edges != 0:
+                    # Create a sub group if needed
+                    if number_of_edges > 1 or M_LOCATION != "Single":
+                        m_group = createSubGroup(m_act_doc, m_main_dir, m_sub_dir)
 
-                for i in range(number_of_edges):
-                    m_edge = edge_list[i]
-
-                    # Check if first point and last point of edge is not the
+                    # Check if first point and last point of edges are not the
                     # same
-                    vector_a = m_edge[0].Shape.Edges[0].Vertexes[0].Point
-                    vector_b = m_edge[0].Shape.Edges[0].Vertexes[-1].Point
-                    if isEqualVectors(vector_a, vector_b):
-                        continue
-
-                    if M_LOCATION == "Single":
-                        buildFromEdge(M_MACRO,
-                                      m_group,
-                                      m_edge, M_NUMBERLINEPART, M_INDEXPART)
+                    edge_list = filterDegeneratedEdges(edge_list)
+
+                    if M_LOCATION == "All" and M_AS_ARRAY:
+                        # All points into one Point array object
+                        buildArrayFromEdges(m_builder, m_group,
+                                            edge_list, M_NUMBERLINEPART)
                     else:
-                        for m_i_part in range(M_NUMBERLINEPART + 1):
-                            buildFromEdge(M_MACRO,
-                                          m_group,
-                                          m_edge, M_NUMBERLINEPART, m_i_part)
-
-            # From Vertexes
-            else:
-                if number_of_vertexes > 2:
-                    m_group = createSubGroup(m_act_doc, m_main_dir, m_sub_dir)
-
-                # Even number of vertexes
-                if number_of_vertexes % 2 == 0:
-                    if WF.verbose():
-                        print_msg("Even number of points")
-
-                    if number_of_vertexes == 2:
-                        vertex1 = vertex_list[0]
-                        vertex2 = vertex_list[1]
-
-    #                     point1 = vertex1[0].Shape.Vertexes[0].Point
-    #                     point2 = vertex2[0].Shape.Vertexes[0].Point
-    #                     if isEqualVectors(point1, point2):
-    #                         return
-
-                        if M_LOCATION == "Single":
-                            buildFromPoints(M_MACRO,
-                                            m_group,
-                                            (vertex1, vertex2),
-                                            M_NUMBERLINEPART, M_INDEXPART)
+                        # Compute all points of all edges at once
+                        # and skip coincident points
+                        if M_LOCATION == "All":
+                            m_points = computeBatchFromEdges(edge_list,
+                                                             M_NUMBERLINEPART)
+                            m_uniques = uniqueBatchPoints(m_points)
+
+                        for m_i_edge, m_edge in enumerate(edge_list):
+                            if M_LOCATION == "Single":
+                                buildFromEdge(m_builder,
+                                              m_group,
+                                              m_edge, M_NUMBERLINEPART, M_INDEXPART)
+                            else:
+                                for m_i_part in range(M_NUMBERLINEPART + 1):
+                                    if not m_uniques[m_i_edge][m_i_part]:
+                                        continue
+                                    buildFromEdge(m_builder,
+                                                  m_group,
+                                                  m_edge, M_NUMBERLINEPART, m_i_part,
+                                                  batchResult(m_points[m_i_edge],
+                                                              m_i_part))
+
+                # From Vertexes
+                else:
+                    if number_of_vertexes > 2:
+                        m_group = createSubGroup(m_act_doc, m_main_dir, m_sub_dir)
+
+                    m_vertexes_list = []
+                    # Even number of vertexes
+                    if number_of_vertexes % 2 == 0:
+                        if WF.verbose():
+                            print_msg("Even number of points")
+
+                        if number_of_vertexes == 2:
+                            vertex1 = vertex_list[0]
+                            vertex2 = vertex_list[1]
+                            m_vertexes_list.append((vertex1, vertex2))
                         else:
-                            for m_i_part in range(M_NUMBERLINEPART + 1):
-                                buildFromPoints(M_MACRO,
-                                                m_group,
-                                                (vertex1, vertex2),
-                                                M_NUMBERLINEPART, m_i_part)
+                            for i in range(0, number_of_vertexes - 2, 2):
+                                vertex1 = vertex_list[i]
+                                vertex2 = vertex_list[i + 1]
+                                m_vertexes_list.append((vertex1, vertex2))
+                    # Odd number of vertexes
                     else:
-                        for i in range(0, number_of_vertexes - 2, 2):
+                        if WF.verbose():
+                            print_msg("Odd number of points")
+                        for i in range(number_of_vertexes - 1):
                             vertex1 = vertex_list[i]
                             vertex2 = vertex_list[i + 1]
+                            m_vertexes_list.append((vertex1, vertex2))
 
-    #                         point1 = vertex1[0].Shape.Vertexes[0].Point
-    #                         point2 = vertex2[0].Shape.Vertexes[0].Point
-    #                         if isEqualVectors(point1, point2):
-    #                             continue
+                    # Check if the points of each couple are not the same
+                    m_vertexes_list = filterEqualCouples(m_vertexes_list)
 
+                    if M_LOCATION == "All" and M_AS_ARRAY:
+                        # All points into one Point array object
+                        buildArrayFromPoints(m_builder, m_group,
+                                             m_vertexes_list, M_NUMBERLINEPART)
+                    else:
+                        # Compute all points of all couples at once
+                        # and skip coincident points
+                        if M_LOCATION == "All":
+                            m_points = computeBatchFromPoints(m_vertexes_list,
+                                                              M_NUMBERLINEPART)
+                            m_uniques = uniqueBatchPoints(m_points)
+
+                        for m_i_couple, (vertex1, vertex2) in enumerate(
+                                m_vertexes_list):
                             if M_LOCATION == "Single":
-                                buildFromPoints(M_MACRO,
+                                buildFromPoints(m_builder,
                                                 m_group,
                                                 (vertex1, vertex2),
                                                 M_NUMBERLINEPART, M_INDEXPART)
                             else:
                                 for m_i_part in range(M_NUMBERLINEPART + 1):
-                                    buildFromPoints(M_MACRO,
+                                    if not m_uniques[m_i_couple][m_i_part]:
+                                        continue
+                                    buildFromPoints(m_builder,
                                                     m_group,
                                                     (vertex1, vertex2),
-                                                    M_NUMBERLINEPART, m_i_part)
-                # Odd number of vertexes
-                else:
-                    if WF.verbose():
-                        print_msg("Odd number of points")
-                    for i in range(number_of_vertexes - 1):
-                        vertex1 = vertex_list[i]
-                        vertex2 = vertex_list[i + 1]
-
-                        if M_LOCATION == "Single":
-                            buildFromPoints(M_MACRO,
-                                            m_group,
-                                            (vertex1, vertex2),
-                                            M_NUMBERLINEPART, M_INDEXPART)
-                        else:
-                            for m_i_part in range(M_NUMBERLINEPART + 1):
-                                buildFromPoints(M_MACRO,
-                                                m_group,
-                                                (vertex1, vertex2),
-                                                M_NUMBERLINEPART, m_i_part)
+                                                    M_NUMBERLINEPART, m_i_part,
+                                                    batchResult(m_points[m_i_couple],
+                                                                m_i_part))
 
         except Exception as err:
             printError_msg(err.args[0], title=M_MACRO)
@@ -675,9 +902,6 @@ def center_line_point_command():
     except Exception as err:
         printError_msgWithTimer(err.args[0], title=M_MACRO)
 
-    App.ActiveDocument.commitTransaction()
-    App.activeDocument().recompute()
-
 
 if App.GuiUp:
     Gui.addCommand("CenterLinePoint", Command(M_ICON_NAME_FILE,
@@ -37,7 +37,8 @@ try:
     from WF_selection import getSel
     from WF_print import printError_msg, print_msg, printError_msgWithTimer
     from WF_directory import createFolders, addObjectToGrp
-    from WF_geometry import propertiesPoint
+    from WF_geometry import uniqueVectors, propertiesPoint
+    from WF_cache import getSubShape
     from WF_command import Command
 except ImportError:
     print("ERROR: Cannot load WF modules !")
@@ -175,6 +176,12 @@ def makeExtremaLinePointFeature(group):
 
 class ExtremaLinePoint(WF_Point):
     """ The ExtremaLinePoint feature object. """
+    properties_list = ['Edge',
+                       'At']
+    inputs = ['Edge',
+              'At']
+    macro = M_MACRO
+
     # this method is mandatory
 
     def __init__(self, selfobj):
@@ -209,71 +216,37 @@ relative to the parent Line.
 
         selfobj.Proxy = self
 
-    # this method is mandatory
-    def execute(self, selfobj):
-        """ Doing a recomputation.
+    def compute(self, selfobj):
+        """ Return the Shape and the result point(s) of the feature.
         """
-        m_properties_list = ['Edge',
-                             'At',
-                             ]
-        for m_property in m_properties_list:
-            if m_property not in selfobj.PropertiesList:
-                return
+        if M_DEBUG:
+            print("running ExtremaLinePoint.compute !")
 
+        vector_point = None
         if M_DEBUG:
-            print("running ExtremaLinePoint.execute !")
+            print_msg(str(selfobj.Edge))
 
-        # To be compatible with previous version > 2019
-        if 'Parametric' in selfobj.PropertiesList:
-            # Create the object the first time regardless
-            # the parametric behavior
-            if selfobj.Parametric == 'Not' and self.created:
-                return
-            if selfobj.Parametric == 'Interactive' and self.created:
-                return
+        if not selfobj.Edge[0].Shape.Edges:
+            return None
 
-        try:
-            vector_point = None
-            m_n = re.sub('[^0-9]', '', selfobj.Edge[1][0])
-            m_n = int(m_n)
-            if M_DEBUG:
-                print_msg(str(selfobj.Edge))
-                print_msg("m_n = " + str(m_n))
-
-            if not selfobj.Edge[0].Shape.Edges:
-                return
-
-            if selfobj.At == "Begin":
-                vector_point = selfobj.Edge[0].Shape.Edges[m_n -
-                                                           1].Vertexes[0].Point
-            else:
-                vector_point = selfobj.Edge[0].Shape.Edges[m_n -
-                                                           1].Vertexes[-1].Point
-
-            if vector_point is not None:
-                point = Part.Point(vector_point)
-                selfobj.Shape = point.toShape()
-                propertiesPoint(selfobj.Label, self.color)
-                selfobj.X = float(vector_point.x)
-                selfobj.Y = float(vector_point.y)
-                selfobj.Z = float(vector_point.z)
-                # To be compatible with previous version 2018
-                if 'Parametric' in selfobj.PropertiesList:
-                    self.created = True
-        except AttributeError as err:
-            print("AttributeError" + str(err))
-        except Exception as err:
-            printError_msg(err.args[0], title=M_MACRO)
+        m_edge = self.linkedShape(selfobj, 'Edge')
+        if selfobj.At == "Begin":
+            vector_point = m_edge.Vertexes[0].Point
+        else:
+            vector_point = m_edge.Vertexes[-1].Point
+
+        if vector_point is None:
+            return None
+        point = Part.Point(vector_point)
+        return (point.toShape(), [vector_point])
 
-    def onChanged(self, selfobj, prop):
+    def changed(self, selfobj, prop):
         """ Run when a proterty change.
         """
         if M_DEBUG:
-            print("running CenterLinePoint.onChanged !")
+            print("running CenterLinePoint.changed !")
             print("Change property : " + str(prop))
 
-        WF_Point.onChanged(self, selfobj, prop)
-
         if prop == "Parametric":
             if 'Parametric' in selfobj.PropertiesList:
                 if selfobj.Parametric == 'Not':
@@ -324,6 +297,19 @@ class ViewProviderExtremaLinePoint:
         ViewProviderExtremaLinePoint.icon = icon
 
 
+def buildFromEdge(macro, group, edge, at):
+    """ Build a ExtremaLinePoint feature object using an edge.
+    """
+    if WF.verbose():
+        print_msg("edge = " + str(edge))
+    App.ActiveDocument.openTransaction(macro)
+    selfobj = makeExtremaLinePointFeature(group)
+    selfobj.Edge = edge
+    selfobj.At = at
+    selfobj.Proxy.execute(selfobj)
+    WF.touch(selfobj)
+
+
 def extrema_line_point_command():
     """ This command use the selected object(s) to try to build a
     ExtremaLinePoint feature object.
@@ -362,37 +348,29 @@ def extrema_line_point_command():
             if WF.verbose():
                 print_msg("Group = " + str(m_group.Label))
 
-            for i in range(number_of_edges):
-                edge = edge_list[i]
-
+            # Collect all points to create and skip coincident points
+            # (ie: shared ends of consecutive Lines)
+            m_items = []
+            m_points = []
+            for edge in edge_list:
+                m_n = re.sub('[^0-9]', '', edge[1])
+                m_edge = getSubShape(edge[0], "Edge", int(m_n))
                 if M_LOCATION in ["Begin", "Both ends"]:
-                    App.ActiveDocument.openTransaction(M_MACRO)
-                    selfobj1 = makeExtremaLinePointFeature(m_group)
-                    selfobj1.Edge = edge
-                    selfobj1.At = "Begin"
-                    selfobj1.Proxy.execute(selfobj1)
-                    if str(selfobj1.Parametric) == 'Interactive':
-                        selfobj1.Parametric = 'Dynamic'
-                        selfobj1.touch()
-                        selfobj1.Parametric = 'Interactive'
-                    if str(selfobj1.Parametric) == 'Not':
-                        selfobj1.Parametric = 'Dynamic'
-                        selfobj1.touch()
-                        selfobj1.Parametric = 'Not'
+                    m_items.append((edge, "Begin"))
+                    m_points.append(m_edge.Vertexes[0].Point)
                 if M_LOCATION in ["End", "Both ends"]:
-                    App.ActiveDocument.openTransaction(M_MACRO)
-                    selfobj2 = makeExtremaLinePointFeature(m_group)
-                    selfobj2.Edge = edge
-                    selfobj2.At = "End"
-                    selfobj2.Proxy.execute(selfobj2)
-                    if str(selfobj2.Parametric) == 'Interactive':
-                        selfobj2.Parametric = 'Dynamic'
-                        selfobj2.touch()
-                        selfobj2.Parametric = 'Interactive'
-                    if str(selfobj2.Parametric) == 'Not':
-                        selfobj2.Parametric = 'Dynamic'
-                        selfobj2.touch()
-                        selfobj2.Parametric = 'Not'
+                    m_items.append((edge, "End"))
+                    m_points.append(m_edge.Vertexes[-1].Point)
+
+            m_uniques = uniqueVectors(m_points)
+            if WF.verbose():
+                m_msg = str(len(m_items) - sum(m_uniques))
+                m_msg += " coincident point(s) skipped"
+                print_msg(m_msg)
+
+            for (edge, at), m_unique in zip(m_items, m_uniques):
+                if m_unique:
+                    buildFromEdge(M_MACRO, m_group, edge, at)
 
         except Exception as err:
             printError_msg(err.args[0], title=M_MACRO)
@@ -31,6 +31,10 @@ if not sys.path.__contains__(str(PATH_WF_UTILS)):
 try:
     from WF_selection import Selection
     from WF_print import printError_msg, print_msg
+    from WF_utils import sortByDependencies, dependencyClosure
+    from WF_registry import getFeatures
+    from WF_gui import setVisibility
+    import WF_profiler
 except ImportError:
     print("ERROR: cannot load WF modules !")
     sys.exit(1)
@@ -359,44 +363,129 @@ class CommandShowHideNot:
             return False
 
 
+###############
+M_ICON_NAME_profiler = "/WF_profiler.svg"
+M_DIALOG_TITLE_profiler = "Export WF recompute profile"
+M_RESULT_MSG_profiler = """Profiling of WF features started !
+Recompute then click again to get the report.
+"""
+M_MENU_TEXT_profiler = "Profile WF features recompute"
+M_ACCEL_profiler = ""
+M_TOOL_TIP_profiler = """Click to start the recording of the time spent
+by each WF feature (execute and onChanged).
+Click again to see the slowest features and export the data as JSON !
+"""
+
+
+class CommandProfiler:
+    def GetResources(self):
+        return {'Pixmap': PATH_WF_ICONS + M_ICON_NAME_profiler,
+                'MenuText': M_MENU_TEXT_profiler,
+                'Accel': M_ACCEL_profiler,
+                'ToolTip': M_TOOL_TIP_profiler}
+
+    def Activated(self):
+        if not WF_profiler.isProfiling():
+            WF_profiler.clearProfile()
+            WF_profiler.setProfiling(True)
+            print_msg(M_RESULT_MSG_profiler)
+            return
+        run_profilerReport()
+
+    def IsActive(self):
+        return True
+
+
 if App.GuiUp:
     Gui.addCommand("ShowHideDynamic", CommandShowHideDynamic())
     Gui.addCommand("ShowHideInteractive", CommandShowHideInteractive())
     Gui.addCommand("ShowHideNo", CommandShowHideNot())
     Gui.addCommand("Refresh", CommandRefresh())
+    Gui.addCommand("Profiler", CommandProfiler())
 
 
 def run_refresh():
-    for obj in App.ActiveDocument.Objects:
-        # print str(obj.Name)
-        # print obj.PropertiesList
-        if "Parametric" in obj.PropertiesList:
-            if WF.verbose():
-                print(str(obj.Name))
-                print(str(obj.Parametric))
-            if str(obj.Parametric) == 'Interactive':
+    """ Update the Interactive parametric Objects whose parents changed
+    since their last update.
+    The Interactive WF Objects and all the objects they depend on are
+    visited in dependency order (parents first), so each stale Object is
+    updated once, after its own parents, including when the dependency
+    goes through Dynamic WF Objects or other objects.
+    """
+    m_features = getFeatures(App.ActiveDocument, mode='Interactive')
+    m_closure = dependencyClosure(m_features)
+    m_changed = set()
+    m_updated = 0
+    for obj in sortByDependencies(m_closure, parents=lambda o: o.OutList):
+        m_parametric = str(getattr(obj, "Parametric", ''))
+        m_upstream = any(m_parent.Name in m_changed
+                         for m_parent in obj.OutList)
+        if WF.verbose():
+            print(str(obj.Name))
+            print(m_parametric)
+        if m_parametric == 'Not':
+            continue
+        if not hasattr(getattr(obj, "Proxy", None), "refresh"):
+            if m_parametric == 'Interactive':
+                # Feature of a previous version
                 obj.Parametric = 'Dynamic'
                 obj.touch()
                 obj.Parametric = 'Interactive'
+            elif m_upstream:
+                # Object between two WF Objects
+                obj.recompute()
+            else:
+                continue
+            m_changed.add(obj.Name)
+            m_updated += 1
+            continue
+        if not obj.Proxy.isStale(obj):
+            continue
+        obj.Proxy.refresh(obj)
+        # Let the Dynamic children follow at the next recompute
+        obj.touch()
+        m_changed.add(obj.Name)
+        m_updated += 1
 
     if WF.verbose():
-        print_msg("Update done !")
+        print_msg("Update done ! (" + str(m_updated) + " Object(s) updated)")
 
 
 def run_showhide(parametric='Dynamic'):
-    for obj in App.ActiveDocument.Objects:
-        # print str(obj.Name)
-        # print obj.PropertiesList
-        if "Parametric" in obj.PropertiesList:
-            if WF.verbose():
-                print(str(obj.Name))
-                print(str(obj.Parametric))
-            if str(obj.Parametric) == parametric:
-                obj.ViewObject.Visibility = not obj.ViewObject.Visibility
+    m_features = getFeatures(App.ActiveDocument, mode=parametric)
+    if WF.verbose():
+        for obj in m_features:
+            print(str(obj.Name))
+            print(str(getattr(obj, "Parametric", '')))
+    setVisibility(m_features)
 
     if WF.verbose():
         print_msg("Show/Hide done !")
 
 
+def run_profilerReport(count=10):
+    """ Stop the profiler, print the slowest WF features and export the
+    recorded data as JSON.
+    """
+    WF_profiler.setProfiling(False)
+    print_msg(WF_profiler.report(count))
+
+    if not App.GuiUp:
+        return
+    m_file_name = QtGui.QFileDialog.getSaveFileName(None,
+                                                    M_DIALOG_TITLE_profiler,
+                                                    "WF_profile.json",
+                                                    "JSON (*.json)")
+    # PySide returns a tuple (file name, filter)
+    if isinstance(m_file_name, tuple):
+        m_file_name = m_file_name[0]
+    if m_file_name:
+        try:
+            WF_profiler.exportJson(m_file_name)
+            print_msg("Profile exported into " + str(m_file_name))
+        except Exception as err:
+            printError_msg(str(err))
+
+
 if __name__ == '__main__':
     run_refresh()
@@ -1,336 +1,607 @@
 # -*- coding: utf-8 -*-
 """
 ***************************************************************************
-*   FreeCAD Work Feature workbench                                        *
+*   This file is part of Work Feature workbench                           *
 *                                                                         *
-*   Copyright (c) 2017 <rentlau_64>                                       *
-*   Code rewrite by <rentlau_64> from Work Features macro:                *
-*   https://github.com/Rentlau/WorkFeature                                *
-*                                                                         *
-*   This file is a supplement to the FreeCAD CAx development system.      *  
-*   http://www.freecadweb.org                                             *
-*                                                                         *
-*   This program is free software; you can redistribute it and/or modify  *
-*   it under the terms of the GNU Lesser General Public License (LGPL)    *
-*   as published by the Free Software Foundation; either version 2 of     *
-*   the License, or (at your option) any later version.                   *
-*   for detail see the COPYING and COPYING.LESSER text files.             *
-*   http://en.wikipedia.org/wiki/LGPL                                     *
-*                                                                         *
-*   This software is distributed in the hope that it will be useful,      *
-*   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
-*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
-*   GNU Library General Public License for more details.                  *
-*                                                                         *
-*   You should have received a copy of the GNU Library General Public     *
-*   License along with this macro; if not, write to the Free Software     *
-*   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
-*   USA or see <http://www.gnu.org/licenses/>                             *
+*   Copyright (c) 2017-2019 <rentlau_64>                                  *
 ***************************************************************************
+Create Point(s) at the intersection of the selected Line(s) and Plane(s).
+
+Each selected Line/Edge is intersected with each selected Plane/Face.
+All (Line, Plane) pairs are solved at once.
+
+Selection behavior:
+If check box checked then the (Line, Plane) pairs where the Line does not
+cross the bounding box of the Face are skipped.
+If NOT checked then an intersection Point is created for each pair,
+even if the Face is not extended enough.
+If "as array" is checked all the intersection Points are stored into one
+single Point array object.
+
+How to
+- Select one or several Line/Edge(s) and
+- Select one or several Plane/Face(s) to process and/or
+- Select one or several Object(s) to process all Faces at once
+- Then Click on the icon
 """
-__title__="Macro LineFacePoint"
+import sys
+import os.path
+import re
+import FreeCAD as App
+import Part
+from PySide import QtCore
+from WF_config import PATH_WF_ICONS, PATH_WF_UTILS, PATH_WF_UI
+import WF
+from WF_Objects_base import WF_Point, WF_PointArray
+
+if App.GuiUp:
+    import FreeCADGui as Gui
+
+__title__ = "Macro_LineFacePoint"
 __author__ = "Rentlau_64"
 __brief__ = '''
 Macro LineFacePoint.
 Creates a parametric LineFacePoint from a Line and a Plane
 '''
 ###############
-
+M_DEBUG = False
 ###############
-import sys
-import os.path
-import FreeCAD as App
-if App.GuiUp:
-    import FreeCADGui as Gui
-import Part
-from PySide import QtGui,QtCore
-import WF
-from WF_Objects_base import WF_Point
-
-# get the path of the current python script 
-path_WF = os.path.dirname(__file__)
- 
-PATH_WF_ICONS     = os.path.join(path_WF, 'Resources', 'Icons')
-PATH_WF_UTILS     = os.path.join(path_WF, 'Utils')
-path_WF_resources = os.path.join(path_WF, 'Resources')
-PATH_WF_UI        = os.path.join(path_WF, 'Resources', 'Ui')
- 
 if not sys.path.__contains__(str(PATH_WF_UTILS)):
     sys.path.append(str(PATH_WF_UTILS))
     sys.path.append(str(PATH_WF_UI))
-     
+
 try:
-    from WF_selection import Selection, getSel
-    from WF_print import printError_msg, print_msg
-    from WF_directory import createFolders, addObjectToGrp
-    from WF_geometry import *
-    #from WF_utils import *
-except:
-    print "ERROR: cannot load WF modules !!"
+    from WF_selection import getSel
+    from WF_print import printError_msg, print_msg, printError_msgWithTimer
+    from WF_directory import createFolders, addObjectToGrp, createSubGroup
+    from WF_geometry import intersecLinePlane, intersecLinesPlanes, arrayToVector, arrayToVectors, propertiesPoint
+    from WF_builder import bulkBuild
+    from WF_cache import getBoundBox, getSubShape
+    from WF_command import Command
+except ImportError:
+    print("ERROR: Cannot load WF modules !")
     sys.exit(1)
 
 ###############
-M_ICON_NAME          = "/WF_lineFacePoint.svg"
-M_DIALOG        = None
-M_DIALOG_TITLE  = "Nothing"
-M_EXCEPTION_MSG = """Unable to create (Line,Face) Intersection(s) :
-    - Select one or several Line/Edge(s) 
-    and Second 
-    - Select one or several Plane/Face(s) to process and/or
-    - Select one or several Object(s) to process all Faces at once
-"""
-M_RESULT_MSG    = " : (Line,Face) Intersection(s) created !"
-M_MENU_TEXT     = "Point(s) = (Line, Plane)"
-M_ACCEL         = ""
-M_TOOL_TIP      = """<b>Create Point(s)</b> at the intersection of 
+M_ICON_NAME = "/WF_lineFacePoint.svg"
+M_ICON_NAME_FILE = os.path.join(PATH_WF_ICONS, M_ICON_NAME)
+M_DIALOG = "/WF_UI_lineFacePoint.ui"
+M_DIALOG_TITLE = "Define selection behavior."
+M_EXCEPTION_MSG = """
+Unable to create (Line,Face) Intersection(s) :
+- Select one or several Line/Edge(s) and
+- Select one or several Plane/Face(s) to process and/or
+- Select one or several Object(s) to process all Faces at once;
+
+and go to Parameter(s) Window in Task Panel!"""
+M_RESULT_MSG = " : (Line,Face) Intersection(s) created !"
+M_MENU_TEXT = "Point(s) = (Line, Plane)"
+M_ACCEL = ""
+M_TOOL_TIP = """<b>Create Point(s)</b> at the intersection of
 the Line(s) and Plane(s) selected.<br>
 <br>
-First<br>
-- Select one or several Line/Edge(s)<br> 
-and Second<br>
+- Select one or several Line/Edge(s) and<br>
 - Select one or several Plane/Face(s) to process and/or<br>
 - Select one or several Object(s) to process all Faces at once<br>
-- Then Click on the button<br>
+- Then Click on the Button/Icon<br>
 <br>
 Be aware that if the plane is not extended enough the <br>
-intersection Point is still created (as if).<br>  
+intersection Point is still created (as if),<br>
+unless the bounding box option is checked.<br>
 <br>
 <i>Click in view window without selection will popup<br>
- - a Warning Window !</i>
+ - a Warning Window and<br>
+ - a Parameter(s) Window in Task Panel!</i>
 """
 ###############
+M_MACRO = "Macro LineFacePoint"
+M_CULLING = False
+M_AS_ARRAY = False
+###############
+
+
+def setCulling(flag):
+    """ Set the selection behavior.
+
+    Parameters
+    -------
+    *flag* : (Boolean, Mandatory)
+            if True the (Line, Plane) pairs where the Line does not cross
+            the bounding box of the Face are skipped.
+    """
+    global M_CULLING
+    M_CULLING = bool(flag)
+
+
+def isCulling():
+    """ Get the selection behavior.
+
+    Return
+    -------
+    True if the (Line, Plane) pairs out of the bounding box of the Face
+    are skipped.
+    """
+    return M_CULLING
+
+
+def setAsArray(as_array):
+    """ Set if all the intersection points are created into one single
+    Point array object.
+
+    Parameters
+    -------
+    *as_array* : (Boolean, Mandatory)
+    """
+    global M_AS_ARRAY
+    M_AS_ARRAY = bool(as_array)
+
+
+def getAsArray():
+    """ Get if all the intersection points are created into one single
+    Point array object.
+
+    Return
+    -------
+    A Boolean.
+    """
+    return M_AS_ARRAY
+
+
+def getEdgeEnds(edge):
+    """ Return the 2 points defining the Line of the given edge link.
+    """
+    m_n = re.sub('[^0-9]', '', edge[1])
+    m_edge = getSubShape(edge[0], "Edge", int(m_n))
+    return m_edge.valueAt(0.0), m_edge.valueAt(m_edge.Length)
+
+
+def getFacePlane(face):
+    """ Return the normal, a point and the bounding box of the Face
+    of the given face link.
+    """
+    m_n = re.sub('[^0-9]', '', face[1])
+    m_face = getSubShape(face[0], "Face", int(m_n))
+    return (m_face.normalAt(0, 0),
+            m_face.CenterOfMass,
+            getBoundBox(face[0], "Face" + str(m_n)))
+
+
+def computeBatchIntersections(edge_list, plane_list, culling=False):
+    """ Compute at once the intersections of all edges with all faces.
+
+    Parameters
+    -------
+    *edge_list* : (List, Mandatory) edge links [obj, "EdgeN"]
+    *plane_list* : (List, Mandatory) face links [obj, "FaceN"]
+    *culling* : (Boolean, Optional, default=False)
+                skip the pairs where the Line does not cross the bounding
+                box of the Face.
+
+    Return
+    -------
+    The list of tuples (edge, face, result) with a valid intersection;
+    result is (shape, [vector]) as given by LineFacePoint.compute.
+    """
+    m_lines_a = []
+    m_lines_b = []
+    for m_edge in edge_list:
+        m_a, m_b = getEdgeEnds(m_edge)
+        m_lines_a.append(tuple(m_a))
+        m_lines_b.append(tuple(m_b))
+
+    m_normals = []
+    m_points = []
+    m_boxes = []
+    for m_face in plane_list:
+        m_normal, m_point, m_box = getFacePlane(m_face)
+        m_normals.append(tuple(m_normal))
+        m_points.append(tuple(m_point))
+        m_boxes.append(m_box)
+
+    m_indexes, m_intersections = intersecLinesPlanes(
+        m_lines_a, m_lines_b, m_normals, m_points,
+        m_boxes if culling else None)
+
+    m_pairs = []
+    for (m_i, m_j), m_intersection in zip(m_indexes, m_intersections):
+        vector_point = arrayToVector(m_intersection)
+        m_pairs.append((edge_list[m_i], plane_list[m_j],
+                        (Part.Point(vector_point).toShape(), [vector_point])))
+
+    if WF.verbose():
+        m_msg = str(len(m_pairs)) + " / "
+        m_msg += str(len(edge_list) * len(plane_list))
+        m_msg += " (Line, Plane) pair(s) kept"
+        print_msg(m_msg)
+
+    return m_pairs
+
+
+class LineFacePointPanel:
+    """ The LineFacePointPanel (GUI).
+    """
 
-class LineFacePointPanel:  
     def __init__(self):
         self.form = Gui.PySideUic.loadUi(PATH_WF_UI + M_DIALOG)
         self.form.setWindowTitle(M_DIALOG_TITLE)
-                        
+
+        self.form.UI_LineFacePoint_checkBox.setCheckState(
+            QtCore.Qt.Unchecked)
+        if M_CULLING:
+            self.form.UI_LineFacePoint_checkBox.setCheckState(
+                QtCore.Qt.Checked)
+        self.form.UI_LineFacePoint_asArray_checkBox.setCheckState(
+            QtCore.Qt.Unchecked)
+        if M_AS_ARRAY:
+            self.form.UI_LineFacePoint_asArray_checkBox.setCheckState(
+                QtCore.Qt.Checked)
+
     def accept(self):
+        """ Run when click on OK button.
+        """
+        global M_CULLING
+        global M_AS_ARRAY
+
+        M_CULLING = self.form.UI_LineFacePoint_checkBox.isChecked()
+        M_AS_ARRAY = self.form.UI_LineFacePoint_asArray_checkBox.isChecked()
+
+        if WF.verbose():
+            print_msg("M_CULLING = " + str(M_CULLING))
+            print_msg("M_AS_ARRAY = " + str(M_AS_ARRAY))
+
         Gui.Control.closeDialog()
         m_act_doc = App.activeDocument()
         if m_act_doc is not None:
-            if len(Gui.Selection.getSelectionEx(m_act_doc.Name)) != 0:
-                run()
+            if Gui.Selection.getSelectionEx(m_act_doc.Name):
+                line_face_point_command()
         return True
-    
+
     def reject(self):
+        """ Run when click on CANCEL button.
+        """
         Gui.Control.closeDialog()
         return False
-    
-    def shouldShow(self):    
-        return (len(Gui.Selection.getSelectionEx(App.activeDocument().Name)) == 0 )   
+
+    def shouldShow(self):
+        """ Must show when nothing selected.
+        """
+        return len(Gui.Selection.getSelectionEx(
+            App.activeDocument().Name)) == 0
 
 
 def makeLineFacePointFeature(group):
-    """ Makes a LineFacePoint parametric feature object. 
+    """ Makes a LineFacePoint parametric feature object.
     into the given Group
     Returns the new object.
-    """ 
+    """
     m_name = "LineFacePoint_P"
-    m_part = "Part::FeaturePython"     
-    
-    try:     
-        m_obj = App.ActiveDocument.addObject(str(m_part),str(m_name))
-        if group != None :
-            addObjectToGrp(m_obj,group,info=1)
+    m_part = "Part::FeaturePython"
+
+    if group is None:
+        return None
+    try:
+        m_obj = App.ActiveDocument.addObject(str(m_part), str(m_name))
+        if group is not None:
+            addObjectToGrp(m_obj, group, info=1)
         LineFacePoint(m_obj)
-        ViewProviderLineFacePoint(m_obj.ViewObject)
-    except:
-        printError_msg( "Not able to add an object to Model!")
+        if App.GuiUp:
+            ViewProviderLineFacePoint(m_obj.ViewObject)
+    except Exception as err:
+        printError_msg("Not able to add an object to Model!")
+        printError_msg(err.args[0], title=M_MACRO)
+        return None
+
+    return m_obj
+
+
+def makeLineFacePointArrayFeature(group):
+    """ Makes a LineFacePointArray parametric feature object.
+    into the given Group
+    Returns the new object.
+    """
+    m_name = "LineFacePointArray_P"
+    m_part = "Part::FeaturePython"
+
+    if group is None:
+        return None
+    try:
+        m_obj = App.ActiveDocument.addObject(str(m_part), str(m_name))
+        if group is not None:
+            addObjectToGrp(m_obj, group, info=1)
+        LineFacePointArray(m_obj)
+        if App.GuiUp:
+            ViewProviderLineFacePoint(m_obj.ViewObject)
+    except Exception as err:
+        printError_msg("Not able to add an object to Model!")
+        printError_msg(err.args[0], title=M_MACRO)
         return None
-    
+
     return m_obj
 
 
 class LineFacePoint(WF_Point):
-    """ The LineFacePoint feature object. """
-    # this method is mandatory
-    def __init__(self,selfobj):
+    """ The LineFacePoint feature object.
+    """
+    properties_list = ['Edge',
+                       'Face']
+    inputs = ['Edge',
+              'Face']
+    macro = M_MACRO
+
+    def __init__(self, selfobj):
+        if M_DEBUG:
+            print("running LineFacePoint.__init__ !")
+
         self.name = "LineFacePoint"
         WF_Point.__init__(self, selfobj, self.name)
-        """ Add some custom properties to our LineFacePoint feature object. """
-        selfobj.addProperty("App::PropertyLinkSub","Face",self.name,
-                            "Input face")   
-        selfobj.addProperty("App::PropertyLinkSub","Edge",self.name,
+        # Add some custom properties to our feature object.
+        selfobj.addProperty("App::PropertyLinkSub",
+                            "Edge",
+                            self.name,
                             "Input edge")
-        selfobj.setEditorMode("Face", 1)
+        selfobj.addProperty("App::PropertyLinkSub",
+                            "Face",
+                            self.name,
+                            "Input face")
+
         selfobj.setEditorMode("Edge", 1)
-        selfobj.Proxy = self    
-     
-    # this method is mandatory   
-    def execute(self,selfobj): 
-        """ Print a short message when doing a recomputation. """
-#         if WF.verbose() != 0:
-#             App.Console.PrintMessage("Recompute Python LineFacePoint feature\n")
-                
-        if 'Face' not in selfobj.PropertiesList:
-            return
-        if 'Edge' not in selfobj.PropertiesList:
-            return
-        
-        n1 = eval(selfobj.Face[1][0].lstrip('Face'))
-        n2 = eval(selfobj.Edge[1][0].lstrip('Edge'))
-#         if WF.verbose() != 0:
-#             print_msg("n1 = " + str(n1)) 
-#             print_msg("n2 = " + str(n2))     
-        
-        try: 
-            m_face = selfobj.Face[0].Shape.Faces[n1-1]
-            m_edge = selfobj.Edge[0].Shape.Edges[n2-1]
-            
-            if WF.verbose() != 0:
-                print_msg("m_face = " + str(m_face)) 
-                print_msg("m_edge = " + str(m_edge))           
-                            
-            Vector_A = m_edge.valueAt( 0.0 )
-            Vector_B = m_edge.valueAt( m_edge.Length )
-            Plane_Normal = m_face.normalAt(0,0)
-            Plane_Point  = m_face.CenterOfMass
-            
-            Vector_point = intersecLinePlane(Vector_A, Vector_B, 
-                                             Plane_Normal, Plane_Point)  
-          
-            point = Part.Point( Vector_point )         
-            selfobj.Shape = point.toShape()
-            propertiesPoint(selfobj.Label)
-            selfobj.X = float(Vector_point.x)
-            selfobj.Y = float(Vector_point.y)
-            selfobj.Z = float(Vector_point.z)
-        except:
-            pass
-                 
-    def onChanged(self, selfobj, prop):
-        """ Print the name of the property that has changed """
-        # Debug mode
-        if WF.verbose() != 0:
-            App.Console.PrintMessage("Change property : " + str(prop) + "\n")
-        
-        WF_Point.onChanged(self, selfobj, prop)   
-    
-            
+        selfobj.setEditorMode("Face", 1)
+        selfobj.Proxy = self
+
+    def compute(self, selfobj):
+        """ Return the Shape and the result point(s) of the feature.
+        """
+        if M_DEBUG:
+            print("running LineFacePoint.compute !")
+
+        vector_point = None
+        if selfobj.Edge is not None and selfobj.Face is not None:
+            if M_DEBUG:
+                print_msg(str(selfobj.Edge))
+                print_msg(str(selfobj.Face))
+
+            m_edge = self.linkedShape(selfobj, 'Edge')
+            m_face = self.linkedShape(selfobj, 'Face')
+            vector_a = m_edge.valueAt(0.0)
+            vector_b = m_edge.valueAt(m_edge.Length)
+            plane_normal = m_face.normalAt(0, 0)
+            plane_point = m_face.CenterOfMass
+
+            vector_point = intersecLinePlane(vector_a, vector_b,
+                                             plane_normal,
+                                             plane_point)
+
+        if vector_point is None:
+            return None
+        point = Part.Point(vector_point)
+        return (point.toShape(), [vector_point])
+
+    def changed(self, selfobj, prop):
+        """ Run when a proterty change.
+        """
+        if M_DEBUG:
+            print("running LineFacePoint.changed !")
+            print("Change property : " + str(prop))
+
+        if prop == "Parametric":
+            propertiesPoint(selfobj.Label, self.color)
+
+
+class LineFacePointArray(WF_PointArray):
+    """ The LineFacePointArray feature object : the intersections of
+    several Lines with several Planes into one object.
+    """
+    properties_list = ['Edges',
+                       'Faces',
+                       'Culling']
+    inputs = ['Edges',
+              'Faces',
+              'Culling']
+    macro = M_MACRO
+
+    def __init__(self, selfobj):
+        if M_DEBUG:
+            print("running LineFacePointArray.__init__ !")
+
+        self.name = "LineFacePointArray"
+        WF_PointArray.__init__(self, selfobj, self.name)
+        # Add some custom properties to our feature object.
+        selfobj.addProperty("App::PropertyLinkSubListGlobal",
+                            "Edges",
+                            self.name,
+                            "Input edges")
+        selfobj.addProperty("App::PropertyLinkSubListGlobal",
+                            "Faces",
+                            self.name,
+                            "Input faces")
+
+        m_tooltip = """If True the (Line, Plane) pairs where the Line does not
+cross the bounding box of the Face are skipped.
+"""
+        selfobj.addProperty("App::PropertyBool",
+                            "Culling",
+                            self.name,
+                            m_tooltip).Culling = False
+
+        selfobj.setEditorMode("Edges", 1)
+        selfobj.setEditorMode("Faces", 1)
+        selfobj.Proxy = self
+
+    def compute(self, selfobj):
+        """ Return the Shape (compound of points) and the result points
+        of the feature.
+        Pairs with parallel Line and Plane are skipped.
+        """
+        if M_DEBUG:
+            print("running LineFacePointArray.compute !")
+
+        m_lines_a = []
+        m_lines_b = []
+        for m_edge in self.linkedShapes(selfobj, 'Edges'):
+            m_lines_a.append(tuple(m_edge.valueAt(0.0)))
+            m_lines_b.append(tuple(m_edge.valueAt(m_edge.Length)))
+        m_normals = []
+        m_points = []
+        for m_face in self.linkedShapes(selfobj, 'Faces'):
+            m_normals.append(tuple(m_face.normalAt(0, 0)))
+            m_points.append(tuple(m_face.CenterOfMass))
+        if not m_lines_a or not m_normals:
+            return None
+
+        m_boxes = None
+        if selfobj.Culling:
+            m_boxes = [getBoundBox(m_obj, m_type + str(m_index))
+                       for m_obj, m_type, m_index in self.resolveLinks(selfobj,
+                                                                       'Faces')]
+
+        _, m_intersections = intersecLinesPlanes(m_lines_a, m_lines_b,
+                                                 m_normals, m_points,
+                                                 m_boxes)
+        m_vectors = arrayToVectors(m_intersections)
+        if not m_vectors:
+            return None
+        m_shape = Part.makeCompound([Part.Vertex(m_vector)
+                                     for m_vector in m_vectors])
+        return (m_shape, m_vectors)
+
+    def changed(self, selfobj, prop):
+        """ Run when a proterty change.
+        """
+        if M_DEBUG:
+            print("running LineFacePointArray.changed !")
+            print("Change property : " + str(prop))
+
+        if prop == "Parametric":
+            if 'Parametric' in selfobj.PropertiesList:
+                if selfobj.Parametric == 'Not':
+                    selfobj.setEditorMode("Culling", 1)
+                else:
+                    selfobj.setEditorMode("Culling", 0)
+            propertiesPoint(selfobj.Label, self.color)
+
+        if prop == "Culling":
+            selfobj.Proxy.execute(selfobj)
+
+
 class ViewProviderLineFacePoint:
-    global PATH_WF_ICONS
-    icon = '/WF_lineFacePoint.svg'  
-    def __init__(self,vobj):
+    icon = M_ICON_NAME
+
+    def __init__(self, vobj):
         """ Set this object to the proxy object of the actual view provider """
         vobj.Proxy = self
-    
-    # this method is mandatory    
-    def attach(self, vobj): 
+
+    # this method is mandatory
+    def attach(self, vobj):
         self.ViewObject = vobj
         self.Object = vobj.Object
-  
-    def setEdit(self,vobj,mode):
+
+    def setEdit(self, vobj, mode):
         return False
-    
-    def unsetEdit(self,vobj,mode):
+
+    def unsetEdit(self, vobj, mode):
         return
 
     def __getstate__(self):
         return None
 
-    def __setstate__(self,state):
+    def __setstate__(self, state):
         return None
-    
+
     # subelements is a tuple of strings
-    def onDelete(self, feature, subelements): 
+    def onDelete(self, feature, subelements):
         return True
-    
+
     # This method is optional and if not defined a default icon is shown.
-    def getIcon(self):        
+    def getIcon(self):
         """ Return the icon which will appear in the tree view. """
-        return (PATH_WF_ICONS + ViewProviderLineFacePoint.icon)
-           
-    def setIcon(self, icon = '/WF_lineFacePoint.svg'):
+        return PATH_WF_ICONS + ViewProviderLineFacePoint.icon
+
+    def setIcon(self, icon=M_ICON_NAME):
         ViewProviderLineFacePoint.icon = icon
-  
-            
-class CommandLineFacePoint:
-    """ Command to create LineFacePoint feature object. """
-    def GetResources(self):
-        return {'Pixmap'  : PATH_WF_ICONS + M_ICON_NAME,
-                'MenuText': M_MENU_TEXT,
-                'Accel'   : M_ACCEL,
-                'ToolTip' : M_TOOL_TIP}
-
-    def Activated(self):
-        m_act_doc = App.activeDocument()
-        if m_act_doc is not None:
-            if len(Gui.Selection.getSelectionEx(m_act_doc.Name)) == 0:
-                pass
-                #Gui.Control.showDialog(LineFacePointPanel())
-
-        run()
-        
-    def IsActive(self):
-        if App.ActiveDocument:
-            return True
-        else:
-            return False
 
-if App.GuiUp:
-    Gui.addCommand("LineFacePoint", CommandLineFacePoint())
 
+def buildFromEdgeAndFace(builder, group, edge, face, result=None):
+    """ Build a LineFacePoint feature object using an edge and a face.
+    result is the Shape and point if already computed (see
+    computeBatchIntersections).
+    """
+    if WF.verbose():
+        print_msg("edge = " + str(edge))
+        print_msg("face = " + str(face))
+    builder.build(makeLineFacePointFeature, group, result=result,
+                  Edge=edge, Face=face)
 
-def run():
+
+def buildArrayFromEdgesAndFaces(builder, group, edges, faces, culling):
+    """ Build one LineFacePointArray feature object with all the
+    intersections of the edges and the faces.
+    """
+    if WF.verbose():
+        print_msg("edges = " + str(edges))
+        print_msg("faces = " + str(faces))
+    builder.build(makeLineFacePointArrayFeature, group,
+                  Edges=edges, Faces=faces, Culling=culling)
+
+
+def line_face_point_command():
+    """ This command use the selected object(s) to try to build a
+    LineFacePoint feature object.
+    """
     m_sel, m_act_doc = getSel(WF.verbose())
-      
-    try:         
-        number_of_edges, edge_list = m_sel.get_segmentsNames(
-            getfrom=["Segments","Curves"])
-        if WF.verbose() != 0:
-            print_msg("number_of_edges = " + str(number_of_edges))
-            print_msg("edge_list = " + str(edge_list))
-             
-        Number_of_Planes, Plane_List = m_sel.get_planesNames(
-            getfrom=["Planes","Objects"])
-        if WF.verbose() != 0:      
-            print_msg("Number_of_Planes = " + str(Number_of_Planes))
-            print_msg("Plane_List = " + str(Plane_List))
-            
-        if number_of_edges == 0 or Number_of_Planes == 0 :
+
+    edges_from = ["Segments", "Curves"]
+    planes_from = ["Planes", "Shells"]
+    try:
+        number_of_edges, edge_list = m_sel.get_segmentsWithNames(
+            get_from=edges_from)
+        number_of_planes, plane_list = m_sel.get_planesWithNames(
+            get_from=planes_from)
+
+        if number_of_edges == 0 or number_of_planes == 0:
             raise Exception(M_EXCEPTION_MSG)
+
         try:
-            m_main_dir = "WorkPoints_P"
-            m_sub_dir  = "Set"   
-            m_group = createFolders(str(m_main_dir))
-
-            # Create a sub group if needed
-            if number_of_edges > 1 or Number_of_Planes > 1:
-                try:
-                    m_ob = App.ActiveDocument.getObject(str(m_main_dir)).newObject("App::DocumentObjectGroup", str(m_sub_dir))
-                    m_group = m_act_doc.getObject( str(m_ob.Label) )
-                except:
-                    printError_msg("Could not Create '"+ str(m_sub_dir) +"' Objects Group!")           
-                        
-            if WF.verbose() != 0:
-                print_msg("Group = " + str(m_group.Label))
-                
-            for i in range( number_of_edges ):
-                edge = edge_list[i]
-                if WF.verbose() != 0:
-                    print_msg("edge = " + str(edge))
-                
-                for j in range( Number_of_Planes ):
-                    plane = Plane_List[j]
-                    if WF.verbose() != 0:
-                        print_msg("plane = " + str(plane))
-                                  
-                    App.ActiveDocument.openTransaction("Macro LineFacePoint")
-                    selfobj = makeLineFacePointFeature(m_group) 
-                    selfobj.Edge           = edge  
-                    selfobj.Face           = plane
-                    selfobj.Proxy.execute(selfobj)                   
-                                                   
-        finally:
-            App.ActiveDocument.commitTransaction()
-            
-        
-
-            
+            with bulkBuild(M_MACRO) as m_builder:
+                if WF.verbose():
+                    print_msg("Culling = " + str(M_CULLING))
+
+                m_main_dir = "WorkPoints_P"
+                m_sub_dir = "Set000"
+                m_group = createFolders(str(m_main_dir))
+
+                if M_AS_ARRAY:
+                    # All points into one Point array object
+                    buildArrayFromEdgesAndFaces(m_builder, m_group,
+                                                edge_list, plane_list,
+                                                M_CULLING)
+                else:
+                    # Compute all intersections of all pairs at once
+                    m_pairs = computeBatchIntersections(edge_list, plane_list,
+                                                        M_CULLING)
+
+                    # Create a sub group if needed
+                    if len(m_pairs) > 1:
+                        m_group = createSubGroup(m_act_doc, m_main_dir, m_sub_dir)
+
+                    for m_edge, m_face, m_result in m_pairs:
+                        buildFromEdgeAndFace(m_builder, m_group,
+                                             m_edge, m_face, m_result)
+
+        except Exception as err:
+            printError_msg(err.args[0], title=M_MACRO)
+
     except Exception as err:
-        printError_msg(err.args[0], title="Macro LineFacePoint")
+        printError_msgWithTimer(err.args[0], title=M_MACRO)
+
+
+if App.GuiUp:
+    Gui.addCommand("LineFacePoint", Command(M_ICON_NAME_FILE,
+                                            M_MENU_TEXT,
+                                            M_ACCEL,
+                                            M_TOOL_TIP,
+                                            LineFacePointPanel,
+                                            line_face_point_command))
+
 
-                           
 if __name__ == '__main__':
-    run()
\ No newline at end of file
+    line_face_point_command()
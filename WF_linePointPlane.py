@@ -43,7 +43,8 @@ try:
     from WF_selection import getSel
     from WF_print import printError_msg, print_msg, printError_msgWithTimer
     from WF_directory import createFolders, addObjectToGrp, createSubGroup
-    from WF_geometry import isEqualVectors, isColinearVectors, meanVectorsPoint, minMaxVectorsLimits, propertiesPlane
+    from WF_geometry import isEqualVectors, isColinearVectors, areDegeneratedTriples, meanVectorsPoint, minMaxVectorsLimits, propertiesPlane
+    from WF_cache import getSubShape
     from WF_command import Command
 except ImportError:
     print("ERROR: cannot load WF modules !")
@@ -168,6 +169,13 @@ def makeLinePointPlaneFeature(group):
 class LinePointPlane(WF_Plane):
     """ The LinePointPlane feature object.
     """
+    properties_list = ['Edge',
+                       'Point',
+                       'Extension']
+    inputs = ['Edge',
+              'Point',
+              'Extension']
+    macro = M_MACRO
 
     def __init__(self, selfobj):
         if M_DEBUG:
@@ -197,123 +205,80 @@ class LinePointPlane(WF_Plane):
         selfobj.setEditorMode("Point", 1)
         selfobj.Proxy = self
 
-    def execute(self, selfobj):
-        """ Doing a recomputation.
+    def compute(self, selfobj):
+        """ Return the Shape and the result point(s) of the feature.
         """
-        m_properties_list = ['Edge',
-                             'Point',
-                             'Extension'
-                             ]
-        for m_property in m_properties_list:
-            if m_property not in selfobj.PropertiesList:
-                return
-
         if M_DEBUG:
-            print("running LinePointPlane.execute !")
-
-        # To be compatible with previous version > 2019
-        if 'Parametric' in selfobj.PropertiesList:
-            # Create the object the first time regardless
-            # the parametric behavior
-            if selfobj.Parametric == 'Not' and self.created:
-                return
-            if selfobj.Parametric == 'Interactive' and self.created:
-                return
-
-        try:
-            plane = None
-            if selfobj.Edge is not None and selfobj.Point is not None:
-                # n1 = eval(selfobj.Point[1][0].lstrip('Vertex'))
-                # n2 = eval(selfobj.Edge[1][0].lstrip('Edge'))
-                m_n1 = re.sub('[^0-9]', '', selfobj.Point[1][0])
-                m_n2 = re.sub('[^0-9]', '', selfobj.Edge[1][0])
-                m_n1 = int(m_n1)
-                m_n2 = int(m_n2)
-                if M_DEBUG:
-                    print_msg(str(selfobj.Point))
-                    print_msg(str(selfobj.Edge))
-                    print_msg("n1 = " + str(m_n1))
-                    print_msg("n2 = " + str(m_n2))
-
-                points = []
-                point_a = selfobj.Edge[0].Shape.Edges[m_n2 -
-                                                      1].Vertexes[0].Point
-                point_b = selfobj.Edge[0].Shape.Edges[m_n2 -
-                                                      1].Vertexes[-1].Point
-                point_c = selfobj.Point[0].Shape.Vertexes[m_n1 - 1].Point
-
-                if isEqualVectors(point_a, point_b):
-                    m_msg = """Unable to create Plane from 2 equals Points :
-                    Points 1 and 2 are equals !
-                    """
-                    printError_msg(m_msg, title=M_MACRO)
-                    return
-
-                if isEqualVectors(point_a, point_c):
-                    m_msg = """Unable to create Plane from 2 equals Points :
-                    Points 1 an 3 are equals !
-                    """
-                    printError_msg(m_msg, title=M_MACRO)
-                    return
-
-                if isEqualVectors(point_b, point_c):
-                    m_msg = """Unable to create Plane from 2 equals Points :
-                    Points 2 an 3 are equals !
-                    """
-                    printError_msg(m_msg, title=M_MACRO)
-                    return
-
-                if isColinearVectors(point_a, point_b, point_c):
-                    printError_msg(M_EXCEPTION_MSG, title=M_MACRO)
-                    return
-                points.append(point_a)
-                points.append(point_b)
-                points.append(point_c)
-
-                vector_center = meanVectorsPoint(points)
-
-                vector21 = point_b - point_a
-                vector31 = point_c - point_a
-                plane_point = vector_center
-                plane_normal = vector21.cross(vector31)
-
-                edge_length = selfobj.Extension
-                plane = Part.makePlane(edge_length,
-                                       edge_length,
-                                       plane_point,
-                                       plane_normal)
-                plane_center = plane.CenterOfMass
-                plane_translate = plane_point - plane_center
-                plane.translate(plane_translate)
-
-            if plane is not None:
-                selfobj.Shape = plane
-                propertiesPlane(selfobj.Label, self.color)
-                selfobj.Point1_X = float(point_a.x)
-                selfobj.Point1_Y = float(point_a.y)
-                selfobj.Point1_Z = float(point_a.z)
-                selfobj.Point2_X = float(point_b.x)
-                selfobj.Point2_Y = float(point_b.y)
-                selfobj.Point2_Z = float(point_b.z)
-                selfobj.Point3_X = float(point_c.x)
-                selfobj.Point3_Y = float(point_c.y)
-                selfobj.Point3_Z = float(point_c.z)
-                # To be compatible with previous version 2018
-                if 'Parametric' in selfobj.PropertiesList:
-                    self.created = True
-        except AttributeError as err:
-            print("AttributeError" + str(err))
-        except Exception as err:
-            printError_msg(err.args[0], title=M_MACRO)
-
-    def onChanged(self, selfobj, prop):
+            print("running LinePointPlane.compute !")
+
+        plane = None
+        if selfobj.Edge is not None and selfobj.Point is not None:
+            if M_DEBUG:
+                print_msg(str(selfobj.Point))
+                print_msg(str(selfobj.Edge))
+
+            points = []
+            m_edge = self.linkedShape(selfobj, 'Edge')
+            point_a = m_edge.Vertexes[0].Point
+            point_b = m_edge.Vertexes[-1].Point
+            point_c = self.linkedShape(selfobj, 'Point').Point
+
+            # Tolerance read once for all checks
+            m_tolerance = WF.tolerance()
+            if isEqualVectors(point_a, point_b, m_tolerance):
+                m_msg = """Unable to create Plane from 2 equals Points :
+                Points 1 and 2 are equals !
+                """
+                printError_msg(m_msg, title=M_MACRO)
+                return None
+
+            if isEqualVectors(point_a, point_c, m_tolerance):
+                m_msg = """Unable to create Plane from 2 equals Points :
+                Points 1 an 3 are equals !
+                """
+                printError_msg(m_msg, title=M_MACRO)
+                return None
+
+            if isEqualVectors(point_b, point_c, m_tolerance):
+                m_msg = """Unable to create Plane from 2 equals Points :
+                Points 2 an 3 are equals !
+                """
+                printError_msg(m_msg, title=M_MACRO)
+                return None
+
+            if isColinearVectors(point_a, point_b, point_c, m_tolerance):
+                printError_msg(M_EXCEPTION_MSG, title=M_MACRO)
+                return None
+            points.append(point_a)
+            points.append(point_b)
+            points.append(point_c)
+
+            vector_center = meanVectorsPoint(points)
+
+            vector21 = point_b - point_a
+            vector31 = point_c - point_a
+            plane_point = vector_center
+            plane_normal = vector21.cross(vector31)
+
+            edge_length = selfobj.Extension
+            plane = Part.makePlane(edge_length,
+                                   edge_length,
+                                   plane_point,
+                                   plane_normal)
+            plane_center = plane.CenterOfMass
+            plane_translate = plane_point - plane_center
+            plane.translate(plane_translate)
+
+        if plane is None:
+            return None
+        return (plane, [point_a, point_b, point_c])
+
+    def changed(self, selfobj, prop):
         """ Print the name of the property that has changed """
         if M_DEBUG:
-            print("running LinePointPlane.onChanged !")
+            print("running LinePointPlane.changed !")
             print("Change property : " + str(prop))
 
-        WF_Plane.onChanged(self, selfobj, prop)
-
         if prop == "Parametric":
             if 'Parametric' in selfobj.PropertiesList:
                 if selfobj.Parametric == 'Not':
@@ -411,6 +376,15 @@ def line_point_plane_command():
             if number_of_edges == 1 and number_of_vertexes == 1:
                 edge = edge_list[0]
                 vertex = vertex_list[0]
+                # Check the Line and the Point define a Plane
+                m_n = re.sub('[^0-9]', '', edge[1])
+                m_edge = getSubShape(edge[0], "Edge", int(m_n))
+                m_n = re.sub('[^0-9]', '', vertex[1])
+                point_c = getSubShape(vertex[0], "Vertex", int(m_n)).Point
+                if areDegeneratedTriples([m_edge.Vertexes[0].Point],
+                                         [m_edge.Vertexes[-1].Point],
+                                         [point_c])[0]:
+                    raise Exception(M_EXCEPTION_MSG)
 
                 buildFromPointAndLine(
                     M_MACRO, m_group, vertex, edge, M_PLANE_EXT)
@@ -17,7 +17,6 @@ How to
 """
 import sys
 import os.path
-import re
 import FreeCAD as App
 import Part
 from PySide import QtCore
@@ -47,7 +46,6 @@ try:
     from WF_print import printError_msg, print_msg, printError_msgWithTimer
     from WF_directory import createFolders, addObjectToGrp, createSubGroup
     from WF_geometry import coordVectorPoint, propertiesLine
-    from WF_utils import linkSubList_convertToOldStyle
     from WF_command import Command
 except ImportError:
     print("ERROR: Cannot load WF modules !")
@@ -168,7 +166,8 @@ def makeNPointsLineFeature(group):
         if group is not None:
             addObjectToGrp(m_obj, group, info=1)
         m_inst = NPointsLine(m_obj)
-        ViewProviderNPointsLine(m_obj.ViewObject)
+        if App.GuiUp:
+            ViewProviderNPointsLine(m_obj.ViewObject)
     except Exception as err:
         printError_msg("Not able to add an object to Model!")
         printError_msg(err.args[0], title=M_MACRO)
@@ -180,6 +179,10 @@ def makeNPointsLineFeature(group):
 class NPointsLine(WF_Line):
     """ The NPointsLine feature object.
     """
+    properties_list = ['Points']
+    inputs = ['Points',
+              'VectorIndex']
+    macro = M_MACRO
 
     def __init__(self, selfobj):
         if M_DEBUG:
@@ -217,136 +220,98 @@ of the Singular Value Decomposition (SVD).
         # from within the class
         # self.Object = selfobj
 
-    def execute(self, selfobj):
-        """ Doing a recomputation.
+    def compute(self, selfobj):
+        """ Return the Shape and the result point(s) of the feature.
         """
-        m_properties_list = ['Points',
-                             "VectorIndex",
-                             ]
-        for m_property in m_properties_list:
-            if m_property not in selfobj.PropertiesList:
-                return
-
         if M_DEBUG:
-            print("running NPointsLine.execute !")
-
-        # To be compatible with previous version > 2019
-        if 'Parametric' in selfobj.PropertiesList:
-            # Create the object the first time regardless
-            # the parametric behavior
-            if selfobj.Parametric == 'Not' and self.created:
-                return
-            if selfobj.Parametric == 'Interactive' and self.created:
-                return
+            print("running NPointsLine.compute !")
 
         try:
             import numpy as np
         except ImportError:
             m_msg = "You MUST install numpy to use this function !"
             printError_msg(m_msg, title=M_MACRO)
-
-        try:
-            line = None
-            m_points = []
-            m_x = []
-            m_y = []
-            m_z = []
-            if selfobj.Points is not None:
-                for p in linkSubList_convertToOldStyle(selfobj.Points):
-                    # n = eval(p[1].lstrip('Vertex'))
-                    m_n = re.sub('[^0-9]', '', p[1])
-                    m_n = int(m_n)
-                    if M_DEBUG:
-                        print("p " + str(p))
-                        print_msg("m_n = " + str(m_n))
-
-                    m_point = p[0].Shape.Vertexes[m_n - 1].Point
-                    m_points.append(m_point)
-                    m_x.append(m_point.x)
-                    m_y.append(m_point.y)
-                    m_z.append(m_point.z)
-
-                m_np_x = np.asfarray(m_x)
-                m_np_y = np.asfarray(m_y)
-                m_np_z = np.asfarray(m_z)
-                if M_DEBUG:
-                    print_msg(" m_np_x=" + str(m_np_x))
-                    print_msg(" m_np_y=" + str(m_np_y))
-                    print_msg(" m_np_z=" + str(m_np_z))
-
-                m_data = np.concatenate((m_np_x[:, np.newaxis],
-                                         m_np_y[:, np.newaxis],
-                                         m_np_z[:, np.newaxis]),
-                                        axis=1)
-                if M_DEBUG:
-                    print_msg(" m_data=" + str(m_data))
-
-                # Calculate the mean of the points, i.e. the 'center' of the
-                # cloud
-                m_data_mean = m_data.mean(axis=0)
-                axis_eo = Base.Vector(
-                    m_data_mean[0], m_data_mean[1], m_data_mean[2])
-
-                # Do an SVD on the mean-centered data.
-                m_uu, m_dd, m_vv = np.linalg.svd(m_data - m_data_mean)
-                if M_DEBUG:
-                    print_msg(" m_uu=" + str(m_uu))
-                    print_msg(" m_dd=" + str(m_dd))
-                    print_msg(" m_vv=" + str(m_vv))
-
-                # Now vv[0] contains the first principal component, i.e. the direction
-                # vector of the 'best fit' line in the least squares sense.
-                axis_dir = Base.Vector(m_vv[0][0], m_vv[0][1], m_vv[0][2])
-                point1 = axis_eo - axis_dir.normalize().multiply(m_dd[0] / 2.)
-
-                if selfobj.VectorIndex == '1':
-                    point2 = axis_eo + \
-                        axis_dir.normalize().multiply(m_dd[0] / 2.)
-
-                if selfobj.VectorIndex == '2':
-                    axis_dir = Base.Vector(m_vv[1][0], m_vv[1][1], m_vv[1][2])
-                    point1 = axis_eo - \
-                        axis_dir.normalize().multiply(m_dd[0] / 2.)
-                    point2 = axis_eo + \
-                        axis_dir.normalize().multiply(m_dd[1] / 2.)
-                    # point2 = axis_eo + axis_dir
-
-                if selfobj.VectorIndex == '3':
-                    axis_dir = Base.Vector(m_vv[2][0], m_vv[2][1], m_vv[2][2])
-                    point1 = axis_eo - \
-                        axis_dir.normalize().multiply(m_dd[0] / 2.)
-                    point2 = axis_eo + \
-                        axis_dir.normalize().multiply(m_dd[2] / 2.)
-                    # point2 = axis_eo + axis_dir
-
-                line = Part.makeLine(coordVectorPoint(point1),
-                                     coordVectorPoint(point2))
-            if line is not None:
-                selfobj.Shape = line
-                propertiesLine(selfobj.Label, self.color)
-                selfobj.Point1_X = float(point1.x)
-                selfobj.Point1_Y = float(point1.y)
-                selfobj.Point1_Z = float(point1.z)
-                selfobj.Point2_X = float(point2.x)
-                selfobj.Point2_Y = float(point2.y)
-                selfobj.Point2_Z = float(point2.z)
-                # To be compatible with previous version 2018
-                if 'Parametric' in selfobj.PropertiesList:
-                    self.created = True
-        except AttributeError as err:
-            print("AttributeError" + str(err))
-        except Exception as err:
-            printError_msg(err.args[0], title=M_MACRO)
-
-    def onChanged(self, selfobj, prop):
+            return None
+
+        line = None
+        m_points = []
+        m_x = []
+        m_y = []
+        m_z = []
+        if selfobj.Points is not None:
+            for m_vertex in self.linkedShapes(selfobj, 'Points'):
+                m_point = m_vertex.Point
+                m_points.append(m_point)
+                m_x.append(m_point.x)
+                m_y.append(m_point.y)
+                m_z.append(m_point.z)
+
+            m_np_x = np.asfarray(m_x)
+            m_np_y = np.asfarray(m_y)
+            m_np_z = np.asfarray(m_z)
+            if M_DEBUG:
+                print_msg(" m_np_x=" + str(m_np_x))
+                print_msg(" m_np_y=" + str(m_np_y))
+                print_msg(" m_np_z=" + str(m_np_z))
+
+            m_data = np.concatenate((m_np_x[:, np.newaxis],
+                                     m_np_y[:, np.newaxis],
+                                     m_np_z[:, np.newaxis]),
+                                    axis=1)
+            if M_DEBUG:
+                print_msg(" m_data=" + str(m_data))
+
+            # Calculate the mean of the points, i.e. the 'center' of the
+            # cloud
+            m_data_mean = m_data.mean(axis=0)
+            axis_eo = Base.Vector(
+                m_data_mean[0], m_data_mean[1], m_data_mean[2])
+
+            # Do an SVD on the mean-centered data.
+            m_uu, m_dd, m_vv = np.linalg.svd(m_data - m_data_mean)
+            if M_DEBUG:
+                print_msg(" m_uu=" + str(m_uu))
+                print_msg(" m_dd=" + str(m_dd))
+                print_msg(" m_vv=" + str(m_vv))
+
+            # Now vv[0] contains the first principal component, i.e. the direction
+            # vector of the 'best fit' line in the least squares sense.
+            axis_dir = Base.Vector(m_vv[0][0], m_vv[0][1], m_vv[0][2])
+            point1 = axis_eo - axis_dir.normalize().multiply(m_dd[0] / 2.)
+
+            if selfobj.VectorIndex == '1':
+                point2 = axis_eo + \
+                    axis_dir.normalize().multiply(m_dd[0] / 2.)
+
+            if selfobj.VectorIndex == '2':
+                axis_dir = Base.Vector(m_vv[1][0], m_vv[1][1], m_vv[1][2])
+                point1 = axis_eo - \
+                    axis_dir.normalize().multiply(m_dd[0] / 2.)
+                point2 = axis_eo + \
+                    axis_dir.normalize().multiply(m_dd[1] / 2.)
+                # point2 = axis_eo + axis_dir
+
+            if selfobj.VectorIndex == '3':
+                axis_dir = Base.Vector(m_vv[2][0], m_vv[2][1], m_vv[2][2])
+                point1 = axis_eo - \
+                    axis_dir.normalize().multiply(m_dd[0] / 2.)
+                point2 = axis_eo + \
+                    axis_dir.normalize().multiply(m_dd[2] / 2.)
+                # point2 = axis_eo + axis_dir
+
+            line = Part.makeLine(coordVectorPoint(point1),
+                                 coordVectorPoint(point2))
+        if line is None:
+            return None
+        return (line, [point1, point2])
+
+    def changed(self, selfobj, prop):
         """ Run when a proterty change.
         """
         if M_DEBUG:
-            print("running NPointsLine.onChanged !")
+            print("running NPointsLine.changed !")
             print("Change property : " + str(prop))
 
-        WF_Line.onChanged(self, selfobj, prop)
-
         if prop == "Parametric":
             if 'Parametric' in selfobj.PropertiesList:
                 if selfobj.Parametric == 'Not':
@@ -16,7 +16,6 @@ How to
 """
 import sys
 import os.path
-import re
 import FreeCAD as App
 import Part
 from PySide import QtGui, QtCore
@@ -44,8 +43,9 @@ try:
     from WF_selection import getSel
     from WF_print import printError_msg, print_msg, printError_msgWithTimer
     from WF_directory import createFolders, addObjectToGrp, createSubGroup
-    from WF_geometry import meanVectorsPoint, propertiesPoint
-    from WF_utils import linkSubList_convertToOldStyle
+    from WF_geometry import Centroid, propertiesPoint
+    from WF_utils import shapeVersion, isSameVersion
+    from WF_cache import getSubShape, getTopology
     from WF_command import Command
 except ImportError:
     print("ERROR: Cannot load WF modules !")
@@ -143,6 +143,9 @@ def makeNPointsPointFeature(group):
 class NPointsPoint(WF_Point):
     """ The NPointsPoint feature object.
     """
+    properties_list = ['Points']
+    inputs = ['Points']
+    macro = M_MACRO
 
     def __init__(self, selfobj):
         if M_DEBUG:
@@ -163,69 +166,76 @@ class NPointsPoint(WF_Point):
         # from within the class
         # self.Object = selfobj
 
-    def execute(self, selfobj):
-        """ Doing a recomputation.
+    def compute(self, selfobj):
+        """ Return the Shape and the result point(s) of the feature.
         """
-        m_properties_list = ['Points',
-                             ]
-        for m_property in m_properties_list:
-            if m_property not in selfobj.PropertiesList:
-                return
-
         if M_DEBUG:
-            print("running NPointsPoint.execute !")
+            print("running NPointsPoint.compute !")
 
-        # To be compatible with previous version > 2019
-        if 'Parametric' in selfobj.PropertiesList:
-            # Create the object the first time regardless
-            # the parametric behavior
-            if selfobj.Parametric == 'Not' and self.created:
-                return
-            if selfobj.Parametric == 'Interactive' and self.created:
-                return
+        vector_point = None
+        if selfobj.Points is not None:
+            vector_point = self.updateCentroid(
+                self.resolveLinks(selfobj, 'Points'))
 
-        try:
-            vector_point = None
-            if selfobj.Points is not None:
-                m_points = []
-                for p in linkSubList_convertToOldStyle(selfobj.Points):
-                    # n = eval(p[1].lstrip('Vertex'))
-                    m_n = re.sub('[^0-9]', '', p[1])
-                    m_n = int(m_n)
-                    if M_DEBUG:
-                        print("p " + str(p))
-                        print_msg("m_n = " + str(m_n))
-
-                    m_points.append(p[0].Shape.Vertexes[m_n - 1].Point)
-
-            vector_point = meanVectorsPoint(m_points)
-
-            if vector_point is not None:
-                point = Part.Point(vector_point)
-                selfobj.Shape = point.toShape()
-                propertiesPoint(selfobj.Label, self.color)
-                selfobj.X = float(vector_point.x)
-                selfobj.Y = float(vector_point.y)
-                selfobj.Z = float(vector_point.z)
-                # To be compatible with previous version 2018
-                if 'Parametric' in selfobj.PropertiesList:
-                    self.created = True
-        except AttributeError as err:
-            print("AttributeError" + str(err))
-        except Exception as err:
-            printError_msg(err.args[0], title=M_MACRO)
+        if vector_point is None:
+            return None
+        point = Part.Point(vector_point)
+        return (point.toShape(), [vector_point])
 
-    def onChanged(self, selfobj, prop):
+    def updateCentroid(self, references):
+        """ Return the mean point of the linked points given as
+        (object, type, index) references (see resolveLinks).
+
+        The running sum is kept between recomputations :
+        - if the list of links changed, all points are read again;
+        - else only the points of the parents with a new Shape are updated.
+        """
+        m_keys = [(m_obj.Name, m_index) for m_obj, _, m_index in references]
+        m_centroid = getattr(self, '_centroid', None)
+        m_versions = getattr(self, '_versions', {})
+
+        if m_centroid is None or m_centroid.keys() != m_keys:
+            if M_DEBUG:
+                print("NPointsPoint : full update of " + str(len(m_keys)))
+            m_points = []
+            m_versions = {}
+            for m_obj, _, m_n in references:
+                m_points.append(getSubShape(m_obj, "Vertex", m_n).Point)
+                if m_obj.Name not in m_versions:
+                    m_versions[m_obj.Name] = shapeVersion(m_obj)
+            m_centroid = Centroid(m_keys, m_points)
+        else:
+            m_parents = {}
+            for m_index, (m_obj, _, _) in enumerate(references):
+                m_parents.setdefault(m_obj.Name, (m_obj, []))[1].append(m_index)
+            for m_name, (m_parent, m_indexes) in m_parents.items():
+                m_version = shapeVersion(m_parent)
+                if m_name in m_versions and isSameVersion(m_versions[m_name],
+                                                          m_version):
+                    continue
+                if M_DEBUG:
+                    print("NPointsPoint : update of " + str(len(m_indexes)))
+                m_versions[m_name] = m_version
+                m_vertexes = getTopology(m_parent, "Vertex")
+                for m_index in m_indexes:
+                    m_n = references[m_index][2]
+                    m_centroid.update(m_index, m_vertexes[m_n - 1].Point)
+
+        self._centroid = m_centroid
+        self._versions = m_versions
+        return m_centroid.mean()
+
+    def changed(self, selfobj, prop):
         """ Run when a proterty change.
         """
         if M_DEBUG:
-            print("running NPointsPoint.onChanged !")
+            print("running NPointsPoint.changed !")
             print("Change property : " + str(prop))
 
-        WF_Point.onChanged(self, selfobj, prop)
-
         if prop == "Parametric":
-            if 'Parametric' in selfobj.PropertiesList:
+            # No X, Y, Z properties when results are compact
+            if ('Parametric' in selfobj.PropertiesList and
+                    not self.isCompact(selfobj)):
                 if selfobj.Parametric == 'Not':
                     selfobj.setEditorMode("X", 1)
                     selfobj.setEditorMode("Y", 1)
@@ -21,7 +21,6 @@ How to
 """
 import sys
 import os.path
-import re
 import FreeCAD as App
 import Part
 from FreeCAD import Base
@@ -263,6 +262,13 @@ def makeProjectedPointFeature(group):
 class ProjectedPoint(WF_Point):
     """ The ProjectedPoint feature object.
     """
+    properties_list = ['Point',
+                       'Plane',
+                       'At']
+    inputs = ['Point',
+              'Plane',
+              'At']
+    macro = M_MACRO
 
     def __init__(self, selfobj):
         if M_DEBUG:
@@ -300,108 +306,81 @@ class ProjectedPoint(WF_Point):
 
         selfobj.Proxy = self
 
-    def execute(self, selfobj):
-        """ Doing a recomputation.
+    def compute(self, selfobj):
+        """ Return the Shape and the result point(s) of the feature.
         """
-        m_properties_list = ['Point',
-                             "Plane",
-                             "At",
-                             # "Show",
-                             ]
-        for m_property in m_properties_list:
-            if m_property not in selfobj.PropertiesList:
-                return
-
         if M_DEBUG:
-            print("running ProjectedPoint.execute !")
-
-        # To be compatible with previous version > 2019
-        if 'Parametric' in selfobj.PropertiesList:
-            # Create the object the first time regardless
-            # the parametric behavior
-            if selfobj.Parametric == 'Not' and self.created:
-                return
-            if selfobj.Parametric == 'Interactive' and self.created:
-                return
-
-        try:
-            vector_point = None
-            if selfobj.Point is not None:
-                # n = eval(selfobj.Point[1][0].lstrip('Vertex'))
-                m_n = re.sub('[^0-9]', '', selfobj.Point1[1][0])
-                m_n = int(m_n)
-                if M_DEBUG:
-                    print_msg(str(selfobj.Point1))
-                    print_msg("m_n = " + str(m_n))
-
-                point1 = selfobj.Point[0].Shape.Vertexes[m_n - 1].Point
-                x = point1.x
-                y = point1.y
-                z = point1.z
-
-                if selfobj.Plane is None:
-                    # No selected plane so projection on one of MAIN planes
-                    if selfobj.At == "XY plane":
-                        vector_point = Base.Vector(x, y, 0.0)
-                    elif selfobj.At == "YZ plane":
-                        vector_point = Base.Vector(0.0, y, z)
-                    elif selfobj.At == "XZ plane":
-                        vector_point = Base.Vector(x, 0.0, z)
-                    else:
-                        printError_msg(
-                            "Not valid plane option!", title=M_MACRO)
+            print("running ProjectedPoint.compute !")
+
+        vector_point = None
+        if selfobj.Point is not None:
+            if M_DEBUG:
+                print_msg(str(selfobj.Point))
+
+            point1 = self.linkedShape(selfobj, 'Point').Point
+            x = point1.x
+            y = point1.y
+            z = point1.z
+
+            if selfobj.Plane is None:
+                # No selected plane so projection on one of MAIN planes
+                if selfobj.At == "XY plane":
+                    vector_point = Base.Vector(x, y, 0.0)
+                elif selfobj.At == "YZ plane":
+                    vector_point = Base.Vector(0.0, y, z)
+                elif selfobj.At == "XZ plane":
+                    vector_point = Base.Vector(x, 0.0, z)
                 else:
-                    # A selected plane
-                    pass
+                    printError_msg(
+                        "Not valid plane option!", title=M_MACRO)
+            else:
+                # A selected plane
+                pass
 #                     p=App.Vector(1,1,1)
 #                     p.projectToPlane(App.Vector(0,0,0),App.Vector(1,0,1))
 # projectToPlane parameters are (point on plane,normal direction)
 
-            if vector_point is not None:
-                point = Part.Point(vector_point)
-                selfobj.Shape = point.toShape()
-                propertiesPoint(selfobj.Label, self.color)
-                selfobj.X = float(vector_point.x)
-                selfobj.Y = float(vector_point.y)
-                selfobj.Z = float(vector_point.z)
-
-                if M_DEBUG:
-                    print("M_PROJ_LINE = " + str(M_PROJ_LINE))
-                    print("M_NUMBER_SYM_POINTS = " + str(M_NUMBER_SYM_POINTS))
-
-                if M_PROJ_LINE and not self.created:
-                    point_1 = selfobj.Point
-                    object_1 = selfobj
-                    twoPL.buildFromOnePointAndOneObject(point_1,
-                                                        object_1,
-                                                        M_GROUP)
-
-                if M_NUMBER_SYM_POINTS > 0 and not self.created:
-                    for m_i in range(M_NUMBER_SYM_POINTS):
-                        index = m_i + 2
-                        aLP.buildFromTwoPoints(point1,
-                                               vector_point,
-                                               index,
-                                               object_1,
-                                               M_GROUP)
-
-                # To be compatible with previous version 2018
-                if 'Parametric' in selfobj.PropertiesList:
-                    self.created = True
-        except AttributeError as err:
-            print("AttributeError" + str(err))
-        except Exception as err:
-            printError_msg(err.args[0], title=M_MACRO)
+        if vector_point is None:
+            return None
+        point = Part.Point(vector_point)
+        return (point.toShape(), [vector_point])
 
-    def onChanged(self, selfobj, prop):
+    def onComputed(self, selfobj, points):
+        """ Build the projection line and the symmetric points the first
+        time.
+        """
+        if M_DEBUG:
+            print("M_PROJ_LINE = " + str(M_PROJ_LINE))
+            print("M_NUMBER_SYM_POINTS = " + str(M_NUMBER_SYM_POINTS))
+
+        if self.created:
+            return
+
+        object_1 = selfobj
+        if M_PROJ_LINE:
+            point_1 = selfobj.Point
+            twoPL.buildFromOnePointAndOneObject(point_1,
+                                                object_1,
+                                                M_GROUP)
+
+        if M_NUMBER_SYM_POINTS > 0:
+            point1 = self.linkedShape(selfobj, 'Point').Point
+            vector_point = points[0]
+            for m_i in range(M_NUMBER_SYM_POINTS):
+                index = m_i + 2
+                aLP.buildFromTwoPoints(point1,
+                                       vector_point,
+                                       index,
+                                       object_1,
+                                       M_GROUP)
+
+    def changed(self, selfobj, prop):
         """ Run when a proterty change.
         """
         if M_DEBUG:
-            print("running ProjectedPoint.onChanged !")
+            print("running ProjectedPoint.changed !")
             print("Change property : " + str(prop))
 
-        WF_Point.onChanged(self, selfobj, prop)
-
         if prop == "Parametric":
             if 'Parametric' in selfobj.PropertiesList:
                 if selfobj.Parametric == 'Not':
@@ -413,7 +392,7 @@ class ProjectedPoint(WF_Point):
         if prop == "At":
             selfobj.Proxy.execute(selfobj)
         if M_DEBUG:
-            print("running ProjectedPoint.onChanged done!")
+            print("running ProjectedPoint.changed done!")
 
     def addSubobjects(self, selfobj, points_list=[]):
         "adds Line to this ProjectedPoint object"
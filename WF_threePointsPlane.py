@@ -15,7 +15,6 @@ Width and Length of the plane in current units.
 """
 import sys
 import os.path
-import re
 import FreeCAD as App
 import Part
 from PySide import QtCore
@@ -43,7 +42,7 @@ try:
     from WF_selection import getSel
     from WF_print import printError_msg, print_msg, printError_msgWithTimer
     from WF_directory import createFolders, addObjectToGrp, createSubGroup
-    from WF_geometry import isEqualVectors, isColinearVectors, minMaxVectorsLimits, meanVectorsPoint, propertiesPlane
+    from WF_geometry import isEqualVectors, isColinearVectors, filterDegeneratedTriples, minMaxVectorsLimits, meanVectorsPoint, propertiesPlane
     from WF_command import Command
 except ImportError:
     print("ERROR: cannot load WF modules !")
@@ -168,6 +167,15 @@ def makeThreePointsPlaneFeature(group):
 class ThreePointsPlane(WF_Plane):
     """ The ThreePointsPlane feature object.
     """
+    properties_list = ['Point1',
+                       'Point2',
+                       'Point3',
+                       'Extension']
+    inputs = ['Point1',
+              'Point2',
+              'Point3',
+              'Extension']
+    macro = M_MACRO
 
     def __init__(self, selfobj):
         if M_DEBUG:
@@ -203,130 +211,84 @@ class ThreePointsPlane(WF_Plane):
 
         selfobj.Proxy = self
 
-    def execute(self, selfobj):
-        """ Doing a recomputation.
+    def compute(self, selfobj):
+        """ Return the Shape and the result point(s) of the feature.
         """
-        m_properties_list = ['Point1',
-                             'Point2',
-                             'Point3'
-                             ]
-        for m_property in m_properties_list:
-            if m_property not in selfobj.PropertiesList:
-                return
-
         if M_DEBUG:
-            print("running ThreePointsPlane.execute !")
-
-        # To be compatible with previous version > 2019
-        if 'Parametric' in selfobj.PropertiesList:
-            # Create the object the first time regardless
-            # the parametric behavior
-            if selfobj.Parametric == 'Not' and self.created:
-                return
-            if selfobj.Parametric == 'Interactive' and self.created:
-                return
-
-        try:
-            plane = None
-            if selfobj.Point1 is not None and selfobj.Point2 is not None and selfobj.Point3 is not None:
-                # n1 = eval(selfobj.Point1[1][0].lstrip('Vertex'))
-                # n2 = eval(selfobj.Point2[1][0].lstrip('Vertex'))
-                # n3 = eval(selfobj.Point3[1][0].lstrip('Vertex'))
-                m_n1 = re.sub('[^0-9]', '', selfobj.Point1[1][0])
-                m_n2 = re.sub('[^0-9]', '', selfobj.Point2[1][0])
-                m_n3 = re.sub('[^0-9]', '', selfobj.Point3[1][0])
-                m_n1 = int(m_n1)
-                m_n2 = int(m_n2)
-                m_n3 = int(m_n3)
-                if M_DEBUG:
-                    print_msg(str(selfobj.Point1))
-                    print_msg(str(selfobj.Point2))
-                    print_msg(str(selfobj.Point3))
-                    print_msg("m_n1 = " + str(m_n1))
-                    print_msg("m_n2 = " + str(m_n2))
-                    print_msg("m_n3 = " + str(m_n3))
-
-                points = []
-                point_a = selfobj.Point1[0].Shape.Vertexes[m_n1 - 1].Point
-                point_b = selfobj.Point2[0].Shape.Vertexes[m_n2 - 1].Point
-                point_c = selfobj.Point3[0].Shape.Vertexes[m_n3 - 1].Point
-
-                if isEqualVectors(point_a, point_b):
-                    m_msg = """Unable to create Plane from 2 equals Points :
-                    Points 1 and 2 are equals !
-                    """
-                    printError_msg(m_msg, title=M_MACRO)
-                    return
-
-                if isEqualVectors(point_a, point_c):
-                    m_msg = """Unable to create Plane from 2 equals Points :
-                    Points 1 an 3 are equals !
-                    """
-                    printError_msg(m_msg, title=M_MACRO)
-                    return
-
-                if isEqualVectors(point_b, point_c):
-                    m_msg = """Unable to create Plane from 2 equals Points :
-                    Points 2 an 3 are equals !
-                    """
-                    printError_msg(m_msg, title=M_MACRO)
-                    return
-
-                if isColinearVectors(point_a, point_b, point_c):
-                    printError_msg(M_EXCEPTION_MSG, title=M_MACRO)
-                    return
-
-                points.append(point_a)
-                points.append(point_b)
-                points.append(point_c)
-
-                vector_center = meanVectorsPoint(points)
-
-                vector21 = point_b - point_a
-                vector31 = point_c - point_a
-                plane_point = vector_center
-                plane_normal = vector21.cross(vector31)
-
-                edge_length = selfobj.Extension
-                plane = Part.makePlane(edge_length,
-                                       edge_length,
-                                       plane_point,
-                                       plane_normal)
-                plane_center = plane.CenterOfMass
-                plane_translate = plane_point - plane_center
-                plane.translate(plane_translate)
+            print("running ThreePointsPlane.compute !")
+
+        plane = None
+        if selfobj.Point1 is not None and selfobj.Point2 is not None and selfobj.Point3 is not None:
+            if M_DEBUG:
+                print_msg(str(selfobj.Point1))
+                print_msg(str(selfobj.Point2))
+                print_msg(str(selfobj.Point3))
+
+            points = []
+            point_a = self.linkedShape(selfobj, 'Point1').Point
+            point_b = self.linkedShape(selfobj, 'Point2').Point
+            point_c = self.linkedShape(selfobj, 'Point3').Point
+
+            # Tolerance read once for all checks
+            m_tolerance = WF.tolerance()
+            if isEqualVectors(point_a, point_b, m_tolerance):
+                m_msg = """Unable to create Plane from 2 equals Points :
+                Points 1 and 2 are equals !
+                """
+                printError_msg(m_msg, title=M_MACRO)
+                return None
+
+            if isEqualVectors(point_a, point_c, m_tolerance):
+                m_msg = """Unable to create Plane from 2 equals Points :
+                Points 1 an 3 are equals !
+                """
+                printError_msg(m_msg, title=M_MACRO)
+                return None
+
+            if isEqualVectors(point_b, point_c, m_tolerance):
+                m_msg = """Unable to create Plane from 2 equals Points :
+                Points 2 an 3 are equals !
+                """
+                printError_msg(m_msg, title=M_MACRO)
+                return None
+
+            if isColinearVectors(point_a, point_b, point_c, m_tolerance):
+                printError_msg(M_EXCEPTION_MSG, title=M_MACRO)
+                return None
+
+            points.append(point_a)
+            points.append(point_b)
+            points.append(point_c)
+
+            vector_center = meanVectorsPoint(points)
+
+            vector21 = point_b - point_a
+            vector31 = point_c - point_a
+            plane_point = vector_center
+            plane_normal = vector21.cross(vector31)
+
+            edge_length = selfobj.Extension
+            plane = Part.makePlane(edge_length,
+                                   edge_length,
+                                   plane_point,
+                                   plane_normal)
+            plane_center = plane.CenterOfMass
+            plane_translate = plane_point - plane_center
+            plane.translate(plane_translate)
 
 #                 plane = Part.Plane(point_a, point_b, point_c)
 #                 .toShape()
-            if plane is not None:
-                selfobj.Shape = plane
-                propertiesPlane(selfobj.Label, self.color)
-                selfobj.Point1_X = float(point_a.x)
-                selfobj.Point1_Y = float(point_a.y)
-                selfobj.Point1_Z = float(point_a.z)
-                selfobj.Point2_X = float(point_b.x)
-                selfobj.Point2_Y = float(point_b.y)
-                selfobj.Point2_Z = float(point_b.z)
-                selfobj.Point3_X = float(point_c.x)
-                selfobj.Point3_Y = float(point_c.y)
-                selfobj.Point3_Z = float(point_c.z)
-                # To be compatible with previous version 2018
-                if 'Parametric' in selfobj.PropertiesList:
-                    self.created = True
-        except AttributeError as err:
-            print("AttributeError" + str(err))
-        except Exception as err:
-            printError_msg(err.args[0], title=M_MACRO)
+        if plane is None:
+            return None
+        return (plane, [point_a, point_b, point_c])
 
-    def onChanged(self, selfobj, prop):
+    def changed(self, selfobj, prop):
         """ Run when a proterty change.
         """
         if M_DEBUG:
-            print("running ThreePointsPlane.onChanged !")
+            print("running ThreePointsPlane.changed !")
             print("Change property : " + str(prop))
 
-        WF_Plane.onChanged(self, selfobj, prop)
-
         if prop == "Parametric":
             if 'Parametric' in selfobj.PropertiesList:
                 if selfobj.Parametric == 'Not':
@@ -422,6 +384,9 @@ def three_points_plane_command():
 
             # Case of only 3 points
             if number_of_vertexes == 3:
+                # Check the 3 points define a Plane
+                if filterDegeneratedTriples([vertex_list]) == []:
+                    raise Exception(M_EXCEPTION_MSG)
                 buildFromThreePoints(
                     M_MACRO, m_group, vertex_list, M_PLANE_EXT)
             else:
@@ -28,13 +28,12 @@ How to
 - Then Click on the icon
 """
 import sys
-import re
 import FreeCAD as App
 import Part
 from PySide import QtCore
 from WF_config import PATH_WF_ICONS, PATH_WF_UTILS, PATH_WF_UI
 import WF
-from WF_Objects_base import WF_Line
+from WF_Objects_base import WF_Line, WF_LineArray
 
 if App.GuiUp:
     import FreeCADGui as Gui
@@ -56,8 +55,9 @@ try:
     from WF_selection import getSel
     from WF_print import printError_msg, print_msg, printError_msgWithTimer
     from WF_directory import createFolders, addObjectToGrp, createSubGroup
-    from WF_geometry import isEqualVectors, coordVectorPoint, propertiesLine
+    from WF_geometry import isEqualVectors, filterEqualCouples, coordVectorPoint, propertiesLine
     from WF_command import Command
+    from WF_builder import bulkBuild
 except ImportError:
     print("ERROR: cannot load WF modules !")
     sys.exit(1)
@@ -87,6 +87,7 @@ M_TOOL_TIP = """<b>Create Line(s)</b> from at least two selected Points.<br>
 M_MACRO = "Macro TwoPointsLine"
 M_LINE_EXT = 0.0
 M_BYPAIR = False
+M_AS_ARRAY = False
 ###############
 
 
@@ -139,6 +140,29 @@ def isProcessByPair():
     return M_BYPAIR
 
 
+def setAsArray(as_array):
+    """ Set if the Lines from more than 2 Points are created into one
+    single Line array object (WorkWires_P).
+
+    Parameters
+    -------
+    *as_array* : (Boolean, Mandatory)
+    """
+    global M_AS_ARRAY
+    M_AS_ARRAY = bool(as_array)
+
+
+def getAsArray():
+    """ Get if the Lines from more than 2 Points are created into one
+    single Line array object.
+
+    Return
+    -------
+    A Boolean.
+    """
+    return M_AS_ARRAY
+
+
 class TwoPointsLinePanel:
     """ The TwoPointsLinePanel (GUI).
     """
@@ -152,19 +176,27 @@ class TwoPointsLinePanel:
         if M_BYPAIR:
             self.form.UI_Point_by_Pair_checkBox.setCheckState(
                 QtCore.Qt.Checked)
+        self.form.UI_asArray_checkBox.setCheckState(
+            QtCore.Qt.Unchecked)
+        if M_AS_ARRAY:
+            self.form.UI_asArray_checkBox.setCheckState(
+                QtCore.Qt.Checked)
 
     def accept(self):
         """ Run when click on OK button.
         """
         global M_LINE_EXT
         global M_BYPAIR
+        global M_AS_ARRAY
 
         M_LINE_EXT = float(self.form.UI_Line_extension.text())
         M_BYPAIR = self.form.UI_Point_by_Pair_checkBox.isChecked()
+        M_AS_ARRAY = self.form.UI_asArray_checkBox.isChecked()
 
         if WF.verbose():
             print_msg("M_LINE_EXT = " + str(M_LINE_EXT))
             print_msg("M_BYPAIR = " + str(M_BYPAIR))
+            print_msg("M_AS_ARRAY = " + str(M_AS_ARRAY))
 
         Gui.Control.closeDialog()
         m_act_doc = App.activeDocument()
@@ -201,7 +233,8 @@ def makeTwoPointsLineFeatureFromList(selectionset, group):
         if group is not None:
             addObjectToGrp(m_obj, group, info=1)
         TwoPointsLine(m_obj)
-        ViewProviderTwoPointsLine(m_obj.ViewObject)
+        if App.GuiUp:
+            ViewProviderTwoPointsLine(m_obj.ViewObject)
         m_obj.Proxy.addSubobjects(m_obj, selectionset)
     except Exception as err:
         printError_msg("Not able to add an object to Model!")
@@ -226,7 +259,33 @@ def makeTwoPointsLineFeature(group):
         if group is not None:
             addObjectToGrp(m_obj, group, info=1)
         TwoPointsLine(m_obj)
-        ViewProviderTwoPointsLine(m_obj.ViewObject)
+        if App.GuiUp:
+            ViewProviderTwoPointsLine(m_obj.ViewObject)
+    except Exception as err:
+        printError_msg("Not able to add an object to Model!")
+        printError_msg(err.args[0], title=M_MACRO)
+        return None
+
+    return m_obj
+
+
+def makeTwoPointsLineArrayFeature(group):
+    """ Makes a TwoPointsLineArray parametric feature object.
+    into the given Group
+    Returns the new object.
+    """
+    m_name = "TwoPointsLineArray_P"
+    m_part = "Part::FeaturePython"
+
+    if group is None:
+        return None
+    try:
+        m_obj = App.ActiveDocument.addObject(str(m_part), str(m_name))
+        if group is not None:
+            addObjectToGrp(m_obj, group, info=1)
+        TwoPointsLineArray(m_obj)
+        if App.GuiUp:
+            ViewProviderTwoPointsLine(m_obj.ViewObject)
     except Exception as err:
         printError_msg("Not able to add an object to Model!")
         printError_msg(err.args[0], title=M_MACRO)
@@ -235,8 +294,32 @@ def makeTwoPointsLineFeature(group):
     return m_obj
 
 
+def extendedLine(point1, point2, extension):
+    """ Return the ends (start, end) of the Line from point1 to point2
+    with the extension outside the two points.
+    """
+    point_e1 = App.Vector(point2)
+    point_e2 = App.Vector(point1)
+    if extension != 0.0:
+        axis_dir = (point2 - point1).normalize()
+        point_e1 += App.Vector(axis_dir).multiply(extension)
+        if extension >= 0.0:
+            point_e2 -= App.Vector(axis_dir).multiply(extension)
+        else:
+            point_e2 += App.Vector(axis_dir).multiply(extension)
+    return point_e2, point_e1
+
+
 class TwoPointsLine(WF_Line):
     """ The TwoPointsLine feature object. """
+    properties_list = ['Point1',
+                       'Point2',
+                       'Extension']
+    inputs = ['Point1',
+              'Point2',
+              'Extension']
+    macro = M_MACRO
+
     # this method is mandatory
 
     def __init__(self, selfobj):
@@ -269,94 +352,44 @@ Negative number allowed.
 
         selfobj.Proxy = self
 
-    # this method is mandatory
-    def execute(self, selfobj):
-        """ Doing a recomputation.
+    def compute(self, selfobj):
+        """ Return the Shape and the result point(s) of the feature.
         """
-        m_properties_list = ['Point1',
-                             'Point2',
-                             'Extension'
-                             ]
-        for m_property in m_properties_list:
-            if m_property not in selfobj.PropertiesList:
-                return
-
         if M_DEBUG:
-            print("running TwoPointsLine.execute !")
+            print("running TwoPointsLine.compute !")
 
-        # To be compatible with previous version > 2019
-        if 'Parametric' in selfobj.PropertiesList:
-            # Create the object the first time regardless
-            # the parametric behavior
-            if selfobj.Parametric == 'Not' and self.created:
-                return
-            if selfobj.Parametric == 'Interactive' and self.created:
-                return
+        line = None
+        if selfobj.Point1 is not None and selfobj.Point2 is not None:
+            if M_DEBUG:
+                print_msg(str(selfobj.Point1))
+                print_msg(str(selfobj.Point2))
 
-        try:
-            line = None
-            if selfobj.Point1 is not None and selfobj.Point2 is not None:
-                # n1 = eval(selfobj.Point1[1][0].lstrip('Vertex'))
-                # n2 = eval(selfobj.Point2[1][0].lstrip('Vertex'))
-                m_n1 = re.sub('[^0-9]', '', selfobj.Point1[1][0])
-                m_n2 = re.sub('[^0-9]', '', selfobj.Point2[1][0])
-                m_n1 = int(m_n1)
-                m_n2 = int(m_n2)
-                if M_DEBUG:
-                    print_msg(str(selfobj.Point1))
-                    print_msg(str(selfobj.Point2))
-                    print_msg("m_n1 = " + str(m_n1))
-                    print_msg("m_n2 = " + str(m_n2))
-
-                point1 = selfobj.Point1[0].Shape.Vertexes[m_n1 - 1].Point
-                point2 = selfobj.Point2[0].Shape.Vertexes[m_n2 - 1].Point
-
-                if isEqualVectors(point1, point2):
-                    m_msg = """Unable to create Line(s) from 2 Points :
-                    Given Points are equals !
-                    """
-                    printError_msg(m_msg, title=M_MACRO)
-
-                axis_dir = point2 - point1
-                point_e1 = point2
-                point_e2 = point1
-                M_LINE_EXT = selfobj.Extension
-                if M_LINE_EXT != 0.0:
-                    point_e1 += axis_dir.normalize().multiply(M_LINE_EXT)
-                    if M_LINE_EXT >= 0.0:
-                        point_e2 -= axis_dir.normalize().multiply(M_LINE_EXT)
-                    else:
-                        point_e2 += axis_dir.normalize().multiply(M_LINE_EXT)
-
-                line = Part.makeLine(coordVectorPoint(point_e2),
-                                     coordVectorPoint(point_e1))
-
-            if line is not None:
-                selfobj.Shape = line
-                propertiesLine(selfobj.Label, self.color)
-                selfobj.Point1_X = float(point1.x)
-                selfobj.Point1_Y = float(point1.y)
-                selfobj.Point1_Z = float(point1.z)
-                selfobj.Point2_X = float(point2.x)
-                selfobj.Point2_Y = float(point2.y)
-                selfobj.Point2_Z = float(point2.z)
-                # To be compatible with previous version 2018
-                if 'Parametric' in selfobj.PropertiesList:
-                    self.created = True
-        except AttributeError as err:
-            print("AttributeError" + str(err))
-        except Exception as err:
-            printError_msg(err.args[0], title=M_MACRO)
+            point1 = self.linkedShape(selfobj, 'Point1').Point
+            point2 = self.linkedShape(selfobj, 'Point2').Point
+
+            if isEqualVectors(point1, point2):
+                m_msg = """Unable to create Line(s) from 2 Points :
+                Given Points are equals !
+                """
+                printError_msg(m_msg, title=M_MACRO)
+
+            point_e2, point_e1 = extendedLine(point1, point2,
+                                              selfobj.Extension)
 
-    def onChanged(self, selfobj, prop):
+            line = Part.makeLine(coordVectorPoint(point_e2),
+                                 coordVectorPoint(point_e1))
+
+        if line is None:
+            return None
+        return (line, [point1, point2])
+
+    def changed(self, selfobj, prop):
         """ Run when a proterty change.
         """
         if M_DEBUG:
-            print("running TwoPointsLine.onChanged !")
+            print("running TwoPointsLine.changed !")
             print("Change property : " + str(prop))
 
-        WF_Line.onChanged(self, selfobj, prop)
-
         if prop == "Parametric":
             if 'Parametric' in selfobj.PropertiesList:
                 if selfobj.Parametric == 'Not':
@@ -390,6 +423,134 @@ Negative number allowed.
         # self.execute(selfobj)
 
 
+class TwoPointsLineArray(WF_LineArray):
+    """ The TwoPointsLineArray feature object : all the Lines between an
+    ordered list of points into one object.
+    """
+    properties_list = ['Vertexes',
+                       'ByPair',
+                       'Closed',
+                       'Extension']
+    inputs = ['Vertexes',
+              'ByPair',
+              'Closed',
+              'Extension']
+    macro = M_MACRO
+
+    def __init__(self, selfobj):
+        if M_DEBUG:
+            print("running TwoPointsLineArray.__init__ !")
+
+        self.name = "TwoPointsLineArray"
+        WF_LineArray.__init__(self, selfobj, self.name)
+        # Add some custom properties to our feature object.
+        selfobj.addProperty("App::PropertyLinkSubListGlobal",
+                            "Vertexes",
+                            self.name,
+                            "Ordered input points")
+
+        m_tooltip = """If True the points are processed as separated
+pairs (one Line for each 2 points) else as a polyline.
+"""
+        selfobj.addProperty("App::PropertyBool",
+                            "ByPair",
+                            self.name,
+                            m_tooltip).ByPair = False
+
+        m_tooltip = """If True a last Line joins the last point to
+the first one.
+"""
+        selfobj.addProperty("App::PropertyBool",
+                            "Closed",
+                            self.name,
+                            m_tooltip).Closed = False
+
+        m_tooltip = """Extension of each Line outside its two points.
+With an Extension the polyline is a compound of Lines.
+"""
+        selfobj.addProperty("App::PropertyFloat",
+                            "Extension",
+                            self.name,
+                            m_tooltip).Extension = M_LINE_EXT
+
+        selfobj.setEditorMode("Vertexes", 1)
+        selfobj.Proxy = self
+
+    def couples(self, selfobj, points):
+        """ Return the list of (start, end) points of the Lines.
+        Lines with equal ends are skipped.
+        """
+        m_number = len(points)
+        if selfobj.ByPair:
+            m_couples = [(points[i], points[i + 1])
+                         for i in range(0, m_number - 1, 2)]
+            if m_number % 2 == 1 and selfobj.Closed:
+                m_couples.append((points[-1], points[0]))
+        else:
+            m_couples = [(points[i], points[i + 1])
+                         for i in range(m_number - 1)]
+            if selfobj.Closed:
+                m_couples.append((points[-1], points[0]))
+        return [(point1, point2) for point1, point2 in m_couples
+                if not isEqualVectors(point1, point2)]
+
+    def compute(self, selfobj):
+        """ Return the Shape (wire for a polyline, compound of lines
+        for pairs) and the ends of the Lines.
+        """
+        if M_DEBUG:
+            print("running TwoPointsLineArray.compute !")
+
+        m_points = [m_vertex.Point
+                    for m_vertex in self.linkedShapes(selfobj, 'Vertexes')]
+        m_couples = self.couples(selfobj, m_points)
+        if not m_couples:
+            return None
+
+        if selfobj.ByPair:
+            m_results = [m_point for m_couple in m_couples
+                         for m_point in m_couple]
+            return (self.extendedLines(selfobj, m_couples), m_results)
+
+        # Polyline : the couples are chained (Lines with equal ends
+        # skipped), one single wire built in one pass
+        m_results = [m_couples[0][0]] + [point2 for point1, point2 in m_couples]
+        if selfobj.Extension != 0.0:
+            return (self.extendedLines(selfobj, m_couples), m_results)
+        m_shape = Part.makePolygon(m_results)
+        return (m_shape, m_results)
+
+    def extendedLines(self, selfobj, couples):
+        """ Return the compound of the Lines of the couples, each one
+        with the Extension outside its two points.
+        """
+        return Part.makeCompound([Part.makeLine(*extendedLine(point1, point2,
+                                                              selfobj.Extension))
+                                  for point1, point2 in couples])
+
+    def changed(self, selfobj, prop):
+        """ Run when a proterty change.
+        """
+        if M_DEBUG:
+            print("running TwoPointsLineArray.changed !")
+            print("Change property : " + str(prop))
+
+        if prop == "Parametric":
+            if 'Parametric' in selfobj.PropertiesList:
+                if selfobj.Parametric == 'Not':
+                    selfobj.setEditorMode("ByPair", 1)
+                    selfobj.setEditorMode("Closed", 1)
+                    selfobj.setEditorMode("Extension", 1)
+                else:
+                    selfobj.setEditorMode("ByPair", 0)
+                    selfobj.setEditorMode("Closed", 0)
+                    selfobj.setEditorMode("Extension", 0)
+            propertiesLine(selfobj.Label, self.color)
+
+        if prop in ["ByPair", "Closed", "Extension"]:
+            selfobj.Proxy.execute(selfobj)
+
+
 class ViewProviderTwoPointsLine:
     icon = M_ICON_NAME
 
@@ -471,6 +632,20 @@ def buildFromPoints(
     WF.touch(selfobj)
 
 
+def buildArrayFromPoints(builder, group, vertexes, by_pair, closed,
+                         line_ext=0.0):
+    """ Build one TwoPointsLineArray feature object using an ordered list
+    of points.
+    """
+    if WF.verbose():
+        print_msg("vertexes = " + str(vertexes))
+    builder.build(makeTwoPointsLineArrayFeature, group,
+                  Vertexes=vertexes,
+                  ByPair=by_pair,
+                  Closed=closed,
+                  Extension=line_ext)
+
+
 def two_points_line_command():
     """ This command use the selected object(s) to try to build a
     TwoPointsLine feature object.
@@ -485,6 +660,17 @@ def two_points_line_command():
         if number_of_vertexes < 2:
             raise Exception(M_EXCEPTION_MSG)
 
+        # All Lines into one Line array object
+        if M_AS_ARRAY and number_of_vertexes > 2:
+            with bulkBuild(M_MACRO) as m_builder:
+                buildArrayFromPoints(m_builder,
+                                     createFolders("WorkWires_P"),
+                                     vertex_list,
+                                     M_BYPAIR,
+                                     WF.closePolyline(),
+                                     M_LINE_EXT)
+            return
+
         try:
             m_main_dir = "WorkAxis_P"
             m_sub_dir = "Set000"
@@ -494,16 +680,12 @@ def two_points_line_command():
             if number_of_vertexes > 2:
                 m_group = createSubGroup(m_act_doc, m_main_dir, m_sub_dir)
 
+            m_vertexes_list = []
             # Case of only 2 points
             if number_of_vertexes == 2:
                 if WF.verbose():
                     print_msg("Process only 2 points")
-                vertex1 = vertex_list[0]
-                vertex2 = vertex_list[1]
-
-                buildFromPoints(M_MACRO,
-                                m_group,
-                                vertex1, vertex2, M_LINE_EXT)
+                m_vertexes_list.append((vertex_list[0], vertex_list[1]))
 
             # Case of more than 2 points
             else:
@@ -515,49 +697,37 @@ def two_points_line_command():
                         if WF.verbose():
                             print_msg("Even number of points")
                         for i in range(0, number_of_vertexes - 1, 2):
-                            vertex1 = vertex_list[i]
-                            vertex2 = vertex_list[i + 1]
-
-                            buildFromPoints(M_MACRO,
-                                            m_group,
-                                            vertex1, vertex2, M_LINE_EXT)
+                            m_vertexes_list.append((vertex_list[i],
+                                                    vertex_list[i + 1]))
                     # odd
                     else:
                         if WF.verbose():
                             print_msg("Odd number of points")
                         for i in range(0, number_of_vertexes - 2, 2):
-                            vertex1 = vertex_list[i]
-                            vertex2 = vertex_list[i + 1]
-
-                            buildFromPoints(M_MACRO,
-                                            m_group,
-                                            vertex1, vertex2, M_LINE_EXT)
+                            m_vertexes_list.append((vertex_list[i],
+                                                    vertex_list[i + 1]))
 
                         if WF.closePolyline():
-                            vertex1 = vertex_list[-1]
-                            vertex2 = vertex_list[0]
-
-                            buildFromPoints(M_MACRO,
-                                            m_group,
-                                            vertex1, vertex2, M_LINE_EXT)
+                            m_vertexes_list.append((vertex_list[-1],
+                                                    vertex_list[0]))
                 else:
                     if WF.verbose():
                         print_msg("Process points as list")
                     for i in range(number_of_vertexes - 1):
-                        vertex1 = vertex_list[i]
-                        vertex2 = vertex_list[i + 1]
-
-                        buildFromPoints(M_MACRO,
-                                        m_group,
-                                        vertex1, vertex2, M_LINE_EXT)
+                        m_vertexes_list.append((vertex_list[i],
+                                                vertex_list[i + 1]))
 
                     if WF.closePolyline():
-                        vertex1 = vertex_list[-1]
-                        vertex2 = vertex_list[0]
+                        m_vertexes_list.append((vertex_list[-1],
+                                                vertex_list[0]))
+
+            # Check if the points of each couple are not the same
+            m_vertexes_list = filterEqualCouples(m_vertexes_list)
 
-                        buildFromPoints(M_MACRO,
-                                        m_group,
-                                        vertex1, vertex2, M_LINE_EXT)
+            for vertex1, vertex2 in m_vertexes_list:
+                buildFromPoints(M_MACRO,
+                                m_group,
+                                vertex1, vertex2, M_LINE_EXT)
 
         except Exception as err:
             printError_msg(err.args[0], title=M_MACRO)
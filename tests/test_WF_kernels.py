@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the NumPy geometry kernels (Utils/WF_kernels.py).
+
+The kernels are checked against plain Python versions of the scalar
+formulas and, when FreeCAD is available, against the scalar functions of
+WF_geometry working on App.Vector.
+"""
+import os
+import sys
+import math
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "Utils"))
+
+import WF_kernels as kernels  # noqa: E402
+
+
+def scalarAlongTwoPointsPoint(vect_a, vect_b, index, number):
+    """ Same formula as WF_geometry.alongTwoPointsPoint on tuples. """
+    m_u = [m_b - m_a for m_a, m_b in zip(vect_a, vect_b)]
+    m_length = math.sqrt(sum(m_x * m_x for m_x in m_u))
+    m_distance = m_length / 2
+    if number != 0:
+        m_distance = index * (m_length / number)
+    return tuple(m_a + m_x / m_length * m_distance
+                 for m_a, m_x in zip(vect_a, m_u))
+
+
+def scalarProjection(vect_a, vect_b, point_c):
+    """ Same formula as WF_geometry.intersectPerpendicularLine on tuples. """
+    m_u = [m_b - m_a for m_a, m_b in zip(vect_a, vect_b)]
+    m_k = sum(m_x * (m_c - m_a) for m_x, m_a, m_c in zip(m_u, vect_a, point_c))
+    m_k /= sum(m_x * m_x for m_x in m_u)
+    return tuple(m_a + m_k * m_x for m_a, m_x in zip(vect_a, m_u))
+
+
+def scalarLinePlane(vect_a, vect_b, normal, point, tolerance=0.0):
+    """ Same rules as WF_geometry.intersecLinePlane on tuples : first point
+    for a Line in the Plane, None for a parallel Line.
+    """
+    m_u = [m_b - m_a for m_a, m_b in zip(vect_a, vect_b)]
+    m_den = sum(m_n * m_x for m_n, m_x in zip(normal, m_u))
+    m_k = sum(m_n * (m_p - m_a) for m_n, m_p, m_a in zip(normal, point, vect_a))
+    if abs(m_den) <= tolerance:
+        return tuple(vect_a) if abs(m_k) <= tolerance else None
+    m_k /= m_den
+    return tuple(m_a + m_k * m_x for m_a, m_x in zip(vect_a, m_u))
+
+
+LINES = [((0.0, 0.0, 0.0), (10.0, 0.0, 0.0)),
+         ((1.0, 2.0, 3.0), (-4.0, 5.0, 9.0)),
+         ((-3.0, 0.5, 2.0), (-3.0, 0.5, -8.0))]
+
+
+class TestAlongLinePoints():
+
+    @pytest.mark.parametrize("number", [1, 2, 3, 7])
+    def test_same_as_scalar(self, number):
+        m_points = kernels.alongLinePoints(LINES, number)
+        assert m_points.shape == (len(LINES), number + 1, 3)
+        for m_i, (m_a, m_b) in enumerate(LINES):
+            for m_index in range(number + 1):
+                m_expected = scalarAlongTwoPointsPoint(m_a, m_b, m_index, number)
+                np.testing.assert_allclose(m_points[m_i, m_index], m_expected,
+                                           atol=1e-12)
+
+    def test_number_zero_gives_middle(self):
+        m_points = kernels.alongLinePoints(LINES, 0)
+        assert m_points.shape == (len(LINES), 1, 3)
+        for m_i, (m_a, m_b) in enumerate(LINES):
+            m_expected = scalarAlongTwoPointsPoint(m_a, m_b, 1, 0)
+            np.testing.assert_allclose(m_points[m_i, 0], m_expected,
+                                       atol=1e-12)
+
+    def test_lengths(self):
+        m_points = kernels.alongLinePoints(LINES[:1], 2, lengths=[20.0])
+        np.testing.assert_allclose(m_points[0, 2], (20.0, 0.0, 0.0))
+
+    @pytest.mark.parametrize("number", [0, 1, 4])
+    def test_zero_length_edge(self, number):
+        m_lines = [((1.0, 1.0, 1.0), (1.0, 1.0, 1.0))] + LINES[:1]
+        m_points = kernels.alongLinePoints(m_lines, number, lengths=[0.0, 10.0])
+        assert np.isnan(m_points[0]).all()
+        assert not np.isnan(m_points[1]).any()
+
+    def test_tolerance(self):
+        m_lines = [((0.0, 0.0, 0.0), (1e-9, 0.0, 0.0))]
+        assert np.isnan(kernels.alongLinePoints(m_lines, 2, tolerance=1e-7)).all()
+        assert not np.isnan(kernels.alongLinePoints(m_lines, 2)).any()
+
+
+class TestOverlapBoxes():
+
+    def test_overlap(self):
+        m_boxes_a = [(0, 0, 0, 1, 1, 1), (5, 5, 5, 6, 6, 6)]
+        m_boxes_b = [(0.5, 0.5, 0.5, 2, 2, 2), (1, 0, 0, 2, 1, 1),
+                     (1.1, 0, 0, 2, 1, 1)]
+        m_overlap = kernels.overlapBoxes(m_boxes_a, m_boxes_b)
+        assert m_overlap.shape == (2, 3)
+        assert m_overlap.tolist() == [[True, True, False],
+                                      [False, False, False]]
+
+    def test_tolerance(self):
+        m_overlap = kernels.overlapBoxes([(0, 0, 0, 1, 1, 1)],
+                                         [(1.1, 0, 0, 2, 1, 1)],
+                                         tolerance=0.2)
+        assert m_overlap.tolist() == [[True]]
+
+
+class TestSpatialHash():
+
+    def test_insert(self):
+        m_hash = kernels.SpatialHash(1e-6)
+        assert m_hash.insert((0.0, 0.0, 0.0)) == 0
+        assert m_hash.insert((0.0, 0.0, 1e-7)) == 0
+        assert m_hash.insert((0.0, 0.0, 1e-5)) == 1
+        assert len(m_hash) == 2
+
+    def test_across_cells(self):
+        # Coincident points on both sides of a cell boundary
+        m_hash = kernels.SpatialHash(1e-3)
+        assert m_hash.insert((0.9999e-3, 0.0, 0.0)) == 0
+        assert m_hash.insert((1.0001e-3, 0.0, 0.0)) == 0
+        assert m_hash.find((-0.01e-3, 0.0, 0.0)) is None
+
+    def test_same_metric_as_isEqualPoints(self):
+        # Within tolerance on each axis but not in Euclidean distance
+        m_hash = kernels.SpatialHash(1e-3)
+        m_hash.insert((0.0, 0.0, 0.0))
+        m_point = (0.9e-3, 0.9e-3, 0.9e-3)
+        assert kernels.isEqualPoints([(0.0, 0.0, 0.0)], [m_point], 1e-3)[0]
+        assert m_hash.find(m_point) == 0
+        assert m_hash.find((1.1e-3, 0.0, 0.0)) is None
+
+    def test_null_tolerance(self):
+        m_hash = kernels.SpatialHash(0.0)
+        assert m_hash.insert((1.0, 2.0, 3.0)) == 0
+        assert m_hash.insert((1.0, 2.0, 3.0)) == 0
+        assert m_hash.insert((1.0, 2.0, 3.0 + 1e-12)) == 1
+
+    def test_unique_points(self):
+        m_points = [(0, 0, 0), (1, 0, 0), (0, 0, 1e-9), (np.nan, 0, 0)]
+        m_unique = kernels.uniquePoints(m_points, 1e-7)
+        assert m_unique.tolist() == [True, True, False, False]
+
+
+class TestIntersections():
+
+    def test_projections_same_as_scalar(self):
+        m_points = [(3.0, 4.0, 5.0), (-1.0, 0.0, 2.0), (0.0, 0.0, 0.0)]
+        m_a = [m_line[0] for m_line in LINES]
+        m_b = [m_line[1] for m_line in LINES]
+        T, distance, Tprime = kernels.intersectPerpendicularLines(m_a, m_b,
+                                                                   m_points)
+        for m_i in range(len(LINES)):
+            m_expected = scalarProjection(m_a[m_i], m_b[m_i], m_points[m_i])
+            np.testing.assert_allclose(T[m_i], m_expected, atol=1e-12)
+            np.testing.assert_allclose(distance[m_i],
+                                       np.linalg.norm(T[m_i] - m_points[m_i]))
+            np.testing.assert_allclose(Tprime[m_i],
+                                       2 * T[m_i] - m_points[m_i], atol=1e-12)
+
+    def test_projections_onto_one_line(self):
+        m_points = [(3.0, 4.0, 5.0), (-1.0, 0.0, 2.0)]
+        T, _, _ = kernels.intersectPerpendicularLines(LINES[0][0], LINES[0][1],
+                                                      m_points)
+        np.testing.assert_allclose(T, [(3.0, 0.0, 0.0), (-1.0, 0.0, 0.0)])
+
+    def test_projection_zero_length_line(self):
+        T, _, _ = kernels.intersectPerpendicularLines([(1.0, 1.0, 1.0)],
+                                                      [(1.0, 1.0, 1.0)],
+                                                      [(0.0, 0.0, 0.0)])
+        assert np.isnan(T).all()
+
+    def test_lines_planes_same_as_scalar(self):
+        m_normals = [(0.0, 0.0, 1.0), (1.0, 1.0, 0.0)]
+        m_planes = [(0.0, 0.0, 2.0), (1.0, 0.0, 0.0)]
+        m_a = [m_line[0] for m_line in LINES]
+        m_b = [m_line[1] for m_line in LINES]
+        indexes, points = kernels.intersecLinesPlanes(m_a, m_b,
+                                                      m_normals, m_planes)
+        m_found = {(m_i, m_j): m_point
+                   for (m_i, m_j), m_point in zip(indexes.tolist(), points)}
+        for m_i in range(len(LINES)):
+            for m_j in range(len(m_normals)):
+                m_expected = scalarLinePlane(m_a[m_i], m_b[m_i],
+                                             m_normals[m_j], m_planes[m_j])
+                if m_expected is None:
+                    assert (m_i, m_j) not in m_found
+                else:
+                    np.testing.assert_allclose(m_found[(m_i, m_j)],
+                                               m_expected, atol=1e-12)
+
+    def test_parallel_line_plane(self):
+        indexes, points = kernels.intersecLinesPlanes([(0.0, 0.0, 1.0)],
+                                                      [(5.0, 3.0, 1.0)],
+                                                      [(0.0, 0.0, 1.0)],
+                                                      [(0.0, 0.0, 0.0)])
+        assert indexes.shape == (0, 2)
+        assert points.shape == (0, 3)
+
+    @pytest.mark.parametrize("slope", [0.0, 1e-14, 1e-11])
+    def test_near_parallel_line_plane(self, slope):
+        # Parallel within tolerance : rejected as the scalar rule does
+        m_a, m_b = (0.0, 0.0, 1.0), (10.0, 0.0, 1.0 + slope)
+        m_expected = scalarLinePlane(m_a, m_b, (0.0, 0.0, 1.0),
+                                     (0.0, 0.0, 0.0), 1e-12)
+        indexes, points = kernels.intersecLinesPlanes([m_a], [m_b],
+                                                      [(0.0, 0.0, 1.0)],
+                                                      [(0.0, 0.0, 0.0)],
+                                                      tolerance=1e-12)
+        if m_expected is None:
+            assert slope < 1e-12
+            assert indexes.shape == (0, 2)
+        else:
+            assert slope > 1e-12
+            np.testing.assert_allclose(points, [m_expected])
+
+    def test_line_in_plane(self):
+        # Line in the Plane within tolerance : its first point
+        m_a, m_b = (1.0, 2.0, 1e-13), (10.0, 0.0, 0.0)
+        indexes, points = kernels.intersecLinesPlanes([m_a], [m_b],
+                                                      [(0.0, 0.0, 1.0)],
+                                                      [(0.0, 0.0, 0.0)],
+                                                      tolerance=1e-12)
+        assert indexes.tolist() == [[0, 0]]
+        np.testing.assert_allclose(points, [m_a])
+        assert scalarLinePlane(m_a, m_b, (0.0, 0.0, 1.0), (0.0, 0.0, 0.0),
+                               1e-12) == m_a
+
+    def test_zero_length_line(self):
+        indexes, _ = kernels.intersecLinesPlanes([(1.0, 1.0, 1.0)],
+                                                 [(1.0, 1.0, 1.0)],
+                                                 [(0.0, 0.0, 1.0)],
+                                                 [(0.0, 0.0, 0.0)])
+        assert indexes.shape == (0, 2)
+
+    def test_culling(self):
+        # Line crossing the plane z = 0 at (5, 5, 0) : only the face whose
+        # box contains the point is kept
+        m_boxes = [(0, 0, 0, 10, 10, 0), (20, 20, 0, 30, 30, 0)]
+        indexes, points = kernels.intersecLinesPlanes([(5.0, 5.0, 1.0)],
+                                                      [(5.0, 5.0, -1.0)],
+                                                      [(0.0, 0.0, 1.0)] * 2,
+                                                      [(0.0, 0.0, 0.0)] * 2,
+                                                      m_boxes)
+        assert indexes.tolist() == [[0, 0]]
+        np.testing.assert_allclose(points, [(5.0, 5.0, 0.0)])
+
+
+class TestScalarFunctions():
+    """ Compare with the App.Vector functions of WF_geometry. """
+
+    @pytest.fixture(autouse=True)
+    def geometry(self):
+        App = pytest.importorskip("FreeCAD")
+        import WF_geometry
+        self.App = App
+        self.geometry = WF_geometry
+
+    def test_along_two_points(self):
+        m_points = kernels.alongLinePoints(LINES, 3)
+        for m_i, (m_a, m_b) in enumerate(LINES):
+            for m_index in range(4):
+                m_vector = self.geometry.alongTwoPointsPoint(self.App.Vector(*m_a),
+                                                             self.App.Vector(*m_b),
+                                                             m_index, 3)
+                np.testing.assert_allclose(m_points[m_i, m_index],
+                                           tuple(m_vector), atol=1e-9)
+
+    def test_projection(self):
+        m_a, m_b = LINES[1]
+        m_c = (3.0, 4.0, 5.0)
+        T, _, _ = kernels.intersectPerpendicularLines([m_a], [m_b], [m_c])
+        m_vector, _, _ = self.geometry.intersectPerpendicularLine(
+            self.App.Vector(*m_a), self.App.Vector(*m_b), self.App.Vector(*m_c))
+        np.testing.assert_allclose(T[0], tuple(m_vector), atol=1e-9)
+
+    @pytest.mark.parametrize("vect_b", [(10.0, 0.0, 0.0), (10.0, 0.0, 1.0),
+                                        (10.0, 0.0, 1.0 + 1e-14),
+                                        (10.0, 0.0, -1.0)])
+    def test_line_plane(self, vect_b):
+        import WF
+        m_a = (0.0, 0.0, 1.0)
+        m_args = ([m_a], [vect_b], [(0.0, 0.0, 1.0)], [(0.0, 0.0, 0.0)])
+        _, m_points = kernels.intersecLinesPlanes(*m_args,
+                                                  tolerance=WF.tolerance())
+        m_vector = self.geometry.intersecLinePlane(self.App.Vector(*m_a),
+                                                   self.App.Vector(*vect_b),
+                                                   self.App.Vector(0, 0, 1),
+                                                   self.App.Vector(0, 0, 0))
+        if m_vector is None:
+            assert len(m_points) == 0
+        else:
+            np.testing.assert_allclose(m_points[0], tuple(m_vector), atol=1e-9)
+
+    def test_equal_colinear(self):
+        V = self.App.Vector
+        for m_a, m_b in LINES:
+            m_c = tuple(2.0 * m_y - m_x for m_x, m_y in zip(m_a, m_b))
+            for m_points in ((m_a, m_a), (m_a, m_b)):
+                assert self.geometry.isEqualVectors(
+                    *[V(*m_p) for m_p in m_points], tolerance=1e-9) == \
+                    kernels.isEqualPoints([m_points[0]], [m_points[1]],
+                                          1e-9)[0]
+            for m_third in (m_c, (m_c[0] + 1.0, m_c[1], m_c[2] - 1.0)):
+                assert self.geometry.isColinearVectors(
+                    V(*m_a), V(*m_b), V(*m_third), tolerance=1e-9) == \
+                    kernels.isColinearPoints([m_a], [m_b], [m_third],
+                                             1e-9)[0]
+
+    def test_along_two_points_middle_and_outside(self):
+        m_a, m_b = LINES[1]
+        m_middle = kernels.alongLinePoints([LINES[1]], 0)[0, 0]
+        m_vector = self.geometry.alongTwoPointsPoint(self.App.Vector(*m_a),
+                                                     self.App.Vector(*m_b),
+                                                     2, 0)
+        np.testing.assert_allclose(m_middle, tuple(m_vector), atol=1e-9)
+        # index past number goes on along the Line
+        m_vector = self.geometry.alongTwoPointsPoint(self.App.Vector(*m_a),
+                                                     self.App.Vector(*m_b),
+                                                     4, 2)
+        np.testing.assert_allclose(
+            tuple(2.0 * m_y - m_x for m_x, m_y in zip(m_a, m_b)),
+            tuple(m_vector), atol=1e-9)
+        assert self.geometry.alongTwoPointsPoint(self.App.Vector(*m_a),
+                                                 self.App.Vector(*m_a),
+                                                 1, 2) is None
+
+    def test_projection_equal_ends(self):
+        m_a, _ = LINES[1]
+        assert self.geometry.intersectPerpendicularLine(
+            self.App.Vector(*m_a), self.App.Vector(*m_a),
+            self.App.Vector(3.0, 4.0, 5.0)) is None
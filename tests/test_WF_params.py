@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the cached WF parameters (WF.py) : a preference changed outside
+of WF.setParam (ie: from the Preferences dialog) must be seen by the
+cached accessors.
+Needs FreeCAD.
+"""
+import os
+import sys
+import pytest
+
+App = pytest.importorskip("FreeCAD")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import WF  # noqa: E402
+
+
+@pytest.fixture
+def params():
+    """ A parameter group of its own (as the Preferences dialog uses),
+    the WF values are restored at the end.
+    """
+    m_grp = App.ParamGet(WF.M_PARAM_PATH)
+    m_saved = {m_param: WF.getParam(m_param) for m_param in WF.M_PARAM_READERS}
+    yield m_grp
+    for m_param, m_value in m_saved.items():
+        WF.setParam(m_param, m_value)
+
+
+def test_observer_attached():
+    assert WF.attachParamObserver()
+    assert WF.M_PARAM_GRP is not None
+
+
+def test_tolerance_changed_outside(params):
+    WF.tolerance()
+    params.SetString("tolerance", "1e-5")
+    assert WF.tolerance() == 1e-5
+    params.SetString("tolerance", "1e-7")
+    assert WF.tolerance() == 1e-7
+
+
+def test_cached_accessors_changed_outside(params):
+    for m_value in (True, False):
+        WF.verbose()
+        WF.compactResults()
+        WF.closePolyline()
+        params.SetBool("verbose", m_value)
+        params.SetBool("compactResults", m_value)
+        params.SetBool("closePolyline", m_value)
+        assert WF.verbose() == m_value
+        assert WF.compactResults() == m_value
+        assert WF.closePolyline() == m_value
+    WF.pointSize()
+    params.SetString("pointSize", "7.0")
+    assert WF.pointSize() == 7.0